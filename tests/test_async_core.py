@@ -4,7 +4,13 @@ import asyncio
 
 import pytest
 
-from trustchain import AsyncTrustChain, AsyncTrustChainSession, SignedResponse
+from trustchain import (
+    AsyncTrustChain,
+    AsyncTrustChainSession,
+    SignedResponse,
+    TrustChainConfig,
+)
+from trustchain.utils.exceptions import NonceReplayError
 
 
 class TestAsyncTrustChain:
@@ -77,6 +83,22 @@ class TestAsyncTrustChain:
             assert result.data == 42
             assert result.tool_id == "async_tool"
 
+    @pytest.mark.asyncio
+    async def test_tool_decorator_sync(self):
+        """Test tool decorator runs sync functions in the executor."""
+        async with AsyncTrustChain() as tc:
+
+            @tc.tool("sync_tool")
+            def sync_function(x: int, scale: int = 2) -> int:
+                return x * scale
+
+            positional = await sync_function(21)
+            keyword = await sync_function(7, scale=3)
+
+            assert positional.data == 42
+            assert keyword.data == 21
+            assert positional.tool_id == keyword.tool_id == "sync_tool"
+
     @pytest.mark.asyncio
     async def test_chain_of_trust(self):
         """Test building a chain with parent signatures."""
@@ -114,6 +136,28 @@ class TestAsyncTrustChain:
             is_valid = await tc.verify_chain([step1, step2, step3])
             assert is_valid is False
 
+    @pytest.mark.asyncio
+    async def test_verify_chain_without_nonces(self):
+        """Test batched chain verification when nonces are disabled."""
+        async with AsyncTrustChain(TrustChainConfig(enable_nonce=False)) as tc:
+            step1 = await tc.sign("a", {"v": 1})
+            step2 = await tc.sign("b", {"v": 2}, parent_signature=step1.signature)
+            tampered = SignedResponse(**{**step2.to_dict(), "data": {"v": 3}})
+
+            assert await tc.verify_chain([step1, step2]) is True
+            assert await tc.verify_chain([step1, step2]) is True
+            assert await tc.verify_chain([step1, tampered]) is False
+
+    @pytest.mark.asyncio
+    async def test_verify_chain_broken_link_consumes_no_nonces(self):
+        """Test a broken chain is rejected before any nonce is used."""
+        async with AsyncTrustChain() as tc:
+            step1 = await tc.sign("a", {})
+            step2 = await tc.sign("b", {})  # No parent link!
+
+            assert await tc.verify_chain([step1, step2]) is False
+            assert await tc.verify(step1) is True
+
     @pytest.mark.asyncio
     async def test_concurrent_signing(self):
         """Test concurrent async signing."""
@@ -128,6 +172,33 @@ class TestAsyncTrustChain:
                 assert result.tool_id == f"tool_{i}"
                 assert result.data == {"index": i}
 
+    @pytest.mark.asyncio
+    async def test_concurrent_signing_unique_nonces(self):
+        """Test concurrent signs get distinct random nonces."""
+        async with AsyncTrustChain() as tc:
+            results = await asyncio.gather(*(tc.sign("t", {}) for _ in range(300)))
+
+            nonces = {r.nonce for r in results}
+            assert len(nonces) == 300
+            assert all(len(n) == 36 for n in nonces)
+
+    @pytest.mark.asyncio
+    async def test_memory_backends_skip_thread_hop(self, monkeypatch):
+        """Test in-memory storage and nonce checks run on the event loop."""
+
+        async def no_threads(*args, **kwargs):
+            raise AssertionError("unexpected asyncio.to_thread call")
+
+        monkeypatch.setattr(asyncio, "to_thread", no_threads)
+
+        async with AsyncTrustChain() as tc:
+            result = await tc.sign("tool", {"v": 1})
+
+            assert tc._storage.get(result.signature) == result.to_dict()
+            assert await tc.verify(result) is True
+            with pytest.raises(NonceReplayError):
+                await tc.verify(result)
+
 
 class TestAsyncTrustChainSession:
     """Test async session functionality."""
@@ -187,6 +258,18 @@ class TestAsyncTrustChainSession:
                 assert result.metadata.get("session_id") == "meta-test"
                 assert result.metadata.get("user") == "alice"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrent", [False, True])
+    async def test_session_concurrent_signs_stay_linked(self, concurrent):
+        """Test concurrent session signs still form one unbroken chain."""
+        async with AsyncTrustChain() as tc:
+            async with tc.session("gather", concurrent=concurrent) as session:
+                await asyncio.gather(*(session.sign(f"s{i}", {}) for i in range(20)))
+
+                chain = session.get_chain()
+                assert len(chain) == 20
+                assert await session.verify_chain()
+
 
 class TestAsyncKeys:
     """Test key operations."""
@@ -79,6 +79,21 @@ class TestToolCertificate:
         )
         assert cert.is_valid is False
 
+    def test_expiry_follows_expires_at_changes(self):
+        cert = ToolCertificate(
+            tool_name="tool",
+            tool_module="mod",
+            expires_at="2999-01-01T00:00:00+00:00",
+        )
+        assert cert.is_valid is True
+
+        cert.expires_at = "2020-01-01T00:00:00"  # naive: read as UTC
+        assert cert.is_valid is False
+
+        cert.expires_at = "not-a-date"
+        assert cert.is_valid is True
+        assert "_expiry_src" not in cert.to_dict()
+
     def test_to_dict_and_from_dict(self):
         cert = ToolCertificate(
             tool_name="test",
@@ -92,6 +107,22 @@ class TestToolCertificate:
         assert cert2.owner == "Alice"
         assert cert2.code_hash == "hash123"
 
+    def test_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+
+        cert = ToolCertificate(
+            tool_name="test",
+            tool_module="mod",
+            permissions=["read"],
+            expires_at="2999-01-01T00:00:00+00:00",
+        )
+        assert cert.is_valid is True
+
+        d = cert.to_dict()
+        assert list(d.items()) == list(asdict(cert).items())
+        d["permissions"].append("write")
+        assert cert.permissions == ["read"]
+
     def test_fingerprint(self):
         cert = ToolCertificate(
             tool_name="t",
@@ -120,6 +151,26 @@ class TestToolRegistry:
         assert len(registry.violations) == 1
         assert registry.violations[0]["type"] == "NO_CERTIFICATE"
 
+    def test_last_violation_and_cap(self, tmp_dir, monkeypatch):
+        from trustchain.v2 import certificate
+
+        monkeypatch.setattr(certificate, "_MAX_VIOLATIONS", 3)
+        registry = ToolRegistry(registry_dir=tmp_dir)
+        assert registry.last_violation() is None
+
+        registry.certify(sample_tool)
+        registry.revoke(sample_tool)
+        for _ in range(4):
+            registry.verify(another_tool)
+        registry.verify(sample_tool)
+
+        assert registry.last_violation()["type"] == "REVOKED"
+        assert [v["type"] for v in registry.violations] == [
+            "NO_CERTIFICATE",
+            "NO_CERTIFICATE",
+            "REVOKED",
+        ]
+
     def test_revoke_certificate(self, tmp_dir):
         registry = ToolRegistry(registry_dir=tmp_dir)
         registry.certify(sample_tool)
@@ -213,6 +264,7 @@ class TestTrustchainCertifiedDecorator:
         wrapped = trustchain_certified(registry)(sample_tool)
         assert wrapped.__name__ == "sample_tool"
         assert wrapped._trustchain_certified is True
+        assert wrapped._trustchain_key == f"{__name__}.sample_tool"
 
 
 class TestCodeTamperingDetection:
@@ -242,3 +294,41 @@ class TestCodeTamperingDetection:
         tamper_violations = [v for v in violations if v["type"] == "CODE_TAMPERED"]
         assert len(tamper_violations) == 1
         assert "hash mismatch" in tamper_violations[0]["detail"]
+
+    def test_verify_hashes_source_once(self, tmp_dir, monkeypatch):
+        """Repeated verification reuses the code hash of an unchanged function."""
+        from trustchain.v2 import certificate
+
+        registry = ToolRegistry(registry_dir=tmp_dir)
+
+        def my_tool(x):
+            return x + 1
+
+        registry.certify(my_tool)
+
+        calls = []
+        original = certificate.compute_code_hash
+        monkeypatch.setattr(
+            certificate,
+            "compute_code_hash",
+            lambda func: calls.append(func) or original(func),
+        )
+
+        assert all(registry.verify(my_tool) for _ in range(5))
+        assert calls == [my_tool]
+
+    def test_detect_replaced_code_object(self, tmp_dir):
+        """Swapping __code__ on a verified function is still detected."""
+        registry = ToolRegistry(registry_dir=tmp_dir)
+
+        def my_tool(x):
+            return x + 1
+
+        def payload(x):
+            return x + 1000
+
+        registry.certify(my_tool)
+        assert registry.verify(my_tool) is True
+
+        my_tool.__code__ = payload.__code__
+        assert registry.verify(my_tool) is False
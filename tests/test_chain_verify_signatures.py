@@ -105,3 +105,44 @@ def test_chain_verify_detects_reparenting(tmp_path):
     result = tc2.chain.verify(public_key=pk)
     assert result["valid"] is False
     assert any(b.get("error") == "invalid_signature" for b in result["broken_links"])
+
+
+def test_chain_verify_process_pool_matches_serial(tmp_path, monkeypatch):
+    from trustchain.v2 import chain_store
+
+    tc = _file_tc(tmp_path)
+    for i in range(6):
+        tc.sign("tool_a", {"i": i})
+    pk = tc.export_public_key()
+
+    objs = sorted(glob.glob(os.path.join(str(tmp_path), "objects", "*.json")))
+    envelope = json.loads(open(objs[4]).read())
+    envelope["value"]["data"] = {"i": 999}
+    with open(objs[4], "w") as f:
+        json.dump(envelope, f)
+
+    tc2 = _file_tc(tmp_path)
+    monkeypatch.setattr(chain_store, "_PARALLEL_VERIFY_MIN_OPS", 2)
+    serial = tc2.chain.verify(public_key=pk)
+    pooled = tc2.chain.verify(public_key=pk, workers=3)
+
+    assert pooled["signatures_verified"] == serial["signatures_verified"] == 5
+    assert pooled["broken_links"] == serial["broken_links"]
+    assert [b["index"] for b in pooled["broken_links"]] == [4]
+
+
+def test_chain_verify_is_serial_by_default(tmp_path, monkeypatch):
+    from trustchain.v2 import chain_store
+
+    tc = _file_tc(tmp_path)
+    for i in range(3):
+        tc.sign("tool_a", {"i": i})
+    pk = tc.export_public_key()
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("verify() must not start a process pool")
+
+    monkeypatch.setattr(chain_store, "_PARALLEL_VERIFY_MIN_OPS", 2)
+    monkeypatch.setattr(chain_store, "ProcessPoolExecutor", no_pool)
+    result = _file_tc(tmp_path).chain.verify(public_key=pk)
+    assert result["signatures_verified"] == 3
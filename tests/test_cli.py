@@ -212,6 +212,46 @@ class TestLogGraph:
         assert "b" in lines[0]
 
 
+class TestPlainOutput:
+    """log / blame / show write raw text when stdout is not a terminal."""
+
+    def _chain(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert runner.invoke(app, ["init", "-o", "."]).exit_code == 0
+        from trustchain import TrustChain, TrustChainConfig
+
+        tc = TrustChain(
+            TrustChainConfig(
+                enable_chain=True,
+                chain_storage="file",
+                chain_dir=".trustchain",
+            )
+        )
+        tc.sign("bash_tool", {"cmd": "ls [x]"})
+
+    def test_plain_blame_show_and_log(self, tmp_path, monkeypatch):
+        self._chain(tmp_path, monkeypatch)
+
+        blame = runner.invoke(app, ["blame", "bash_tool", "-d", ".trustchain"])
+        assert blame.exit_code == 0
+        row = blame.stdout.splitlines()[-1].split("\t")
+        assert row[0] == "op_0001"
+        assert row[-1] == '{"cmd": "ls [x]"}'
+
+        show = runner.invoke(app, ["show", "op_0001", "-d", ".trustchain"])
+        assert json.loads(show.stdout)["data"] == {"cmd": "ls [x]"}
+
+        log = runner.invoke(app, ["log", "-v", "-d", ".trustchain"])
+        assert 'data: {"cmd": "ls [x]"}' in log.stdout
+
+    def test_tc_plain_0_keeps_rich_layout(self, tmp_path, monkeypatch):
+        self._chain(tmp_path, monkeypatch)
+        monkeypatch.setenv("TC_PLAIN", "0")
+
+        show = runner.invoke(app, ["show", "op_0001", "-d", ".trustchain"])
+        assert "tc show op_0001" in show.stdout
+
+
 class TestCheckpointBranchRefs:
     """checkpoint / branch / refs CLI (git-like refs under .trustchain)."""
 
@@ -554,3 +594,70 @@ class TestAnchor:
         )
         assert verified.exit_code == 2
         assert "Anchor MISMATCH" in verified.stdout
+
+
+class TestVerifyProof:
+    """tc verify-proof — single-op Merkle inclusion check."""
+
+    @pytest.mark.parametrize("scheme", [None, "rfc6962"])
+    def test_verify_proof_valid_and_tampered(self, tmp_path, scheme):
+        from trustchain.v2.verifiable_log import VerifiableChainStore
+
+        store = VerifiableChainStore(str(tmp_path / "log"), merkle_scheme=scheme)
+        ops = [
+            store.append(tool=f"tool{i}", data={"i": i}, signature=f"sig{i}")
+            for i in range(5)
+        ]
+        proof = store.inclusion_proof(ops[2]["id"]).to_dict()
+        proof_file = tmp_path / "proof.json"
+        proof_file.write_text(json.dumps(proof), encoding="utf-8")
+        record_file = tmp_path / "op.json"
+        record = store.show(ops[2]["id"])
+        record_file.write_text(json.dumps(record), encoding="utf-8")
+
+        ok = runner.invoke(
+            app,
+            [
+                "verify-proof",
+                str(proof_file),
+                "-r",
+                str(record_file),
+                "--root",
+                proof["root"],
+            ],
+        )
+        assert ok.exit_code == 0, ok.stdout
+        assert "Proof VALID" in ok.stdout
+
+        wrong_root = runner.invoke(
+            app,
+            [
+                "verify-proof",
+                str(proof_file),
+                "-r",
+                str(record_file),
+                "--root",
+                "00" * 32,
+            ],
+        )
+        assert wrong_root.exit_code == 1
+
+        record["data"] = {"i": 99}
+        record_file.write_text(json.dumps(record), encoding="utf-8")
+        tampered = runner.invoke(
+            app, ["verify-proof", str(proof_file), "-r", str(record_file)]
+        )
+        assert tampered.exit_code == 1
+        assert "Proof INVALID" in tampered.stdout
+
+    def test_verify_proof_rejects_non_object_json(self, tmp_path):
+        proof_file = tmp_path / "proof.json"
+        proof_file.write_text("[]", encoding="utf-8")
+        record_file = tmp_path / "op.json"
+        record_file.write_text("{}", encoding="utf-8")
+
+        result = runner.invoke(
+            app, ["verify-proof", str(proof_file), "-r", str(record_file)]
+        )
+        assert result.exit_code == 2
+        assert "Malformed proof" in result.stdout
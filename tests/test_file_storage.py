@@ -9,7 +9,7 @@ import pytest
 
 from trustchain import TrustChain, TrustChainConfig
 from trustchain.v2.chain_store import ChainStore
-from trustchain.v2.storage import FileStorage, MemoryStorage
+from trustchain.v2.storage import FileStorage, MemoryStorage, PackedStorage
 
 
 @pytest.fixture
@@ -202,6 +202,144 @@ class TestChainStore:
         assert len(blame) == 2
         assert all(op["tool"] == "bash_tool" for op in blame)
 
+    def test_export_json_stream_matches_export_json(self, tmp_dir):
+        cs = ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir)
+        out = Path(tmp_dir) / "export.json"
+
+        assert cs.export_json_stream(str(out)) == 0
+        assert json.loads(out.read_text())["chain"] == []
+
+        cs.commit(
+            tool="t", data={"x": [1, {"y": "z\nw"}]}, signature="A", signature_id="s1"
+        )
+        cs.commit(
+            tool="u", data={}, signature="B", signature_id="s2", parent_signature="A"
+        )
+        assert cs.export_json_stream(str(out)) == 2
+
+        def without_timestamp(text):
+            return text.rsplit('"exported_at"', 1)[0]
+
+        assert without_timestamp(out.read_text()) == without_timestamp(cs.export_json())
+
+    def test_batch_defers_head_and_refs(self, tmp_dir):
+        cs = ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir)
+        head = Path(tmp_dir) / "HEAD"
+        with cs.batch():
+            cs.commit(
+                tool="t", data={}, signature="A", signature_id="s1", session_id="task"
+            )
+            cs.commit(
+                tool="t",
+                data={},
+                signature="B",
+                signature_id="s2",
+                parent_signature="A",
+                session_id="task",
+            )
+            assert cs.head() == "B"
+            assert not head.exists()
+
+        assert head.read_text() == "B"
+        assert cs.session_head("task") == "B"
+        assert ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir).length == 2
+
+    def test_blame_uses_tool_index(self, tmp_dir):
+        fs = FileStorage(tmp_dir)
+        cs = ChainStore(fs, root_dir=tmp_dir)
+        for i, tool in enumerate(["bash", "view", "bash", "view"]):
+            cs.commit(tool=tool, data={"i": i}, signature=f"S{i}", signature_id=f"s{i}")
+
+        assert [op["id"] for op in cs.blame("bash")] == ["op_0001", "op_0003"]
+        # blame/status only read the chain dir; the index is explicit.
+        assert not (Path(tmp_dir) / "refs" / "tools").exists()
+
+        assert cs.update_tool_index() == 4
+        idx = Path(tmp_dir) / "refs" / "tools" / "bash.idx"
+        assert idx.read_text().split() == ["op_0001", "op_0003"]
+
+        # After the fingerprint check (op_0001, op_0004) only the op committed
+        # since the index update is read, then only the two hits are fetched.
+        cs.commit(tool="bash", data={"i": 4}, signature="S4", signature_id="s4")
+        reads = []
+        get = fs.get
+        fs.get = lambda key: reads.append(key) or get(key)
+        newest = cs.blame("bash", limit=2, newest_first=True)
+        assert [op["id"] for op in newest] == ["op_0005", "op_0003"]
+        assert reads == ["op_0001", "op_0004", "op_0005", "op_0005", "op_0003"]
+        assert idx.read_text().split() == ["op_0001", "op_0003"]
+
+    def test_tool_index_rebuilt_after_storage_clear(self, tmp_dir):
+        cs = ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir)
+        for i in range(3):
+            cs.commit(tool="old", data={}, signature=f"O{i}", signature_id=f"o{i}")
+        cs.update_tool_index()
+
+        FileStorage(tmp_dir).clear()
+        cs = ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir)
+        for i in range(2):
+            cs.commit(tool="new", data={}, signature=f"N{i}", signature_id=f"n{i}")
+
+        assert [op["id"] for op in cs.blame("new")] == ["op_0001", "op_0002"]
+        assert cs.blame("old") == []
+
+        cs.commit(tool="new", data={}, signature="N2", signature_id="n2")
+        assert cs.update_tool_index() == 3
+        tools_dir = Path(tmp_dir) / "refs" / "tools"
+        assert not (tools_dir / "old.idx").exists()
+        assert (tools_dir / "new.idx").read_text().split() == [
+            "op_0001",
+            "op_0002",
+            "op_0003",
+        ]
+        assert cs.blame("old") == []
+
+    def test_log_skips_missing_middle_op(self, tmp_dir):
+        cs = ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir)
+        for i in range(3):
+            cs.commit(tool=f"t{i}", data={}, signature=f"S{i}", signature_id=f"s{i}")
+        (Path(tmp_dir) / "objects" / "op_0002.json").unlink()
+
+        cs = ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir)
+        assert [op["id"] for op in cs.log()] == ["op_0001", "op_0003"]
+        assert [op["id"] for op in cs.log_reverse()] == ["op_0003", "op_0001"]
+        status = cs.status()
+        assert status["length"] == 2
+        assert status["tools"] == {"t0": 1, "t2": 1}
+
+        # New ops are numbered after the highest id, not over op_0003.
+        cs.commit(tool="t3", data={}, signature="S3", signature_id="s3")
+        assert [op["id"] for op in cs.log()] == ["op_0001", "op_0003", "op_0004"]
+
+    def test_iter_log_reverse_reads_lazily(self, tmp_dir):
+        fs = FileStorage(tmp_dir)
+        cs = ChainStore(fs, root_dir=tmp_dir)
+        parent = None
+        for i in range(5):
+            cs.commit(
+                tool="t",
+                data={"i": i},
+                signature=f"S{i}",
+                signature_id=f"s{i}",
+                parent_signature=parent,
+            )
+            parent = f"S{i}"
+
+        reads = []
+        get = fs.get
+        fs.get = lambda key: reads.append(key) or get(key)
+
+        it = cs.iter_log_reverse()
+        assert [next(it)["id"], next(it)["id"]] == ["op_0005", "op_0004"]
+        assert reads == ["op_0005", "op_0004"]
+        assert [op["id"] for op in cs.log_reverse(limit=10)] == [
+            "op_0005",
+            "op_0004",
+            "op_0003",
+            "op_0002",
+            "op_0001",
+        ]
+
     def test_status(self, tmp_dir):
         fs = FileStorage(tmp_dir)
         cs = ChainStore(fs, root_dir=tmp_dir)
@@ -221,6 +359,38 @@ class TestChainStore:
         assert "t1" in status["tools"]
         assert status["avg_latency_ms"] == 150.0
 
+    def test_status_updates_cached_totals_incrementally(self, tmp_dir):
+        fs = FileStorage(tmp_dir)
+        cs = ChainStore(fs, root_dir=tmp_dir)
+        cs.commit(tool="t1", data={}, signature="A", signature_id="s1", latency_ms=10)
+        assert cs.status()["tools"] == {"t1": 1}
+        cs.update_tool_index()
+
+        cs.commit(tool="t1", data={}, signature="B", signature_id="s2", latency_ms=30)
+        reads = []
+        get = fs.get
+        fs.get = lambda key: reads.append(key) or get(key)
+        status = cs.status()
+        assert reads == ["op_0001", "op_0002"]
+        assert status["length"] == 2
+        assert status["tools"] == {"t1": 2}
+        assert status["avg_latency_ms"] == 20.0
+
+    def test_status_ignores_stale_cached_totals(self, tmp_dir):
+        cs = ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir)
+        for i in range(3):
+            cs.commit(tool="old", data={}, signature=f"O{i}", signature_id=f"o{i}")
+        cs.update_tool_index()
+
+        FileStorage(tmp_dir).clear()
+        cs = ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir)
+        for i in range(2):
+            cs.commit(tool="new", data={}, signature=f"N{i}", signature_id=f"n{i}")
+
+        status = cs.status()
+        assert status["length"] == cs.length == 2
+        assert status["tools"] == {"new": 2}
+
     def test_diff(self, tmp_dir):
         fs = FileStorage(tmp_dir)
         cs = ChainStore(fs, root_dir=tmp_dir)
@@ -381,3 +551,77 @@ class TestTrustChainWithFileStorage:
         )
         tc.sign("t1", {"a": 1})
         assert tc.chain.length == 0
+
+
+class TestPackedStorage:
+    """Tests for PackedStorage (mmap-backed objects.pack)."""
+
+    def test_pack_moves_loose_objects_and_keeps_reads(self, tmp_dir):
+        ps = PackedStorage(tmp_dir)
+        for i in range(1, 4):
+            ps.store(f"op_{i:04d}", {"id": f"op_{i:04d}", "n": i})
+
+        assert ps.pack() == 3
+        assert list(Path(tmp_dir, "objects").glob("*.json")) == []
+        assert PackedStorage.has_pack(tmp_dir)
+
+        ps.store("op_0004", {"id": "op_0004", "n": 4})  # new writes stay loose
+        reopened = PackedStorage(tmp_dir)
+        assert reopened.get("op_0002") == {"id": "op_0002", "n": 2}
+        assert reopened.get("op_0004")["n"] == 4
+        assert reopened.size() == 4
+        assert [v["n"] for v in reopened.list_all()] == [1, 2, 3, 4]
+
+        reopened.delete("op_0001")
+        assert PackedStorage(tmp_dir).get("op_0001") is None
+
+    def test_store_after_pack_supersedes_packed_copy(self, tmp_dir):
+        ps = PackedStorage(tmp_dir)
+        ps.store("k", {"a": 1})
+        ps.pack()
+        ps.store("k", {"a": 2})
+
+        assert ps.get("k") == {"a": 2}
+        assert PackedStorage(tmp_dir).get("k") == {"a": 2}
+
+    def test_open_storages_see_records_packed_by_another_instance(self, tmp_dir):
+        loose_reader = FileStorage(tmp_dir)
+        packed_reader = PackedStorage(tmp_dir)
+        packed_reader.store("op_0001", {"n": 1})
+        assert loose_reader.get("op_0001") == {"n": 1}
+        assert packed_reader.get("op_0001") == {"n": 1}
+
+        assert PackedStorage(tmp_dir).pack() == 1
+        assert not (Path(tmp_dir) / "objects" / "op_0001.json").exists()
+        assert loose_reader.get("op_0001") == {"n": 1}
+        assert packed_reader.get("op_0001") == {"n": 1}
+
+        # A second pack grows objects.pack past the existing mapping.
+        packed_reader.store("op_0002", {"n": 2})
+        assert PackedStorage(tmp_dir).pack() == 1
+        assert packed_reader.get("op_0002") == {"n": 2}
+        assert loose_reader.get("op_0002") == {"n": 2}
+
+    def test_chain_store_over_pack(self, tmp_dir):
+        cs = ChainStore(FileStorage(tmp_dir), root_dir=tmp_dir)
+        cs.commit(tool="a", data={}, signature="A", signature_id="s1")
+        cs.commit(
+            tool="b", data={}, signature="B", signature_id="s2", parent_signature="A"
+        )
+        PackedStorage(tmp_dir).pack()
+
+        packed = ChainStore(PackedStorage(tmp_dir), root_dir=tmp_dir)
+        assert packed.length == 2
+        assert [op["tool"] for op in packed.log_reverse()] == ["b", "a"]
+        assert packed.verify()["valid"] is True
+
+    def test_trustchain_appends_after_packed_ops(self, tmp_dir):
+        cfg = TrustChainConfig(
+            enable_chain=True, chain_storage="file", chain_dir=tmp_dir
+        )
+        TrustChain(cfg).sign("a", {"n": 1})
+        PackedStorage(tmp_dir).pack()
+
+        tc = TrustChain(cfg)
+        tc.sign("b", {"n": 2})
+        assert [op["id"] for op in tc.chain.log()] == ["op_0001", "op_0002"]
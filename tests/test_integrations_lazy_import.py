@@ -38,3 +38,56 @@ def test_lazy_langchain_export_still_works():
     else:
         assert to_langchain_tool is not None
         assert "langchain_core" in sys.modules
+
+
+def test_import_trustchain_defers_optional_exports():
+    import subprocess
+
+    code = (
+        "import sys, trustchain\n"
+        "assert 'trustchain.integrations' not in sys.modules\n"
+        "assert 'trustchain.kms' not in sys.modules\n"
+        "assert trustchain.OnaiDocsTrustClient is not None\n"
+        "assert 'trustchain.integrations.onaidocs' in sys.modules\n"
+        "assert trustchain.LocalFileKeyProvider.__module__ == 'trustchain.kms'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_integrations_probes_no_adapter():
+    import subprocess
+
+    code = (
+        "import sys, trustchain.integrations as ti\n"
+        "adapters = ('fastapi', 'flask', 'django', 'mcp', 'opentelemetry', 'pydantic_v2')\n"
+        "assert not [a for a in adapters if 'trustchain.integrations.' + a in sys.modules]\n"
+        "assert ti.TrustChainFlask is None or 'trustchain.integrations.flask' in sys.modules\n"
+        "assert 'TrustChainModel' in dir(ti)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_trustchain_defers_postgres_driver():
+    import subprocess
+
+    code = (
+        "import sys, trustchain\n"
+        "assert 'psycopg' not in sys.modules\n"
+        "from trustchain.v2 import PostgresVerifiableChainStore\n"
+        "assert PostgresVerifiableChainStore.__module__.endswith('pg_verifiable_log')\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_trustchain_defers_v2_extras():
+    import subprocess
+
+    code = (
+        "import sys, trustchain\n"
+        "extras = ('async_core', 'certificate', 'session', 'tenants', 'tsa', 'verifier')\n"
+        "assert not [m for m in extras if 'trustchain.v2.' + m in sys.modules]\n"
+        "assert trustchain.AsyncTrustChain.__module__ == 'trustchain.v2.async_core'\n"
+        "from trustchain.v2 import TSAClient, ToolRegistry\n"
+        "assert 'TenantManager' in dir(trustchain.v2)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
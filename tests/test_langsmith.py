@@ -19,7 +19,7 @@ except ImportError:
 
 pytestmark = pytest.mark.skipif(not HAS_LANGCHAIN, reason="LangChain not installed")
 
-from trustchain.integrations.langsmith import TrustChainCallbackHandler
+from trustchain.integrations.langsmith import TrustChainCallbackHandler, _truncated_str
 
 
 class TestTrustChainCallbackHandler:
@@ -258,6 +258,30 @@ class TestChainLinking:
 
         assert handler._has_linked_chain() is True
 
+    def test_verify_chain_batch(self):
+        """Test batch verification accepts the chain and spots tampering."""
+        handler = TrustChainCallbackHandler()
+
+        handler._sign("a", {"x": 1})
+        handler._sign("b", {"x": 2})
+        assert handler.verify_chain_batch() is True
+
+        object.__setattr__(handler._chain[1], "data", {"x": 3})
+        assert handler.verify_chain_batch() is False
+
+    def test_clear_chain_restarts_links(self):
+        """Test the first event after clear_chain has no parent."""
+        handler = TrustChainCallbackHandler()
+
+        handler._sign("a", {})
+        handler.clear_chain()
+        handler._sign("b", {})
+        handler._sign("c", {})
+
+        chain = handler.get_signed_chain()
+        assert chain[0].parent_signature is None
+        assert handler._has_linked_chain() is True
+
     def test_chain_stats(self):
         """Test chain statistics."""
         handler = TrustChainCallbackHandler()
@@ -319,3 +343,58 @@ class TestConfiguration:
         chain = handler.get_signed_chain()
         assert chain[0].data["user"] == "alice"
         assert chain[0].data["session"] == "123"
+
+
+def _self_referencing_list():
+    value = [1]
+    value.append(value)
+    return value
+
+
+def _indirectly_self_referencing_list():
+    value = [1]
+    value.append([value])
+    return value
+
+
+def _self_referencing_dict():
+    value = {"a": 1}
+    value["self"] = value
+    return value
+
+
+class TestTruncatedOutput:
+    """Test tool output truncation matches str(output)[:1000]."""
+
+    @pytest.mark.parametrize(
+        "output",
+        [
+            "x" * 5000,
+            42,
+            None,
+            [],
+            (),
+            ("only",),
+            {},
+            ["doc"] * 5000,
+            [{"page": i, "text": "lorem " * 20} for i in range(500)],
+            tuple(range(3000)),
+            {f"k{i}": [i] * 10 for i in range(2000)},
+            {"short": "dict"},
+            _self_referencing_list(),
+            _indirectly_self_referencing_list(),
+            _self_referencing_dict(),
+            ["literal ... text"],
+        ],
+    )
+    def test_matches_str_prefix(self, output):
+        assert _truncated_str(output) == str(output)[:1000]
+
+    def test_tool_end_records_truncated_output(self):
+        handler = TrustChainCallbackHandler()
+        run_id = uuid.uuid4()
+
+        handler.on_tool_end(output=["chunk"] * 10000, run_id=run_id)
+
+        data = handler.get_signed_chain()[0].data["data"]
+        assert data["output"] == str(["chunk"] * 10000)[:1000]
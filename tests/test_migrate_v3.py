@@ -159,3 +159,25 @@ def test_migrate_v3_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None
     r1 = runner.invoke(app, ["migrate-v3", "-d", ".trustchain", "--apply"])
     assert r1.exit_code == 0
     assert (tmp_path / ".trustchain" / "v3" / "migration_state.json").is_file()
+
+
+def test_migrate_v3_after_pack(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    assert runner.invoke(app, ["init", "-o", "."]).exit_code == 0
+    from trustchain import TrustChain, TrustChainConfig
+
+    tc = TrustChain(
+        TrustChainConfig(
+            enable_chain=True,
+            chain_storage="file",
+            chain_dir=".trustchain",
+        )
+    )
+    for tool in ("a", "b", "c"):
+        tc.sign(tool, {})
+    assert runner.invoke(app, ["pack", "-d", ".trustchain"]).exit_code == 0
+
+    report, _ = migrate_v2_linear_to_v3(tmp_path / ".trustchain", apply=False)
+    assert report["v2_ops"] == 3
+    assert report["commits"] == 3
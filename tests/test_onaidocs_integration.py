@@ -4,3 +4,119 @@ from trustchain.integrations.onaidocs import OnaiDocsTrustClient
 def test_onaidocs_client_create():
     client = OnaiDocsTrustClient("http://localhost:9323")
     assert client.base_url == "http://localhost:9323"
+
+
+def test_onaidocs_client_api_root_strips_trailing_slash():
+    client = OnaiDocsTrustClient("http://localhost:9323/")
+    assert client._api_root == "http://localhost:9323/api/trustchain"
+    assert client == OnaiDocsTrustClient("http://localhost:9323/")
+
+
+def test_onaidocs_client_reuses_one_connection(monkeypatch):
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    peers = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, body):
+            peers.append(self.client_address)
+            raw = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def do_GET(self):
+            self._reply({"path": self.path})
+
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            self._reply(json.loads(self.rfile.read(length)))
+
+        def log_message(self, *args):
+            pass
+
+    monkeypatch.delenv("http_proxy", raising=False)
+    monkeypatch.delenv("HTTP_PROXY", raising=False)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = OnaiDocsTrustClient(f"http://127.0.0.1:{server.server_port}/")
+        events = client.get_events(limit=5)
+        verified = client.verify_response("tool", {"a": 1}, {"sig": "x"})
+        client.close()
+        again = client.get_events()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert events == {"path": "/api/trustchain/events?limit=5"}
+    assert verified["name"] == "tool"
+    assert again == {"path": "/api/trustchain/events?limit=100"}
+    assert peers[0] == peers[1] != peers[2]
+
+
+def test_onaidocs_client_unreachable_host_raises_url_error(monkeypatch):
+    import socket
+    import urllib.error
+
+    import pytest
+
+    monkeypatch.delenv("http_proxy", raising=False)
+    monkeypatch.delenv("HTTP_PROXY", raising=False)
+    with socket.socket() as sock:  # bound but not listening: refuses connects
+        sock.bind(("127.0.0.1", 0))
+        client = OnaiDocsTrustClient(f"http://127.0.0.1:{sock.getsockname()[1]}")
+        with pytest.raises(urllib.error.URLError):
+            client.get_events()
+
+
+def test_onaidocs_client_follows_redirects(monkeypatch):
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if self.path.startswith("/api/trustchain/"):
+                self.send_response(302)
+                self.send_header("Location", "/moved" + self.path)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            raw = json.dumps({"path": self.path}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def log_message(self, *args):
+            pass
+
+    monkeypatch.delenv("http_proxy", raising=False)
+    monkeypatch.delenv("HTTP_PROXY", raising=False)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = OnaiDocsTrustClient(f"http://127.0.0.1:{server.server_port}")
+        events = client.get_events(limit=5)
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert events == {"path": "/moved/api/trustchain/events?limit=5"}
+
+
+def test_onaidocs_client_rejects_non_http_base_url():
+    import pytest
+
+    with pytest.raises(ValueError, match="http or https"):
+        OnaiDocsTrustClient("file:///etc/passwd")
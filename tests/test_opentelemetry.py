@@ -1,5 +1,7 @@
 """Tests for OpenTelemetry integration."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
 try:
@@ -63,6 +65,56 @@ class TestTrustChainSpanProcessor:
         processor = TrustChainSpanProcessor()
         processor.shutdown()  # Should not raise
 
+    def test_processor_skips_replayed_span(self, otel_provider):
+        """Test a span delivered twice is signed once."""
+        provider, exporter = otel_provider
+        with provider.get_tracer("test").start_as_current_span("tool"):
+            pass
+        span = exporter.get_finished_spans()[0]
+
+        signer = MagicMock()
+        processor = TrustChainSpanProcessor(signer=signer, dedupe_window=1)
+        processor.on_end(span)
+        processor.on_end(span)
+        assert signer.sign.call_count == 1
+
+        with provider.get_tracer("test").start_as_current_span("other"):
+            pass
+        processor.on_end(exporter.get_finished_spans()[1])
+        processor.on_end(span)  # evicted from the window, signed again
+        assert signer.sign.call_count == 3
+
+    def test_processor_without_consumer_skips_signing(self, otel_provider):
+        """Test the default processor does no throwaway signing."""
+        provider, exporter = otel_provider
+        with provider.get_tracer("test").start_as_current_span("tool"):
+            pass
+        span = exporter.get_finished_spans()[0]
+
+        processor = TrustChainSpanProcessor()
+        processor._signer = MagicMock()
+        processor.on_end(span)
+        processor._signer.sign.assert_not_called()
+
+        signed = []
+        TrustChainSpanProcessor(on_signed=signed.append).on_end(span)
+        assert len(signed) == 1
+        assert signed[0].tool_id == "otel:span:tool"
+
+    def test_processor_signs_hex_ids(self, otel_provider):
+        """Test span ids are signed as fixed-width lowercase hex."""
+        provider, exporter = otel_provider
+        with provider.get_tracer("test").start_as_current_span("tool"):
+            pass
+        span = exporter.get_finished_spans()[0]
+
+        signer = MagicMock()
+        TrustChainSpanProcessor(signer=signer).on_end(span)
+
+        data = signer.sign.call_args.kwargs["data"]
+        assert data["trace_id"] == format(span.context.trace_id, "032x")
+        assert data["span_id"] == format(span.context.span_id, "016x")
+
 
 class TestInstrumentSpan:
     """Test instrument_span helper."""
@@ -104,6 +156,16 @@ class TestInstrumentSpan:
 
         assert "trustchain.parent_signature" in attrs
 
+    def test_instrument_span_skips_unsampled_span(self):
+        """Test non-recording spans are not written to."""
+        span = MagicMock()
+        span.is_recording.return_value = False
+
+        instrument_span(span, TrustChain()._signer.sign("tool", {}))
+
+        span.set_attributes.assert_not_called()
+        span.set_attribute.assert_not_called()
+
 
 class TestSetAttributes:
     """Test set_trustchain_span_attributes helper."""
@@ -208,6 +270,42 @@ class TestTrustChainInstrumentor:
         finally:
             instrumentor.uninstrument()
 
+    def test_wrapped_sign_sets_current_span(self, otel_provider):
+        """Test the wrapper makes its span current and ends it."""
+        provider, exporter = otel_provider
+        instrumentor = TrustChainInstrumentor()
+        instrumentor._tracer = provider.get_tracer("test")
+        signer = TrustChain()._signer
+        current = []
+
+        def original(self_tc, tool_id, data, **kwargs):
+            current.append(trace.get_current_span())
+            return signer.sign(tool_id, data)
+
+        result = instrumentor._wrap_sign(original)(None, "tool", {"v": 1})
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "trustchain.sign.tool"
+        assert current[0].get_span_context().span_id == span.context.span_id
+        assert span.attributes[ATTR_TRUSTCHAIN_SIGNATURE] == result.signature
+        assert trace.get_current_span() is not current[0]
+
+    def test_wrapped_sign_records_exception_once(self, otel_provider):
+        """Test a failing sign marks the span as an error with one event."""
+        provider, exporter = otel_provider
+        instrumentor = TrustChainInstrumentor()
+        instrumentor._tracer = provider.get_tracer("test")
+
+        def original(self_tc, tool_id, data, **kwargs):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            instrumentor._wrap_sign(original)(None, "tool", {})
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status.status_code.name == "ERROR"
+        assert [e.name for e in span.events] == ["exception"]
+
 
 class TestCreateTracedTrustchain:
     """Test create_traced_trustchain factory."""
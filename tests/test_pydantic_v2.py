@@ -67,6 +67,20 @@ class TestTrustChainModel:
         # Verification should fail because data changed
         assert result.verify() is False
 
+    def test_signing_state_survives_copy(self):
+        """Test signature fields live in Pydantic's private store."""
+
+        class Result(TrustChainModel):
+            value: int
+
+        result = Result(value=1)
+        clone = result.model_copy()
+
+        assert clone.signature == result.signature
+        assert clone.signature_id == result.signature_id
+        assert clone.timestamp == result.timestamp
+        assert clone.verify() is True
+
     def test_signature_id(self):
         """Test signature ID is unique."""
 
@@ -187,6 +201,15 @@ class TestSignedDict:
 
         assert data.verify() is False
 
+    def test_signed_dict_response_is_a_snapshot(self):
+        """Test to_signed_response copies the data."""
+        data = SignedDict({"value": 100})
+        response = data.to_signed_response()
+        data["value"] = 999
+
+        assert type(response.data) is dict
+        assert response.data == {"value": 100}
+
     def test_signed_dict_to_response(self):
         """Test SignedDict to SignedResponse conversion."""
         from trustchain import SignedResponse
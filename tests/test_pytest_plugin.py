@@ -10,6 +10,7 @@ from trustchain.pytest_plugin.fixtures import (
     async_tc,
     signed_chain,
     tc,
+    tc_session,
 )
 
 
@@ -32,6 +33,26 @@ class TestTcFixture:
         assert tc._signer.verify(result) is True
 
 
+# Instances seen by the first TestTcSessionFixture test, checked by the next.
+_first_instances: dict = {}
+
+
+class TestTcSessionFixture:
+    """Test tc_session fixture."""
+
+    def test_tc_session_fixture_exists(self, tc_session, tc):
+        """Test tc_session fixture provides TrustChain."""
+        assert isinstance(tc_session, TrustChain)
+        _first_instances.update(tc_session=tc_session, tc=tc)
+
+    def test_tc_session_is_shared(self, tc_session, tc):
+        """Test tc_session is reused by later tests, unlike tc."""
+        if not _first_instances:
+            pytest.skip("needs test_tc_session_fixture_exists to run first")
+        assert _first_instances["tc_session"] is tc_session
+        assert _first_instances["tc"] is not tc
+
+
 class TestSignedChainCollector:
     """Test SignedChainCollector."""
 
@@ -67,6 +88,17 @@ class TestSignedChainCollector:
 
         assert collector.verify_all(tc) is True
 
+    def test_verify_all_detects_tampering(self):
+        """Test verify_all fails if any response was altered."""
+        collector = SignedChainCollector()
+        tc = TrustChain()
+
+        good = tc._signer.sign("a", {"v": 1})
+        collector.append(good)
+        collector.append(SignedResponse(**{**good.to_dict(), "data": {"v": 2}}))
+
+        assert collector.verify_all(tc) is False
+
     def test_get_tool_ids(self):
         """Test getting tool IDs from chain."""
         collector = SignedChainCollector()
@@ -148,3 +180,73 @@ class TestAsyncTcFixture:
         is_valid = await async_tc.verify(result)
 
         assert is_valid is True
+
+
+class TestTrustChainPlugin:
+    """Test TrustChainPlugin internals."""
+
+    def test_verified_checks_each_response_once(self, monkeypatch):
+        """Test signature checks are memoized per response."""
+        from trustchain.pytest_plugin.plugin import TrustChainPlugin
+
+        plugin = TrustChainPlugin(config=None)
+        good = plugin.tc._signer.sign("a", {"v": 1})
+        tampered = SignedResponse(**{**good.to_dict(), "data": {"v": 2}})
+
+        calls = []
+        verify = plugin.tc._signer.verify
+        monkeypatch.setattr(
+            plugin.tc._signer, "verify", lambda r: calls.append(r) or verify(r)
+        )
+
+        assert plugin._verified(good) is True
+        assert plugin._verified(good) is True
+        assert plugin._verified(tampered) is False
+        assert len(calls) == 2
+
+    def test_verified_many_batches_uncached(self, monkeypatch):
+        """Test report verification batches only responses not seen yet."""
+        from trustchain.pytest_plugin.plugin import TrustChainPlugin
+
+        plugin = TrustChainPlugin(config=None)
+        first = plugin.tc._signer.sign("a", {"v": 1})
+        second = plugin.tc._signer.sign("b", {"v": 2})
+        tampered = SignedResponse(**{**second.to_dict(), "data": {"v": 3}})
+        assert plugin._verified(first) is True
+
+        batches = []
+        verify_batch = plugin.tc._signer.verify_batch
+        monkeypatch.setattr(
+            plugin.tc._signer,
+            "verify_batch",
+            lambda rs: batches.append(rs) or verify_batch(rs),
+        )
+
+        assert plugin._verified_many([first, second, tampered]) == [
+            True,
+            True,
+            False,
+        ]
+        assert batches == [[second, tampered]]
+
+    @pytest.mark.parametrize(
+        "options, registered",
+        [
+            ({"trustchain_report": None, "trustchain_strict": False}, False),
+            ({"trustchain_report": "report.html", "trustchain_strict": False}, True),
+            ({"trustchain_report": None, "trustchain_strict": True}, True),
+        ],
+    )
+    def test_plugin_registered_only_when_opted_in(self, options, registered):
+        """Test hooks are registered only with --trustchain-report/--strict."""
+        from unittest.mock import MagicMock
+
+        from trustchain.pytest_plugin.plugin import pytest_configure
+
+        config = MagicMock()
+        config.getoption.side_effect = options.__getitem__
+
+        pytest_configure(config)
+
+        assert config.pluginmanager.register.called is registered
+        assert config.addinivalue_line.call_count == 2
@@ -122,6 +122,25 @@ class TestTrustChainSession:
         finally:
             os.unlink(filepath)
 
+    def test_session_write_json_matches_export(self):
+        """Test streamed JSON file is identical to export_json()."""
+        tc = TrustChain()
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            filepath = f.name
+
+        try:
+            with tc.session("stream_export") as session:
+                session.sign("step1", {"data": "test"})
+                session.sign("step2", {"data": ["ü", None, 1.5]})
+
+            session.write_json(filepath)
+
+            with open(filepath, encoding="utf-8") as f:
+                assert f.read() == session.export_json()
+        finally:
+            os.unlink(filepath)
+
     def test_session_export_html(self):
         """Test exporting session as HTML."""
         tc = TrustChain(TrustChainConfig(enable_nonce=False))
@@ -136,7 +155,45 @@ class TestTrustChainSession:
 
             assert "TrustChain Session" in html
             assert "html_export" in html
-            assert os.path.exists(filepath)
+            with open(filepath, encoding="utf-8") as f:
+                assert f.read() == html
+        finally:
+            os.unlink(filepath)
+
+    def test_session_export_html_with_nonces(self):
+        """Test the HTML report does not trip replay protection."""
+        tc = TrustChain()
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
+            filepath = f.name
+
+        try:
+            with tc.session("nonce_export") as session:
+                session.sign("step1", {"data": 1})
+                session.sign("step2", {"data": 2})
+                html = session.export_html(filepath)
+
+            assert "✅ Yes" in html
+            assert html.count("❌") == 0
+        finally:
+            os.unlink(filepath)
+
+    def test_session_export_html_escapes_content(self):
+        """Test session id, tool ids and data are HTML-escaped."""
+        tc = TrustChain(TrustChainConfig(enable_nonce=False))
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".html", delete=False) as f:
+            filepath = f.name
+
+        try:
+            with tc.session("<b>run</b>") as session:
+                session.sign("<img src=x>", {"note": "<script>alert('x')</script>"})
+                html = session.export_html(filepath)
+
+            assert "<script>" not in html
+            assert "<img" not in html
+            assert "&lt;b&gt;run&lt;/b&gt;" in html
+            assert "&lt;script&gt;alert(&#x27;x&#x27;)&lt;/script&gt;" in html
         finally:
             os.unlink(filepath)
 
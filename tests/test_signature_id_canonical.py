@@ -1,6 +1,7 @@
 """signature_id is bound into Ed25519 payload (with legacy verify fallback)."""
 
 import json
+import uuid
 
 from trustchain.v2.signer import Signer, _build_canonical_data
 
@@ -25,3 +26,46 @@ def test_tampered_signature_id_fails_verify():
     resp = signer.sign("tool-a", {"x": 1})
     object.__setattr__(resp, "signature_id", "00000000-0000-0000-0000-000000000099")
     assert signer.verify(resp) is False
+
+
+def test_signature_ids_and_nonces_are_unique_uuid4():
+    signer = Signer()
+    seen = set()
+    for _ in range(600):  # spans several pool refills
+        resp = signer.sign("tool-a", {"x": 1})
+        for value in (resp.signature_id, resp.nonce):
+            parsed = uuid.UUID(value)
+            assert parsed.version == 4
+            assert str(parsed) == value
+            seen.add(value)
+    assert len(seen) == 1200
+
+
+def test_verify_batch_process_pool_matches_serial(monkeypatch):
+    from trustchain.v2 import signer as signer_mod
+
+    signer = Signer()
+    responses = [signer.sign("tool-a", {"i": i}) for i in range(6)]
+    object.__setattr__(responses[3], "data", {"i": 999})
+
+    monkeypatch.setattr(signer_mod, "_PARALLEL_VERIFY_MIN", 2)
+    serial = signer.verify_batch(responses)
+    pooled = signer.verify_batch(responses, workers=3)
+
+    assert serial == pooled == [True, True, True, False, True, True]
+
+
+def test_verify_batch_is_serial_by_default(monkeypatch):
+    import concurrent.futures
+
+    from trustchain.v2 import signer as signer_mod
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("verify_batch() must not start a process pool")
+
+    signer = Signer()
+    responses = [signer.sign("tool-a", {"i": i}) for i in range(3)]
+    monkeypatch.setattr(signer_mod, "_PARALLEL_VERIFY_MIN", 2)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+
+    assert signer.verify_batch(responses) == [True, True, True]
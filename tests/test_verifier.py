@@ -138,6 +138,23 @@ class TestVerifierWithDifferentKeys:
 
         assert result.valid is True
 
+    def test_same_key_parsed_once(self):
+        """Verifiers for one public key share the parsed key object."""
+        tc = TrustChain()
+        public_key = tc.export_public_key()
+
+        first = TrustChainVerifier(public_key)
+        second = TrustChainVerifier(public_key)
+
+        assert first._public_key is second._public_key
+        assert second.verify(tc._signer.sign("test", {"data": 1})).valid is True
+
+    def test_invalid_key_still_rejected(self):
+        """Test that a malformed key raises ValueError on every attempt."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid public key"):
+                TrustChainVerifier("bm90LWEta2V5")
+
 
 class TestVerificationResult:
     """Test VerificationResult dataclass."""
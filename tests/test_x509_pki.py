@@ -15,10 +15,15 @@ Tests cover:
   - CA persistence (save/load)
 """
 
+import re
 import time
 from datetime import datetime, timedelta, timezone
 
 import pytest
+from cryptography import x509 as cx509
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.x509 import BasicConstraints
+from cryptography.x509.oid import NameOID
 
 from trustchain.v2.x509_pki import (
     OID_MODEL_HASH,
@@ -26,8 +31,15 @@ from trustchain.v2.x509_pki import (
     AgentCertificate,
     CertVerifyResult,
     TrustChainCA,
+    build_trust_store,
 )
 
+_HEX24 = re.compile(r"[0-9a-f]{24}")
+
+
+def _bc(cert: cx509.Certificate) -> BasicConstraints:
+    return cert.extensions.get_extension_for_class(BasicConstraints).value
+
 
 class TestRootCA:
     """Root Certificate Authority creation."""
@@ -46,11 +58,8 @@ class TestRootCA:
         assert cert.issuer == cert.subject
 
         # Has CA basic constraint
-        bc = cert.extensions.get_extension_for_class(
-            __import__("cryptography").x509.BasicConstraints
-        )
-        assert bc.value.ca is True
-        assert bc.value.path_length == 2
+        assert _bc(cert).ca is True
+        assert _bc(cert).path_length == 2
 
     def test_root_ca_pem_export(self):
         """Root CA certificate exports as PEM."""
@@ -67,8 +76,6 @@ class TestRootCA:
             organization="Acme Corp",
         )
 
-        from cryptography.x509.oid import NameOID
-
         org = root.certificate.subject.get_attributes_for_oid(
             NameOID.ORGANIZATION_NAME
         )[0].value
@@ -96,13 +103,9 @@ class TestIntermediateCA:
         root = TrustChainCA.create_root_ca()
         intermediate = root.issue_intermediate_ca()
 
-        from cryptography.x509 import BasicConstraints
-
-        bc = intermediate.certificate.extensions.get_extension_for_class(
-            BasicConstraints
-        )
-        assert bc.value.ca is True
-        assert bc.value.path_length == 0
+        bc = _bc(intermediate.certificate)
+        assert bc.ca is True
+        assert bc.path_length == 0
 
     def test_intermediate_verifiable_by_root(self):
         """Intermediate cert is verifiable against Root CA."""
@@ -173,10 +176,7 @@ class TestAgentCertificate:
         intermediate = root.issue_intermediate_ca()
         agent = intermediate.issue_agent_cert("test")
 
-        from cryptography.x509 import BasicConstraints
-
-        bc = agent.certificate.extensions.get_extension_for_class(BasicConstraints)
-        assert bc.value.ca is False
+        assert _bc(agent.certificate).ca is False
 
     def test_fingerprint(self):
         """Agent cert has a readable fingerprint."""
@@ -185,8 +185,10 @@ class TestAgentCertificate:
         agent = intermediate.issue_agent_cert("test")
 
         fp = agent.fingerprint
-        assert len(fp) == 24  # first 24 hex chars of SHA-256
-        assert all(c in "0123456789abcdef" for c in fp)
+        assert _HEX24.fullmatch(fp)  # first 24 hex chars of SHA-256
+        # Certificates are immutable — the digest is computed once and reused
+        assert "fingerprint" in agent.__dict__
+        assert agent.fingerprint is fp
 
     def test_to_dict(self):
         """to_dict() returns comprehensive agent info."""
@@ -207,12 +209,32 @@ class TestAgentCertificate:
         assert "not_before" in d
         assert "not_after" in d
 
+    def test_issue_agent_cert_batch(self):
+        """Batch issuance returns one verifiable cert per spec, in order."""
+        root = TrustChainCA.create_root_ca()
+        intermediate = root.issue_intermediate_ca()
+
+        agents = intermediate.issue_agent_cert_batch(
+            [
+                {"agent_id": "batch-1"},
+                {"agent_id": "batch-2", "model_hash": "model_b"},
+                {"agent_id": "batch-3", "validity_hours": 48},
+            ]
+        )
+
+        assert [a.agent_id for a in agents] == ["batch-1", "batch-2", "batch-3"]
+        assert agents[1].model_hash == "model_b"
+        assert agents[2].is_short_lived is False
+        assert len({a.serial_number for a in agents}) == 3
+        assert agents[0].not_before == agents[1].not_before
+        for agent in agents:
+            assert agent.verify_chain([intermediate, root]) is True
+
     def test_issue_agent_cert_with_external_public_key(self):
         """CA can issue a cert for an externally generated Ed25519 public key."""
         import base64
 
         from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
         root = TrustChainCA.create_root_ca()
         intermediate = root.issue_intermediate_ca()
@@ -270,6 +292,22 @@ class TestChainVerification:
         # Wrong intermediate
         assert agent.verify_chain([int2, root]) is False
 
+    def test_verify_with_trust_store(self):
+        """Issuers are resolved by subject from a shared trust store."""
+        root1 = TrustChainCA.create_root_ca("Root 1")
+        root2 = TrustChainCA.create_root_ca("Root 2")
+        int1 = root1.issue_intermediate_ca("Int 1")
+        int2 = root2.issue_intermediate_ca("Int 2")
+        agent1 = int1.issue_agent_cert("agent-1")
+        agent2 = int2.issue_agent_cert("agent-2")
+
+        store = build_trust_store([root2, int1, root1, int2])
+        assert agent1.verify_with_trust_store(store) is True
+        assert agent2.verify_with_trust_store(store) is True
+
+        partial = build_trust_store([int1, root2])
+        assert agent1.verify_with_trust_store(partial) is False
+
     def test_verify_against_issuer(self):
         """Agent can verify directly against its issuer."""
         root = TrustChainCA.create_root_ca()
@@ -334,6 +372,23 @@ class TestRevocation:
         assert "-----BEGIN X509 CRL-----" in crl_pem
         assert "-----END X509 CRL-----" in crl_pem
 
+    def test_crl_pem_refreshes_after_revoke(self):
+        """Cached CRL PEM is reused until a new revocation lands."""
+        from cryptography.x509 import load_pem_x509_crl
+
+        root = TrustChainCA.create_root_ca()
+        intermediate = root.issue_intermediate_ca()
+        agent = intermediate.issue_agent_cert("agent-1")
+
+        before = intermediate.crl_pem
+        assert intermediate.crl_pem is before
+
+        intermediate.revoke(agent.serial_number, "compromised")
+        after = intermediate.crl_pem
+        assert after != before
+        crl = load_pem_x509_crl(after.encode("utf-8"))
+        assert crl.get_revoked_certificate_by_serial_number(agent.serial_number)
+
     def test_is_revoked(self):
         """is_revoked() check works correctly."""
         root = TrustChainCA.create_root_ca()
@@ -371,6 +426,18 @@ class TestPEMSerialization:
         assert restored.prompt_hash == "prompt_v2"
         assert restored.serial_number == agent.serial_number
 
+    def test_from_pem_returns_independent_wrappers(self):
+        """Repeated imports share the parsed cert but not the wrapper."""
+        root = TrustChainCA.create_root_ca()
+        intermediate = root.issue_intermediate_ca()
+        pem = intermediate.issue_agent_cert("cached-agent").to_pem()
+
+        first = AgentCertificate.from_pem(pem)
+        second = AgentCertificate.from_pem(pem)
+        assert first is not second
+        assert first.certificate is second.certificate
+        assert second.agent_id == "cached-agent"
+
     def test_pem_preserves_oids(self):
         """Custom OIDs survive PEM roundtrip."""
         root = TrustChainCA.create_root_ca()
@@ -411,6 +478,20 @@ class TestAgentSigning:
 
         assert agent.verify_signature(b"tampered data", signature) is False
 
+    def test_sign_many_and_verify_many(self):
+        """Batch signing matches per-message signing and verifies in bulk."""
+        root = TrustChainCA.create_root_ca()
+        intermediate = root.issue_intermediate_ca()
+        agent = intermediate.issue_agent_cert("signer-agent")
+
+        messages = [b"op-1", b"op-2", b"op-3"]
+        signatures = agent.sign_many(messages)
+
+        assert signatures == [agent.sign_data(m) for m in messages]
+        pairs = list(zip(messages, signatures))
+        pairs[1] = (b"tampered", signatures[1])
+        assert agent.verify_many(pairs) == [True, False, True]
+
     def test_sign_without_key_raises(self):
         """Signing without private key raises ValueError."""
         root = TrustChainCA.create_root_ca()
@@ -422,6 +503,8 @@ class TestAgentSigning:
 
         with pytest.raises(ValueError, match="No private key"):
             no_key.sign_data(b"data")
+        with pytest.raises(ValueError, match="No private key"):
+            no_key.sign_many([b"data"])
 
 
 class TestExpiration:
@@ -434,10 +517,6 @@ class TestExpiration:
 
         # Issue cert that's already expired (validity_hours=0 → expires immediately)
         # We'll create a custom cert with past dates
-        from cryptography import x509 as cx509
-        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-        from cryptography.x509.oid import NameOID
-
         key = Ed25519PrivateKey.generate()
         now = datetime.now(timezone.utc)
 
@@ -452,7 +531,7 @@ class TestExpiration:
             )
             .issuer_name(intermediate.certificate.subject)
             .public_key(key.public_key())
-            .serial_number(cx509.random_serial_number())
+            .serial_number(0xDEADBEEFCAFEBABE)
             .not_valid_before(now - timedelta(hours=2))
             .not_valid_after(now - timedelta(hours=1))
             .add_extension(
@@ -468,6 +547,21 @@ class TestExpiration:
         assert result.valid is False
         assert "EXPIRED" in result.errors
 
+    def test_verify_at_explicit_time(self):
+        """verify_cert / verify_chain honour a caller-supplied ``now``."""
+        root = TrustChainCA.create_root_ca()
+        intermediate = root.issue_intermediate_ca()
+        agent = intermediate.issue_agent_cert("agent-1")
+
+        now = datetime.now(timezone.utc)
+        assert intermediate.verify_cert(agent.certificate, now=now).valid is True
+        assert agent.verify_chain([intermediate, root], now=now) is True
+
+        later = now + timedelta(hours=2)
+        result = agent.verify_against(intermediate, now=later)
+        assert "EXPIRED" in result.errors
+        assert agent.verify_chain([intermediate, root], now=later) is False
+
     def test_validity_remaining(self):
         """validity_remaining shows correct time left."""
         root = TrustChainCA.create_root_ca()
@@ -588,11 +682,11 @@ class TestSubAgentDelegation:
         intermediate = root.issue_intermediate_ca()
 
         parent = intermediate.issue_agent_cert("main-agent")
-        child1 = intermediate.issue_agent_cert(
-            "sub-agent-1", parent_serial=parent.serial_number
-        )
-        child2 = intermediate.issue_agent_cert(
-            "sub-agent-2", parent_serial=parent.serial_number
+        child1, child2 = intermediate.issue_agent_cert_batch(
+            [
+                {"agent_id": "sub-agent-1", "parent_serial": parent.serial_number},
+                {"agent_id": "sub-agent-2", "parent_serial": parent.serial_number},
+            ]
         )
 
         # Before revocation — all valid
@@ -617,17 +711,53 @@ class TestSubAgentDelegation:
         assert child2_result.valid is False
         assert "PARENT_REVOKED" in child2_result.errors
 
+    def test_cascading_revocation_after_reload(self, tmp_path):
+        """Cascade also applies to sub-agents issued before the CA was reloaded."""
+        root = TrustChainCA.create_root_ca()
+        intermediate = root.issue_intermediate_ca("Cascade CA")
+        parent = intermediate.issue_agent_cert("main-agent")
+        child = intermediate.issue_agent_cert(
+            "sub-agent", parent_serial=parent.serial_number
+        )
+        intermediate.save(str(tmp_path / "ca"))
+
+        loaded = TrustChainCA.load(str(tmp_path / "ca"), "Cascade CA")
+        assert loaded.verify_cert(child.certificate).valid is True
+
+        loaded.revoke(parent.serial_number, "Prompt injection")
+        result = loaded.verify_cert(child.certificate)
+        assert result.valid is False
+        assert "PARENT_REVOKED" in result.errors
+
+    def test_parent_index_is_bounded(self, monkeypatch):
+        """The issuance-time parent index evicts old certs; the cascade still holds."""
+        from trustchain.v2 import x509_pki
+
+        monkeypatch.setattr(x509_pki, "_AGENT_PARENTS_MAX", 2)
+        root = TrustChainCA.create_root_ca()
+        intermediate = root.issue_intermediate_ca("Bounded CA")
+        parent = intermediate.issue_agent_cert("main-agent")
+        child = intermediate.issue_agent_cert(
+            "sub-agent", parent_serial=parent.serial_number
+        )
+        for i in range(3):
+            intermediate.issue_agent_cert(f"other-{i}")
+
+        assert len(intermediate._agent_parents) == 2
+        intermediate.revoke(parent.serial_number, "Prompt injection")
+        assert "PARENT_REVOKED" in intermediate.verify_cert(child.certificate).errors
+
     def test_revoke_child_only(self):
         """Revoking one child doesn't affect parent or siblings."""
         root = TrustChainCA.create_root_ca()
         intermediate = root.issue_intermediate_ca()
 
         parent = intermediate.issue_agent_cert("main-agent")
-        child1 = intermediate.issue_agent_cert(
-            "sub-1", parent_serial=parent.serial_number
-        )
-        child2 = intermediate.issue_agent_cert(
-            "sub-2", parent_serial=parent.serial_number
+        child1, child2 = intermediate.issue_agent_cert_batch(
+            [
+                {"agent_id": "sub-1", "parent_serial": parent.serial_number},
+                {"agent_id": "sub-2", "parent_serial": parent.serial_number},
+            ]
         )
 
         # Revoke only child1
@@ -648,10 +778,7 @@ class TestSubAgentDelegation:
         parent = intermediate.issue_agent_cert("main")
         child = intermediate.issue_agent_cert("sub", parent_serial=parent.serial_number)
 
-        from cryptography.x509 import BasicConstraints
-
-        bc = child.certificate.extensions.get_extension_for_class(BasicConstraints)
-        assert bc.value.ca is False
+        assert _bc(child.certificate).ca is False
 
     def test_leaf_certificate_cannot_be_used_as_intermediate(self):
         """A leaf agent certificate must never validate as a CA in the chain."""
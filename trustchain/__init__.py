@@ -10,49 +10,8 @@ Telegram: @EdCher
 __version__ = "3.3.0"
 __author__ = "Ed Cherednik"
 
-from trustchain.attribution import (
-    ATTRIBUTION_METADATA_KEY,
-    ATTRIBUTION_SCHEMA_VERSION,
-    AttributionBlock,
-    Dependency,
-    aggregate_consumption,
-    aggregate_vectors,
-    build_attribution_metadata,
-    parse_attribution_metadata,
-    project_share,
-)
-
-# KMS adapters. OSS core ships:
-#   • LocalFileKeyProvider / EnvVarKeyProvider — 12-factor / baseline;
-#   • VaultTransitKeyProvider — real hard-KMS (Ed25519 stays in HashiCorp Vault);
-#   • AwsSecretsManagerKeyProvider — soft-KMS on AWS (seed in Secrets Manager,
-#     envelope-encrypted by AWS KMS CMK).
-# trustchain_pro adds CloudHSM / Azure KeyVault / PKCS#11 providers on top.
-from trustchain.kms import (
-    AwsSecretsManagerKeyProvider,
-    EnvVarKeyProvider,
-    KeyProvider,
-    KeyProviderError,
-    KeyProviderMetadata,
-    LocalFileKeyProvider,
-    VaultTransitKeyProvider,
-)
-
-# Receipt — portable, self-contained proof-of-signature object (.tcreceipt).
-# Предназначен для того, чтобы «квитанцию» о подписанном ответе можно было
-# передать третьей стороне (email, Slack, QR) и она проверила подпись
-# локально, без обращения к production-системе.
-from trustchain.receipt import (
-    RECEIPT_FORMAT,
-    RECEIPT_VERSION,
-    Receipt,
-    ReceiptError,
-    ReceiptFormatError,
-    ReceiptVerification,
-    ReceiptVerificationError,
-    build_receipt,
-    verify_receipt,
-)
+import importlib
+from typing import Any
 
 # Core exports
 from trustchain.utils.exceptions import (
@@ -62,37 +21,120 @@ from trustchain.utils.exceptions import (
     TrustChainError,
 )
 from trustchain.v2 import (
-    AsyncTrustChain,
-    AsyncTrustChainSession,
     RedisNonceStorage,
     SignedResponse,
-    TenantInfo,
-    TenantManager,
     TrustChain,
     TrustChainConfig,
-    TrustChainVerifier,
-    VerificationResult,
     create_trustchain,
-    get_logger,
     get_metrics,
-    setup_logging,
 )
 
-# Policy hooks (OSS) - for full PolicyEngine see TrustChain Pro
-from trustchain.v2.policy_hooks import (
-    PolicyHook,
-    PolicyHookRegistry,
-    get_policy_registry,
-    register_policy_hook,
-)
+# Everything below is resolved on first attribute access (PEP 562) so that
+# ``import trustchain`` only pays for the signing core. In particular the
+# OnaiDocs bridge lives in ``trustchain.integrations``, whose package import
+# probes every optional framework (Flask, Pydantic, OpenTelemetry, MCP, ...).
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    # Core extras, resolved through trustchain.v2's own lazy exports
+    **{
+        name: ("trustchain.v2", name)
+        for name in (
+            "AsyncTrustChain",
+            "AsyncTrustChainSession",
+            "TenantInfo",
+            "TenantManager",
+            "TrustChainVerifier",
+            "VerificationResult",
+            "get_logger",
+            "setup_logging",
+        )
+    },
+    # Dependency attribution (provenance layer)
+    **{
+        name: ("trustchain.attribution", name)
+        for name in (
+            "ATTRIBUTION_METADATA_KEY",
+            "ATTRIBUTION_SCHEMA_VERSION",
+            "AttributionBlock",
+            "Dependency",
+            "aggregate_consumption",
+            "aggregate_vectors",
+            "build_attribution_metadata",
+            "parse_attribution_metadata",
+            "project_share",
+        )
+    },
+    # KMS adapters. OSS core ships:
+    #   • LocalFileKeyProvider / EnvVarKeyProvider — 12-factor / baseline;
+    #   • VaultTransitKeyProvider — real hard-KMS (Ed25519 stays in HashiCorp Vault);
+    #   • AwsSecretsManagerKeyProvider — soft-KMS on AWS (seed in Secrets Manager,
+    #     envelope-encrypted by AWS KMS CMK).
+    # trustchain_pro adds CloudHSM / Azure KeyVault / PKCS#11 providers on top.
+    **{
+        name: ("trustchain.kms", name)
+        for name in (
+            "AwsSecretsManagerKeyProvider",
+            "EnvVarKeyProvider",
+            "KeyProvider",
+            "KeyProviderError",
+            "KeyProviderMetadata",
+            "LocalFileKeyProvider",
+            "VaultTransitKeyProvider",
+        )
+    },
+    # Receipt — portable, self-contained proof-of-signature object (.tcreceipt).
+    # Предназначен для того, чтобы «квитанцию» о подписанном ответе можно было
+    # передать третьей стороне (email, Slack, QR) и она проверила подпись
+    # локально, без обращения к production-системе.
+    **{
+        name: ("trustchain.receipt", name)
+        for name in (
+            "RECEIPT_FORMAT",
+            "RECEIPT_VERSION",
+            "Receipt",
+            "ReceiptError",
+            "ReceiptFormatError",
+            "ReceiptVerification",
+            "ReceiptVerificationError",
+            "build_receipt",
+            "verify_receipt",
+        )
+    },
+    # Policy hooks (OSS) - for full PolicyEngine see TrustChain Pro
+    **{
+        name: ("trustchain.v2.policy_hooks", name)
+        for name in (
+            "PolicyHook",
+            "PolicyHookRegistry",
+            "get_policy_registry",
+            "register_policy_hook",
+        )
+    },
+    # Reasoning (basic version - OSS)
+    "ReasoningChain": ("trustchain.v2.reasoning", "ReasoningChain"),
+    # Optional integration — None when its dependencies are unavailable
+    "OnaiDocsTrustClient": ("trustchain.integrations.onaidocs", "OnaiDocsTrustClient"),
+}
+
+_OPTIONAL_LAZY_EXPORTS = frozenset({"OnaiDocsTrustClient"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        module, attr = _LAZY_EXPORTS[name]
+        try:
+            value = getattr(importlib.import_module(module), attr)
+        except Exception:
+            if name not in _OPTIONAL_LAZY_EXPORTS:
+                raise
+            value = None  # optional integration
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-# Reasoning (basic version - OSS)
-from trustchain.v2.reasoning import ReasoningChain
+def __dir__() -> list[str]:
+    return sorted(list(globals().keys()) + list(_LAZY_EXPORTS.keys()))
 
-try:
-    from trustchain.integrations.onaidocs import OnaiDocsTrustClient
-except Exception:  # optional integration
-    OnaiDocsTrustClient = None  # type: ignore
 
 __all__ = [
     # Core - Cryptographic signing
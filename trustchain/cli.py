@@ -11,6 +11,7 @@ Usage:
     tc log --tool bash_tool         # filter by tool
     tc status                       # chain health summary
     tc chain-verify                 # verify chain integrity (fsck)
+    tc verify-proof proof.json -r op.json --root HEX   # O(log n) single-op check
     tc checkpoint NAME             # refs/checkpoints/NAME.ref → current HEAD
     tc tag NAME                    # refs/tags/NAME.ref → current HEAD (immutable marker)
     tc branch NAME                  # refs/heads/NAME.ref → current HEAD
@@ -23,6 +24,7 @@ Usage:
     tc show <64-hex>               # v3 CAS object (after migrate-v3 --apply)
     tc diff op_0001 op_0005         # compare two operations
     tc export chain.json            # export full chain as JSON
+    tc pack                         # pack loose objects into objects.pack (mmap reads)
     tc cert request --platform https://keys.trust-chain.ai   # X.509 enrollment steps (human path)
     tc migrate-v3 --apply          # v2 op_*.json → v3 CAS commits + v3/migration_state.json
     tc v3-merge A B "сообщение"    # merge-коммит с двумя родителями (CAS) + refs/v3/main
@@ -34,22 +36,26 @@ Usage:
 """
 
 import base64
+import itertools
 import json
 import os
+import sys
 import urllib.error
 import urllib.request
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.console import Console, Group
 from rich.text import Text
 
 from trustchain import TrustChain, TrustChainConfig, __version__
 from trustchain.v2.chain_store import ChainStore
-from trustchain.v2.storage import FileStorage
+from trustchain.v2.storage import PackedStorage, open_file_storage
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.table import Table
 
 app = typer.Typer(
     name="tc",
@@ -59,6 +65,26 @@ app = typer.Typer(
 )
 console = Console()
 
+
+# rich.panel / rich.table load on first use, keeping them off tc's cold start.
+def _panel(*args: Any, **kwargs: Any) -> "Panel":
+    from rich.panel import Panel
+
+    return Panel(*args, **kwargs)
+
+
+def _panel_fit(*args: Any, **kwargs: Any) -> "Panel":
+    from rich.panel import Panel
+
+    return Panel.fit(*args, **kwargs)
+
+
+def _table(*args: Any, **kwargs: Any) -> "Table":
+    from rich.table import Table
+
+    return Table(*args, **kwargs)
+
+
 cert_app = typer.Typer(
     name="cert",
     help="X.509 identity bound to TrustChain Platform (public CA) — incremental rollout.",
@@ -90,16 +116,27 @@ def _warn_cli_storage_mismatch() -> None:
         )
 
 
-def _get_chain(chain_dir: str = ".trustchain") -> ChainStore:
-    """Load chain from the current directory's .trustchain/ folder."""
+def _get_chain(chain_dir: str | Path = ".trustchain") -> ChainStore:
+    """Load chain from the current directory's .trustchain/ folder.
+
+    A ``Path`` is taken as a root already returned by ``_effective_chain_dir``
+    (commands that need the root themselves resolve it only once).
+    """
     _warn_cli_storage_mismatch()
-    root = _effective_chain_dir(chain_dir)
-    if not root.exists():
+    root = chain_dir if isinstance(chain_dir, Path) else _effective_chain_dir(chain_dir)
+    if not root.is_dir():
         console.print(f"[red]No .trustchain/ directory found at {root}[/red]")
         console.print("[dim]Run 'tc init' to create one, or specify --dir[/dim]")
         raise typer.Exit(1)
-    storage = FileStorage(str(root))
-    return ChainStore(storage, root_dir=str(root))
+    return _open_chain(root)
+
+
+def _open_chain(root: Path) -> ChainStore:
+    """Open the file ChainStore at an already-resolved, existing ``root``.
+
+    Uses the mmap-backed PackedStorage once ``tc pack`` has produced a pack.
+    """
+    return ChainStore(open_file_storage(str(root)), root_dir=str(root))
 
 
 def _get_tc(chain_dir: str = ".trustchain") -> TrustChain:
@@ -140,11 +177,52 @@ def _graph_prefixes(ops: list, *, newest_first: bool) -> list[str]:
     return out
 
 
+_EMPTY_FIELD = "[dim]---[/dim]"
+
+
 def _truncate(s: Optional[str], n: int = 12) -> str:
     """Truncate a string for display."""
     if not s:
-        return "[dim]---[/dim]"
-    return s[:n] + "..." if len(s) > n else s
+        return _EMPTY_FIELD
+    return s if len(s) <= n else f"{s[:n]}..."
+
+
+def _plain_output() -> bool:
+    """Write raw text instead of Rich renderables (log / blame / show).
+
+    ``TC_PLAIN=1`` / ``TC_PLAIN=0`` force either mode; otherwise plain is
+    used whenever stdout is not a terminal (``tc log | grep …``), where
+    Rich's layout and wrapping only cost time. NO_COLOR is honoured by
+    Rich itself.
+    """
+    forced = os.environ.get("TC_PLAIN", "").strip()
+    if forced:
+        return forced not in ("0", "false", "no")
+    return not console.is_terminal
+
+
+def _emit_lines(lines: list[Any]) -> None:
+    """Print Text / markup-string lines: one Rich render or one raw write."""
+    if not _plain_output():
+        console.print(Group(*lines))
+        return
+    sys.stdout.write(
+        "".join(
+            f"{(ln if isinstance(ln, Text) else Text.from_markup(ln)).plain}\n"
+            for ln in lines
+        )
+    )
+
+
+# json.dumps(..., default=str) builds a fresh JSONEncoder on every call;
+# log/blame/show/diff call it per op, so keep two preconfigured encoders.
+_JSON_INLINE = json.JSONEncoder(default=str)
+_JSON_INDENTED = json.JSONEncoder(indent=2, default=str)
+
+
+def _dumps(obj: Any, *, indent: bool = False) -> str:
+    """Render op data for display (``default=str`` for non-JSON values)."""
+    return (_JSON_INDENTED if indent else _JSON_INLINE).encode(obj)
 
 
 # ── Git-like chain commands ──
@@ -198,14 +276,12 @@ def log_cmd(
         if not reverse:
             ops = list(reversed(ops))
     else:
-        chain = _get_chain(chain_dir)
+        chain = _get_chain(root)
 
         if tool:
-            ops = chain.blame(tool, limit=limit)
-            if reverse:
-                ops.reverse()
+            ops = chain.blame(tool, limit=limit, newest_first=reverse)
         elif reverse:
-            ops = chain.log_reverse(limit=limit)
+            ops = list(itertools.islice(chain.iter_log_reverse(), limit))
         else:
             ops = chain.log(limit=limit)
 
@@ -215,12 +291,15 @@ def log_cmd(
 
     prefixes = _graph_prefixes(ops, newest_first=reverse) if graph else None
     head_idx = 0 if reverse else len(ops) - 1
+    # Rich print is far costlier than building renderables: collect every line
+    # and emit the whole log with a single console.print.
+    lines: list[Any] = []
 
     for i, op in enumerate(ops):
         op_id = op.get("id", "?")
         op_tool = op.get("tool", "unknown")
         sig = _truncate(op.get("signature"), 10)
-        parent = _truncate(op.get("parent_signature"), 10)
+        parent_sig = op.get("parent_signature")
         ts = op.get("timestamp", "")
         latency = op.get("latency_ms", 0)
 
@@ -236,24 +315,27 @@ def log_cmd(
             header.append(head_note, style="bold magenta")
         header.append(f"  {op_tool}", style="bold cyan")
         header.append(f"  sig:{sig}", style="green")
-        if op.get("parent_signature"):
-            header.append(f"  parent:{parent}", style="dim")
+        if parent_sig:
+            header.append(f"  parent:{_truncate(parent_sig, 10)}", style="dim")
         if latency:
             header.append(f"  {latency:.0f}ms", style="dim magenta")
 
-        console.print(header)
+        lines.append(header)
         indent = "    " if prefixes is None else "      "
-        console.print(f"{indent}[dim]{ts}[/dim]")
+        lines.append(f"{indent}[dim]{ts}[/dim]")
 
         if verbose:
             data = op.get("data", {})
-            console.print(
-                f"{indent}[dim]data: {json.dumps(data, default=str)[:120]}[/dim]"
-            )
+            # Text, not markup: op data / messages may contain "[...]"
+            lines.append(Text(f"{indent}data: {_dumps(data)[:120]}", style="dim"))
             if op.get("_v3_message"):
-                console.print(f"{indent}[dim]v3 commit: {op.get('_v3_message')}[/dim]")
+                lines.append(
+                    Text(f"{indent}v3 commit: {op.get('_v3_message')}", style="dim")
+                )
+
+        lines.append("")
 
-        console.print()
+    _emit_lines(lines)
 
 
 manifest_app = typer.Typer(
@@ -300,10 +382,11 @@ def status_cmd(
     chain_dir: str = typer.Option(".trustchain", "--dir", "-d", help="Chain directory"),
 ):
     """Chain health summary (like `git status`)."""
-    chain = _get_chain(chain_dir)
+    root = _effective_chain_dir(chain_dir)
+    chain = _get_chain(root)
     s = chain.status()
 
-    table = Table(title="TrustChain Status", show_header=False, border_style="blue")
+    table = _table(title="TrustChain Status", show_header=False, border_style="blue")
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="green")
 
@@ -324,7 +407,6 @@ def status_cmd(
     if sessions:
         table.add_row("Sessions", f"{len(sessions)} ({', '.join(sessions[:5])})")
 
-    root = _effective_chain_dir(chain_dir)
     v3ref = root / "refs" / "v3" / "main"
     if v3ref.is_file():
         v3tip = v3ref.read_text(encoding="utf-8").strip()
@@ -381,7 +463,8 @@ def chain_verify_cmd(
         else:
             pk_b64 = pubkey
 
-    result = chain.verify(public_key=pk_b64)
+    # One-shot CLI process: safe to fan signature checks out to a pool.
+    result = chain.verify(public_key=pk_b64, workers=os.cpu_count())
 
     if pk_b64:
         sig_line = f"Signatures: {result.get('signatures_verified', 0)} verified"
@@ -396,7 +479,7 @@ def chain_verify_cmd(
 
     if result["valid"]:
         console.print(
-            Panel(
+            _panel(
                 f"[bold green]Chain VALID[/bold green]\n"
                 f"Length: {result['length']} operations\n"
                 f"HEAD: {_truncate(result.get('head'), 24)}\n"
@@ -409,7 +492,7 @@ def chain_verify_cmd(
     else:
         broken = result.get("broken_links", [])
         console.print(
-            Panel(
+            _panel(
                 f"[bold red]Chain INVALID[/bold red]\n"
                 f"Length: {result['length']} operations\n"
                 f"Broken links: {len(broken)}\n"
@@ -432,6 +515,74 @@ def chain_verify_cmd(
         raise typer.Exit(1)
 
 
+@app.command("verify-proof")
+def verify_proof_cmd(
+    proof_file: Path = typer.Argument(
+        ..., help="Inclusion proof JSON (InclusionProof.to_dict output)"
+    ),
+    record_file: Path = typer.Option(
+        ..., "--record", "-r", help="Operation record JSON the proof is for"
+    ),
+    root: Optional[str] = typer.Option(
+        None,
+        "--root",
+        help="Trusted Merkle root (hex), e.g. from a published anchor",
+    ),
+):
+    """Verify one operation via its Merkle inclusion proof (O(log n)).
+
+    Recomputes the root from the record and its audit path instead of
+    replaying the whole chain. Without --root the proof's own root is
+    used, which only shows the proof is self-consistent.
+
+    Examples:
+        tc verify-proof proof.json --record op.json --root 9f2c…
+    """
+    from trustchain.v2.verifiable_log import (
+        inclusion_proof_from_dict,
+        record_leaf_json,
+    )
+
+    try:
+        data = json.loads(proof_file.read_text(encoding="utf-8"))
+        record = json.loads(record_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        console.print(f"[red]Could not read proof/record: {e}[/red]")
+        raise typer.Exit(2)
+    if not isinstance(data, dict):
+        console.print("[red]Malformed proof: expected a JSON object[/red]")
+        raise typer.Exit(2)
+    if not isinstance(record, dict):
+        console.print("[red]Malformed record: expected a JSON object[/red]")
+        raise typer.Exit(2)
+
+    try:
+        proof = inclusion_proof_from_dict(data)
+    except (KeyError, TypeError) as e:
+        console.print(f"[red]Malformed proof: missing {e}[/red]")
+        raise typer.Exit(2)
+
+    if root and root.lower() != str(proof.root_at_proof_time).lower():
+        console.print("[bold red]Proof INVALID[/bold red]: root does not match --root")
+        raise typer.Exit(1)
+
+    if not proof.verify(record_leaf_json(record)):
+        console.print(
+            f"[bold red]Proof INVALID[/bold red] for {proof.op_id} "
+            f"(leaf {proof.leaf_index})"
+        )
+        raise typer.Exit(1)
+
+    console.print(
+        f"[bold green]Proof VALID[/bold green] for {proof.op_id} "
+        f"(leaf {proof.leaf_index}, root {_truncate(proof.root_at_proof_time, 16)})"
+    )
+    if not root:
+        console.print(
+            "[dim]Root taken from the proof itself — pass --root to pin it.[/dim]"
+        )
+
+
 @app.command("blame")
 def blame_cmd(
     tool: str = typer.Argument(..., help="Tool name to investigate"),
@@ -453,24 +604,38 @@ def blame_cmd(
         console.print(f"[dim]No operations found for tool '{tool}'[/dim]")
         return
 
-    console.print(
-        f"[bold]Found {len(ops)} operations for [cyan]{tool}[/cyan]:[/bold]\n"
-    )
-
-    table = Table(show_header=True)
-    table.add_column("ID", style="yellow")
-    table.add_column("Timestamp", style="dim")
-    table.add_column("Signature", style="green")
-    table.add_column("Data (truncated)")
+    header = f"[bold]Found {len(ops)} operations for [cyan]{tool}[/cyan]:[/bold]\n"
 
-    for op in ops:
-        data_str = json.dumps(op.get("data", {}), default=str)[:60]
-        table.add_row(
+    rows = [
+        (
             op.get("id", "?"),
             op.get("timestamp", "?")[:19],
             _truncate(op.get("signature"), 16),
-            data_str,
+            _dumps(op.get("data", {}))[:60],
         )
+        for op in ops
+    ]
+
+    if _plain_output():
+        cells = (("---" if c == _EMPTY_FIELD else c for c in row) for row in rows)
+        _emit_lines([header, *(Text("\t".join(row)) for row in cells)])
+        return
+    console.print(header)
+
+    # The first three columns are plain text of known length: give Rich
+    # explicit widths so it only has to measure the free-form data cells.
+    def width(header: str, cells: Sequence[str]) -> int:
+        return max(len(header), *(3 if c == _EMPTY_FIELD else len(c) for c in cells))
+
+    ids, stamps, sigs, _ = zip(*rows)
+    table = _table(show_header=True)
+    table.add_column("ID", style="yellow", width=width("ID", ids))
+    table.add_column("Timestamp", style="dim", width=width("Timestamp", stamps))
+    table.add_column("Signature", style="green", width=width("Signature", sigs))
+    table.add_column("Data (truncated)")
+
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -511,21 +676,27 @@ def show_cmd(
         }
         if sub:
             panel_kw["subtitle"] = sub
+        if _plain_output():
+            sys.stdout.write(_dumps(blob, indent=True) + "\n")
+            return
         console.print(
-            Panel(json.dumps(blob, indent=2, default=str), **panel_kw),
+            _panel(_dumps(blob, indent=True), **panel_kw),
         )
         return
 
-    chain = _get_chain(chain_dir)
+    chain = _get_chain(root)
     op = chain.show(ref)
 
     if not op:
         console.print(f"[red]Operation '{ref}' not found[/red]")
         raise typer.Exit(1)
 
+    if _plain_output():
+        sys.stdout.write(_dumps(op, indent=True) + "\n")
+        return
     console.print(
-        Panel(
-            json.dumps(op, indent=2, default=str),
+        _panel(
+            _dumps(op, indent=True),
             title=f"tc show {ref}",
             border_style="cyan",
             subtitle=f"Tool: {op.get('tool', '?')} | {op.get('timestamp', '?')}",
@@ -563,12 +734,8 @@ def diff_cmd(
     if td is not None:
         console.print(f"Time delta: {td:.1f}s")
 
-    console.print(
-        f"\n[dim]A data:[/dim] {json.dumps(a.get('data', {}), indent=2, default=str)}"
-    )
-    console.print(
-        f"\n[dim]B data:[/dim] {json.dumps(b.get('data', {}), indent=2, default=str)}"
-    )
+    console.print(f"\n[dim]A data:[/dim] {_dumps(a.get('data', {}), indent=True)}")
+    console.print(f"\n[dim]B data:[/dim] {_dumps(b.get('data', {}), indent=True)}")
 
 
 @app.command("export")
@@ -583,8 +750,33 @@ def export_cmd(
         tc export audit_2026.json
     """
     chain = _get_chain(chain_dir)
-    chain.export_json(str(output))
-    console.print(f"[green]Exported {chain.length} operations to {output}[/green]")
+    count = chain.export_json_stream(str(output))
+    console.print(f"[green]Exported {count} operations to {output}[/green]")
+
+
+@app.command("pack")
+def pack_cmd(
+    chain_dir: str = typer.Option(".trustchain", "--dir", "-d", help="Chain directory"),
+):
+    """Pack loose objects/*.json into objects.pack (like `git gc`).
+
+    Later tc commands read packed ops through one memory map instead of
+    opening a file per op, and blame/status start from the refreshed
+    refs/tools/ index. New ops stay loose until the next pack.
+    """
+    root = _effective_chain_dir(chain_dir)
+    if not root.is_dir():
+        console.print(f"[red]No .trustchain/ directory found at {root}[/red]")
+        raise typer.Exit(1)
+    storage = PackedStorage(str(root))
+    packed = storage.pack()
+    storage.close()
+    indexed = _open_chain(root).update_tool_index()
+    console.print(
+        f"[green]Packed {packed} objects[/green] "
+        f"[dim]({storage.size()} total in {PackedStorage.PACK_FILE}, "
+        f"{indexed} in the tool index)[/dim]"
+    )
 
 
 # ── Original commands (preserved) ──
@@ -703,7 +895,7 @@ def info():
     """Show TrustChain information and configuration."""
     tc = TrustChain()
 
-    table = Table(title="TrustChain Info")
+    table = _table(title="TrustChain Info")
     table.add_column("Property", style="cyan")
     table.add_column("Value", style="green")
 
@@ -712,17 +904,15 @@ def info():
     table.add_row("Algorithm", "Ed25519")
     table.add_row("Public Key", tc.export_public_key()[:32] + "...")
 
-    # Try to show chain info
+    # Try to show chain info (one stat per candidate; no re-check in _get_chain)
     for chain_dir in [".trustchain", str(Path.home() / ".trustchain")]:
-        if Path(chain_dir).exists():
-            try:
-                chain = _get_chain(chain_dir)
-                s = chain.status()
-                table.add_row("Chain length", str(s["length"]))
-                table.add_row("Chain dir", chain_dir)
-                break
-            except SystemExit:
-                pass
+        root = _effective_chain_dir(chain_dir)
+        if os.path.isdir(root):
+            _warn_cli_storage_mismatch()
+            s = _open_chain(root).status()
+            table.add_row("Chain length", str(s["length"]))
+            table.add_row("Chain dir", chain_dir)
+            break
 
     console.print(table)
 
@@ -739,7 +929,8 @@ def verify(
         tc verify --verbose audit.json
     """
     try:
-        data = json.loads(file.read_text())
+        # bytes straight to json: no locale-dependent text decode step
+        data = json.loads(file.read_bytes())
         tc = TrustChain()
         is_valid = tc.verify(data)
 
@@ -777,7 +968,7 @@ def config_show(
         chain_dsn=os.environ.get("TC_VERIFIABLE_LOG_DSN"),
     )
     console.print(
-        Panel.fit(f"[bold]CLI resolved chain dir[/bold]\n{root}", title="tc config")
+        _panel_fit(f"[bold]CLI resolved chain dir[/bold]\n{root}", title="tc config")
     )
     console.print(
         "[dim]Relevant environment variables:[/dim]\n"
@@ -850,7 +1041,7 @@ def cert_request(
         return
 
     console.print(
-        Panel.fit(
+        _panel_fit(
             "[bold]Листовой сертификат агента[/bold]\n\n"
             "1. Tenant admin: ``POST /api/enroll/invite`` → invitation token.\n"
             "2. Агент: ``tc cert request --auto -i <token> -p {base}``\n"
@@ -968,7 +1159,7 @@ def _cert_request_auto(
         pass
 
     console.print(
-        Panel.fit(
+        _panel_fit(
             f"[green]Enrolled[/green] tenant={enroll.get('tenant_id')} agent={agent_id}\n"
             f"Saved identity to [cyan]{save_dir.resolve()}[/cyan]\n"
             "Set APATCH_AGENT_KEY to agent.key and APATCH_AGENT_ID when using apatch bridge.",
@@ -1036,7 +1227,7 @@ def migrate_v3_cmd(
     for w in warns:
         console.print(f"[yellow]{w}[/yellow]")
     console.print(
-        Panel.fit(
+        _panel_fit(
             json.dumps(report, indent=2, default=str),
             title="tc migrate-v3" + (" [apply]" if apply else " [dry-run]"),
         )
@@ -1082,7 +1273,7 @@ def v3_merge_cmd(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1)
     console.print(
-        Panel.fit(
+        _panel_fit(
             f"[bold]tip[/bold] {tip}\n"
             f"[dim]родители[/dim] {parent_a.strip().lower()[:16]}… + {parent_b.strip().lower()[:16]}…\n"
             + (
@@ -1173,7 +1364,7 @@ def checkout_cmd(
         res = chain.checkout(name, dry_run=dry_run, max_scan=max_scan)
         if dry_run:
             console.print(
-                Panel.fit(
+                _panel_fit(
                     f"Ветка [bold]{res['branch']}[/bold] → {res['op_id']}\nHEAD …{res['head'][:48]}…",
                     title="tc checkout --dry-run",
                 )
@@ -1200,7 +1391,7 @@ def refs_cmd(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(1)
 
-    table = Table(title="refs", show_header=True, header_style="bold")
+    table = _table(title="refs", show_header=True, header_style="bold")
     table.add_column("kind", style="cyan")
     table.add_column("name", style="white")
     table.add_column("HEAD (trunc)", style="dim")
@@ -1258,7 +1449,7 @@ def reset_cmd(
 
         if not res["changed"]:
             console.print(
-                Panel.fit(
+                _panel_fit(
                     f"[bold]Already at[/bold] {res['target_id']}\nHEAD already points to this commit.",
                     title="tc reset",
                 )
@@ -1274,13 +1465,13 @@ def reset_cmd(
         )
 
         if dry_run:
-            console.print(Panel.fit(summary, title="tc reset --dry-run"))
+            console.print(_panel_fit(summary, title="tc reset --dry-run"))
             if soft:
                 console.print("[dim]Убери --dry-run чтобы применить --soft.[/dim]")
             return
 
         console.print(
-            Panel.fit(
+            _panel_fit(
                 summary + "\n\n[green]HEAD[/green] и строка в reflog.txt",
                 title="tc reset --soft",
             )
@@ -1441,7 +1632,7 @@ def receipt_show(
         f"[bold]witnesses[/bold]  {witnesses_line}\n"
         f"[bold]fingerprint[/bold] {receipt.fingerprint[:16]}…"
     )
-    console.print(Panel(body, title=f"TrustChain Receipt v{receipt.version}"))
+    console.print(_panel(body, title=f"TrustChain Receipt v{receipt.version}"))
 
 
 @receipt_app.command("verify")
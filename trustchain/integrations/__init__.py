@@ -1,14 +1,15 @@
 """TrustChain Integrations.
 
-Optional framework adapters. LangChain / LangSmith are lazy-loaded so
-``import trustchain`` does not pull langchain_core (important on Python 3.14+).
+Optional framework adapters. All of them are lazy-loaded so
+``import trustchain`` does not pull langchain_core (important on Python 3.14+)
+or probe FastAPI / Flask / Django / OpenTelemetry / MCP until first use.
 
 Available integrations:
 - FastAPI: TrustChainMiddleware, sign_response
 - Flask: TrustChainFlask, sign_response (flask)
 - Django: TrustChainMiddleware (django), sign_response (django)
-- LangChain: to_langchain_tool, to_langchain_tools (lazy)
-- LangSmith: TrustChainCallbackHandler (lazy)
+- LangChain: to_langchain_tool, to_langchain_tools
+- LangSmith: TrustChainCallbackHandler
 - Pydantic v2: TrustChainModel, SignedField, SignedDict
 - OpenTelemetry: TrustChainSpanProcessor, TrustChainInstrumentor
 - MCP: serve_mcp, create_mcp_server
@@ -19,12 +20,62 @@ from __future__ import annotations
 import importlib
 from typing import Any
 
-# LangChain / LangSmith — lazy (see __getattr__); avoids langchain_core on import trustchain
+# Every adapter is lazy (see __getattr__): importing trustchain.integrations
+# probes no optional framework until one of its names is first accessed.
+# Missing optional dependencies resolve to None, as before.
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    # FastAPI
+    "TrustChainMiddleware": (".fastapi", "TrustChainMiddleware"),
+    "sign_response": (".fastapi", "sign_response"),
+    "TrustChainAPIRouter": (".fastapi", "TrustChainAPIRouter"),
+    # Flask
+    "TrustChainFlask": (".flask", "TrustChainFlask"),
+    "flask_sign_response": (".flask", "sign_response"),
+    "get_public_key_endpoint": (".flask", "get_public_key_endpoint"),
+    # Django
+    "DjangoTrustChainMiddleware": (".django", "TrustChainMiddleware"),
+    "django_sign_response": (".django", "sign_response"),
+    "get_public_key_view": (".django", "get_public_key_view"),
+    "sign_drf_response": (".django", "sign_drf_response"),
+    # LangChain / LangSmith — avoids langchain_core on import trustchain
     "to_langchain_tool": (".langchain", "to_langchain_tool"),
     "to_langchain_tools": (".langchain", "to_langchain_tools"),
     "TrustChainLangChainTool": (".langchain", "TrustChainLangChainTool"),
     "TrustChainCallbackHandler": (".langsmith", "TrustChainCallbackHandler"),
+    # Pydantic v2
+    "TrustChainModel": (".pydantic_v2", "TrustChainModel"),
+    "SignedField": (".pydantic_v2", "SignedField"),
+    "SignedDict": (".pydantic_v2", "SignedDict"),
+    # OpenTelemetry
+    "TrustChainSpanProcessor": (".opentelemetry", "TrustChainSpanProcessor"),
+    "TrustChainInstrumentor": (".opentelemetry", "TrustChainInstrumentor"),
+    "instrument_span": (".opentelemetry", "instrument_span"),
+    "create_traced_trustchain": (".opentelemetry", "create_traced_trustchain"),
+    "set_trustchain_span_attributes": (
+        ".opentelemetry",
+        "set_trustchain_span_attributes",
+    ),
+    "ATTR_TRUSTCHAIN_TOOL_ID": (".opentelemetry", "ATTR_TRUSTCHAIN_TOOL_ID"),
+    "ATTR_TRUSTCHAIN_SIGNATURE": (".opentelemetry", "ATTR_TRUSTCHAIN_SIGNATURE"),
+    "ATTR_TRUSTCHAIN_SIGNATURE_ID": (
+        ".opentelemetry",
+        "ATTR_TRUSTCHAIN_SIGNATURE_ID",
+    ),
+    "ATTR_TRUSTCHAIN_VERIFIED": (".opentelemetry", "ATTR_TRUSTCHAIN_VERIFIED"),
+    "ATTR_TRUSTCHAIN_TIMESTAMP": (".opentelemetry", "ATTR_TRUSTCHAIN_TIMESTAMP"),
+    "ATTR_TRUSTCHAIN_NONCE": (".opentelemetry", "ATTR_TRUSTCHAIN_NONCE"),
+    "ATTR_TRUSTCHAIN_PARENT_SIGNATURE": (
+        ".opentelemetry",
+        "ATTR_TRUSTCHAIN_PARENT_SIGNATURE",
+    ),
+    "ATTR_TRUSTCHAIN_CHAIN_ID": (".opentelemetry", "ATTR_TRUSTCHAIN_CHAIN_ID"),
+    # MCP
+    "serve_mcp": (".mcp", "serve_mcp"),
+    "create_mcp_server": (".mcp", "create_mcp_server"),
+    "TrustChainMCPServer": (".mcp", "TrustChainMCPServer"),
+    "run_proxy": (".mcp_proxy", "run_proxy"),
+    # OnaiDocs bridge
+    "OnaiDocsTrustClient": (".onaidocs", "OnaiDocsTrustClient"),
 }
 
 
@@ -45,90 +96,6 @@ def __dir__() -> list[str]:
     return sorted(list(globals().keys()) + list(_LAZY_EXPORTS.keys()) + list(__all__))
 
 
-# Pydantic v2 (optional)
-try:
-    from .pydantic_v2 import SignedDict, SignedField, TrustChainModel
-except ImportError:
-    TrustChainModel = None
-    SignedField = None
-    SignedDict = None
-
-# OpenTelemetry (optional)
-try:
-    from .opentelemetry import (
-        ATTR_TRUSTCHAIN_CHAIN_ID,
-        ATTR_TRUSTCHAIN_NONCE,
-        ATTR_TRUSTCHAIN_PARENT_SIGNATURE,
-        ATTR_TRUSTCHAIN_SIGNATURE,
-        ATTR_TRUSTCHAIN_SIGNATURE_ID,
-        ATTR_TRUSTCHAIN_TIMESTAMP,
-        ATTR_TRUSTCHAIN_TOOL_ID,
-        ATTR_TRUSTCHAIN_VERIFIED,
-        TrustChainInstrumentor,
-        TrustChainSpanProcessor,
-        create_traced_trustchain,
-        instrument_span,
-        set_trustchain_span_attributes,
-    )
-except ImportError:
-    TrustChainSpanProcessor = None
-    TrustChainInstrumentor = None
-    instrument_span = None
-    create_traced_trustchain = None
-    set_trustchain_span_attributes = None
-    ATTR_TRUSTCHAIN_TOOL_ID = None
-    ATTR_TRUSTCHAIN_SIGNATURE = None
-    ATTR_TRUSTCHAIN_SIGNATURE_ID = None
-    ATTR_TRUSTCHAIN_VERIFIED = None
-    ATTR_TRUSTCHAIN_TIMESTAMP = None
-    ATTR_TRUSTCHAIN_NONCE = None
-    ATTR_TRUSTCHAIN_PARENT_SIGNATURE = None
-    ATTR_TRUSTCHAIN_CHAIN_ID = None
-
-# MCP (optional)
-try:
-    from .mcp import TrustChainMCPServer, create_mcp_server, serve_mcp
-    from .mcp_proxy import run_proxy
-except ImportError:
-    serve_mcp = None
-    create_mcp_server = None
-    TrustChainMCPServer = None
-    run_proxy = None
-
-# OnaiDocs bridge (optional)
-try:
-    from .onaidocs import OnaiDocsTrustClient
-except ImportError:
-    OnaiDocsTrustClient = None
-
-# FastAPI (optional)
-try:
-    from .fastapi import TrustChainAPIRouter, TrustChainMiddleware, sign_response
-except ImportError:
-    TrustChainMiddleware = None
-    sign_response = None
-    TrustChainAPIRouter = None
-
-# Flask (optional)
-try:
-    from .flask import TrustChainFlask, get_public_key_endpoint
-    from .flask import sign_response as flask_sign_response
-except ImportError:
-    TrustChainFlask = None
-    flask_sign_response = None
-    get_public_key_endpoint = None
-
-# Django (optional)
-try:
-    from .django import TrustChainMiddleware as DjangoTrustChainMiddleware
-    from .django import get_public_key_view, sign_drf_response
-    from .django import sign_response as django_sign_response
-except ImportError:
-    DjangoTrustChainMiddleware = None
-    django_sign_response = None
-    get_public_key_view = None
-    sign_drf_response = None
-
 __all__ = [
     # FastAPI
     "TrustChainMiddleware",
@@ -143,11 +110,11 @@ __all__ = [
     "django_sign_response",
     "get_public_key_view",
     "sign_drf_response",
-    # LangChain (lazy)
+    # LangChain
     "to_langchain_tool",
     "to_langchain_tools",
     "TrustChainLangChainTool",
-    # LangSmith (lazy)
+    # LangSmith
     "TrustChainCallbackHandler",
     # Pydantic v2
     "TrustChainModel",
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import time
 import uuid
+from collections import Counter
 from typing import Any
 
 try:
@@ -36,7 +37,48 @@ except ImportError:
         HAS_LANGCHAIN = False
         BaseCallbackHandler = object  # type: ignore
 
-from trustchain.v2.signer import SignedResponse, Signer
+from trustchain.v2.signer import SignedResponse, Signer, _uuid4_str
+
+# Tool outputs are recorded truncated to this many characters.
+_OUTPUT_LIMIT = 1000
+
+_CONTAINER_BRACKETS = {list: ("[", "]"), tuple: ("(", ")"), dict: ("{", "}")}
+
+
+def _truncated_str(value: Any, limit: int = _OUTPUT_LIMIT) -> str:
+    """``str(value)[:limit]`` that stops early on large lists/tuples/dicts.
+
+    Plain containers are rendered item by item, exactly as ``str()`` would,
+    until ``limit`` characters exist, so a tool returning thousands of
+    documents is not stringified in full just to keep the first 1000 chars.
+    """
+    kind = type(value)
+    if kind is str:
+        return value[:limit]
+    if kind not in _CONTAINER_BRACKETS or (kind is tuple and len(value) == 1):
+        return str(value)[:limit]
+
+    opening, closing = _CONTAINER_BRACKETS[kind]
+    if kind is dict:
+        items = (f"{k!r}: {v!r}" for k, v in value.items())
+    else:
+        items = map(repr, value)
+    parts = [opening]
+    size = 1
+    for index, item in enumerate(items):
+        if "..." in item:
+            # Possibly a cycle back to ``value``: rendered on its own the item
+            # repeats ``value`` instead of str()'s "[...]" marker.
+            return str(value)[:limit]
+        if index:
+            parts.append(", ")
+            size += 2
+        parts.append(item)
+        size += len(item)
+        if size >= limit:
+            return "".join(parts)[:limit]
+    parts.append(closing)
+    return "".join(parts)[:limit]
 
 
 class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object):  # type: ignore
@@ -86,8 +128,12 @@ class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object
         self._sign_outputs = sign_outputs
         self._metadata = metadata or {}
         self._chain: list[SignedResponse] = []
-        self._chain_id = str(uuid.uuid4())
-        self._pending_tools: dict[str, dict[str, Any]] = {}
+        # Signature / parent columns of _chain, kept side by side so the link
+        # check is one C-level list comparison.
+        self._sigs: list[str] = []
+        self._parents: list[str | None] = []
+        self._chain_id = _uuid4_str()
+        self._pending_tools: dict[uuid.UUID, dict[str, Any]] = {}
 
     @property
     def chain_id(self) -> str:
@@ -105,7 +151,9 @@ class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object
     def clear_chain(self) -> None:
         """Clear the signed chain and start fresh."""
         self._chain = []
-        self._chain_id = str(uuid.uuid4())
+        self._sigs = []
+        self._parents = []
+        self._chain_id = _uuid4_str()
 
     def get_chain_stats(self) -> dict[str, Any]:
         """Get statistics about the current chain.
@@ -113,29 +161,23 @@ class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object
         Returns:
             dict with chain_id, count, tools, etc.
         """
-        tools = {}
-        for response in self._chain:
-            tool_id = response.tool_id
-            if tool_id not in tools:
-                tools[tool_id] = 0
-            tools[tool_id] += 1
-
         return {
             "chain_id": self._chain_id,
             "count": len(self._chain),
-            "tools": tools,
+            "tools": dict(Counter(r.tool_id for r in self._chain)),
             "has_linked_chain": self._has_linked_chain(),
         }
 
+    def verify_chain_batch(self) -> bool:
+        """Verify every signature in the chain and its parent links.
+
+        Signatures are checked in one ``Signer.verify_batch`` call.
+        """
+        return self._has_linked_chain() and all(self._signer.verify_batch(self._chain))
+
     def _has_linked_chain(self) -> bool:
         """Check if chain has proper parent links."""
-        if len(self._chain) <= 1:
-            return True
-
-        for i in range(1, len(self._chain)):
-            if self._chain[i].parent_signature != self._chain[i - 1].signature:
-                return False
-        return True
+        return self._parents[1:] == self._sigs[:-1]
 
     def _sign(
         self,
@@ -144,7 +186,7 @@ class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object
         event_type: str = "output",
     ) -> SignedResponse:
         """Sign data and add to chain."""
-        parent_sig = self._chain[-1].signature if self._chain else None
+        parent_sig = self._sigs[-1] if self._sigs else None
 
         full_data = {
             "data": data,
@@ -160,6 +202,8 @@ class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object
         )
 
         self._chain.append(response)
+        self._sigs.append(response.signature)
+        self._parents.append(response.parent_signature)
         return response
 
     # LangChain Callback Methods
@@ -179,8 +223,8 @@ class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object
         """Called when a tool starts running."""
         tool_name = serialized.get("name", "unknown_tool")
 
-        # Store pending tool info
-        self._pending_tools[str(run_id)] = {
+        # Store pending tool info (keyed on the UUID itself, no formatting)
+        self._pending_tools[run_id] = {
             "name": tool_name,
             "input": input_str,
             "start_time": time.time(),
@@ -208,7 +252,7 @@ class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object
         **kwargs: Any,
     ) -> None:
         """Called when a tool finishes successfully."""
-        pending = self._pending_tools.pop(str(run_id), {})
+        pending = self._pending_tools.pop(run_id, {})
         tool_name = pending.get("name", "unknown_tool")
 
         if self._sign_outputs:
@@ -217,7 +261,7 @@ class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object
             self._sign(
                 tool_id=f"{tool_name}:output",
                 data={
-                    "output": str(output)[:1000],  # Truncate large outputs
+                    "output": _truncated_str(output),  # Truncate large outputs
                     "run_id": str(run_id),
                     "duration_ms": int(duration * 1000),
                 },
@@ -233,7 +277,7 @@ class TrustChainCallbackHandler(BaseCallbackHandler if HAS_LANGCHAIN else object
         **kwargs: Any,
     ) -> None:
         """Called when a tool errors."""
-        pending = self._pending_tools.pop(str(run_id), {})
+        pending = self._pending_tools.pop(run_id, {})
         tool_name = pending.get("name", "unknown_tool")
 
         self._sign(
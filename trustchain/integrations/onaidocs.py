@@ -6,36 +6,139 @@ OnaiDocs MCP TrustChain endpoints.
 
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
+import threading
+import urllib.error
+import urllib.parse
 import urllib.request
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+# Shared compact encoder for request bodies (no per-call encoder setup).
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
 
-def _http_json(
-    url: str, method: str = "GET", payload: dict | None = None
-) -> dict[str, Any]:
-    if not url.lower().startswith(("http://", "https://")):
-        raise ValueError("URL must use http or https scheme")
-    data = None
-    headers = {"Content-Type": "application/json"}
-    if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(url, method=method, data=data, headers=headers)
-    with urllib.request.urlopen(req, timeout=10) as resp:  # nosec B310
-        raw = resp.read().decode("utf-8")
-        return json.loads(raw) if raw else {}
+
+def _uses_proxy(parts: urllib.parse.SplitResult) -> bool:
+    """True when urllib would route this URL through an environment proxy."""
+    return parts.scheme in urllib.request.getproxies() and not (
+        urllib.request.proxy_bypass(parts.hostname or "")
+    )
 
 
 @dataclass
 class OnaiDocsTrustClient:
+    """Client for the OnaiDocs TrustChain API.
+
+    Requests reuse one keep-alive connection per client (TCP/TLS set up
+    once), guarded by a lock so a client can be shared between threads.
+    If urllib would route ``base_url`` through an environment proxy
+    (checked once, at construction) each request falls back to a plain
+    ``urlopen``. Errors keep urlopen's contract: ``HTTPError`` for error
+    statuses, ``URLError`` for connection failures and timeouts; a 3xx
+    reply is replayed through ``urlopen`` so redirects are followed.
+    """
+
     base_url: str = "http://localhost:9323"
+    _api_root: str = field(init=False, repr=False, compare=False)
+    _parts: urllib.parse.SplitResult = field(init=False, repr=False, compare=False)
+    _via_proxy: bool = field(init=False, repr=False, compare=False)
+    _conn: http.client.HTTPConnection | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._api_root = self.base_url.rstrip("/") + "/api/trustchain"
+        self._parts = urllib.parse.urlsplit(self._api_root)
+        if self._parts.scheme.lower() not in ("http", "https"):
+            raise ValueError("URL must use http or https scheme")
+        self._via_proxy = _uses_proxy(self._parts)
+
+    def _request(
+        self, path: str, method: str = "GET", payload: dict | None = None
+    ) -> bytes:
+        """Send ``method`` to ``<api root><path>`` and return the raw body."""
+        url = self._api_root + path
+        data = None
+        headers = {"Content-Type": "application/json"}
+        if payload is not None:
+            data = _JSON_ENCODER.encode(payload).encode("utf-8")
+        if self._via_proxy:
+            return self._urlopen(url, method, data, headers)
+
+        target = self._parts.path + path
+        with self._lock:
+            while True:
+                reused = self._conn is not None
+                conn = self._conn or self._connect()
+                try:
+                    conn.request(method, target, body=data, headers=headers)
+                    resp = conn.getresponse()
+                    raw = resp.read()
+                except Exception as exc:
+                    conn.close()
+                    self._conn = None
+                    if reused and isinstance(
+                        exc, (http.client.HTTPException, ConnectionError)
+                    ):
+                        continue  # server dropped an idle keep-alive socket
+                    if isinstance(exc, (OSError, http.client.HTTPException)):
+                        raise urllib.error.URLError(exc) from exc
+                    raise
+                if resp.will_close:
+                    conn.close()
+                    self._conn = None
+                else:
+                    self._conn = conn
+                break
+        if 300 <= resp.status < 400 and resp.getheader("Location"):
+            # Let urllib apply its redirect rules, as before pooling.
+            return self._urlopen(url, method, data, headers)
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(
+                url, resp.status, resp.reason, resp.headers, None
+            )
+        return raw
+
+    @staticmethod
+    def _urlopen(
+        url: str, method: str, data: bytes | None, headers: dict[str, str]
+    ) -> bytes:
+        req = urllib.request.Request(url, method=method, data=data, headers=headers)
+        with urllib.request.urlopen(req, timeout=10) as resp:  # nosec B310
+            return resp.read()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        parts = self._parts
+        cls = (
+            http.client.HTTPSConnection
+            if parts.scheme.lower() == "https"
+            else http.client.HTTPConnection
+        )
+        return cls(parts.hostname or "", parts.port, timeout=10)
+
+    def _request_json(
+        self, path: str, method: str = "GET", payload: dict | None = None
+    ) -> dict[str, Any]:
+        raw = self._request(path, method=method, payload=payload)
+        return json.loads(raw) if raw else {}  # json.loads takes UTF-8 bytes
+
+    def close(self) -> None:
+        """Close the pooled connection (a later request reopens it)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def verify_response(
         self, tool_name: str, arguments: dict[str, Any], trustchain: dict[str, Any]
     ) -> dict[str, Any]:
-        return _http_json(
-            f"{self.base_url.rstrip('/')}/api/trustchain/verify-response",
+        return self._request_json(
+            "/verify-response",
             method="POST",
             payload={
                 "name": tool_name,
@@ -44,23 +147,24 @@ class OnaiDocsTrustClient:
             },
         )
 
+    async def averify_response(
+        self, tool_name: str, arguments: dict[str, Any], trustchain: dict[str, Any]
+    ) -> dict[str, Any]:
+        """``verify_response`` for async agents, run in a worker thread."""
+        return await asyncio.to_thread(
+            self.verify_response, tool_name, arguments, trustchain
+        )
+
     def export_session(
         self, session_id: str, fmt: str = "json", limit: int = 500
     ) -> Any:
-        url = f"{self.base_url.rstrip('/')}/api/trustchain/session/{session_id}/export?format={fmt}&limit={limit}"
-        if not url.lower().startswith(("http://", "https://")):
-            raise ValueError("URL must use http or https scheme")
-        req = urllib.request.Request(url, method="GET")
-        with urllib.request.urlopen(req, timeout=10) as resp:  # nosec B310
-            text = resp.read().decode("utf-8")
-            if fmt.lower() == "html":
-                return text
-            return json.loads(text)
+        raw = self._request(f"/session/{session_id}/export?format={fmt}&limit={limit}")
+        if fmt.lower() == "html":
+            return raw.decode("utf-8")
+        return json.loads(raw)
 
     def get_events(
         self, limit: int = 100, session_id: str | None = None
     ) -> dict[str, Any]:
         extra = f"&session_id={session_id}" if session_id else ""
-        return _http_json(
-            f"{self.base_url.rstrip('/')}/api/trustchain/events?limit={limit}{extra}"
-        )
+        return self._request_json(f"/events?limit={limit}{extra}")
@@ -19,7 +19,6 @@ Example:
 from __future__ import annotations
 
 import time
-import uuid
 from typing import Any, ClassVar, TypeVar
 
 try:
@@ -30,7 +29,7 @@ except ImportError:
     HAS_PYDANTIC = False
     BaseModel = object  # type: ignore
 
-from trustchain.v2.signer import SignedResponse, Signer
+from trustchain.v2.signer import SignedResponse, Signer, _uuid4_str
 
 T = TypeVar("T", bound="TrustChainModel")
 
@@ -91,9 +90,9 @@ class TrustChainModel(BaseModel if HAS_PYDANTIC else object):  # type: ignore
 
     # Private attributes for signing
     _signature: str = PrivateAttr(default="")
-    _signature_id: str = PrivateAttr(default_factory=lambda: str(uuid.uuid4()))
+    _signature_id: str = PrivateAttr(default="")  # set by _sign()
     _timestamp: float = PrivateAttr(default_factory=time.time)
-    _nonce: str = PrivateAttr(default_factory=lambda: str(uuid.uuid4()))
+    _nonce: str = PrivateAttr(default_factory=_uuid4_str)
     _signer: ClassVar[Signer | None] = None
 
     def __init__(self, **data):
@@ -122,9 +121,13 @@ class TrustChainModel(BaseModel if HAS_PYDANTIC else object):  # type: ignore
             data=self.model_dump(),
             nonce=self._nonce,
         )
-        self._signature = response.signature
-        self._timestamp = response.timestamp
-        self._signature_id = response.signature_id
+        # Write the private attrs straight into Pydantic's private store;
+        # going through __setattr__ dispatches per attribute for nothing.
+        self.__pydantic_private__.update(
+            _signature=response.signature,
+            _timestamp=response.timestamp,
+            _signature_id=response.signature_id,
+        )
 
     def _get_canonical_data(self) -> dict[str, Any]:
         """Get canonical representation for signing."""
@@ -220,7 +223,9 @@ class SignedDict(dict):
         self._signer = Signer()
         self._tool_id = tool_id
 
-        response = self._signer.sign(tool_id=tool_id, data=dict(self))
+        # The response is read for its signature fields only, so the dict
+        # itself can be signed without taking a copy.
+        response = self._signer.sign(tool_id=tool_id, data=self)
         self._signature = response.signature
         self._timestamp = response.timestamp
         self._signature_id = response.signature_id
@@ -238,7 +243,7 @@ class SignedDict(dict):
         """Verify the signature."""
         response = SignedResponse(
             tool_id=self._tool_id,
-            data=dict(self),
+            data=self,  # verify only serializes it; no copy needed
             signature=self._signature,
             signature_id=self._signature_id,
             timestamp=self._timestamp,
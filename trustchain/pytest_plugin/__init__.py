@@ -16,12 +16,13 @@ Usage:
         return my_tool()
 """
 
-from .fixtures import async_tc, signed_chain, tc
+from .fixtures import async_tc, signed_chain, tc, tc_session
 from .plugin import TrustChainPlugin
 
 __all__ = [
     "TrustChainPlugin",
     "tc",
+    "tc_session",
     "async_tc",
     "signed_chain",
 ]
@@ -2,6 +2,7 @@
 
 Provides:
     - tc: Sync TrustChain instance fixture
+    - tc_session: TrustChain instance shared by the whole test session
     - async_tc: Async TrustChain instance fixture
     - signed_chain: Chain collector fixture
 """
@@ -26,6 +27,22 @@ def tc():
     return TrustChain()
 
 
+@pytest.fixture(scope="session")
+def tc_session():
+    """Fixture providing one TrustChain instance for the whole session.
+
+    Key generation and setup run once instead of per test. State (chain,
+    nonces, registered tools) is shared, so use ``tc`` for tests that
+    need isolation.
+
+    Example:
+        def test_many_signatures(tc_session):
+            result = tc_session.sign("test", {"value": 42})
+            assert tc_session._signer.verify(result)
+    """
+    return TrustChain()
+
+
 @pytest.fixture
 def tc_config():
     """Fixture providing TrustChain with custom config.
@@ -85,10 +102,7 @@ class SignedChainCollector(list):
 
     def verify_all(self, tc: TrustChain) -> bool:
         """Verify all responses in chain."""
-        for response in self:
-            if not tc._signer.verify(response):
-                return False
-        return True
+        return all(tc._signer.verify_batch(self))
 
     def get_tool_ids(self) -> List[str]:
         """Get list of tool IDs in chain."""
@@ -10,7 +10,7 @@ import pytest
 
 from trustchain import SignedResponse, TrustChain
 
-from .fixtures import SignedChainCollector, async_tc, signed_chain, tc
+from .fixtures import SignedChainCollector, async_tc, signed_chain, tc, tc_session
 
 # Fixtures are imported above and re-exported via __all__ at the bottom
 
@@ -47,6 +47,26 @@ class TrustChainPlugin:
         self.tc = TrustChain()
         self.responses: list = []
         self.test_results: dict = {}
+        # id(response) -> (response, verified). Keeping the response alive
+        # pins its id; keying on the signature alone would let a tampered
+        # copy inherit the original's result.
+        self._verify_cache: dict[int, tuple[SignedResponse, bool]] = {}
+
+    def _verified(self, response: SignedResponse) -> bool:
+        """Signature check, run at most once per response per session."""
+        cached = self._verify_cache.get(id(response))
+        if cached is None:
+            cached = (response, self.tc._signer.verify(response))
+            self._verify_cache[id(response)] = cached
+        return cached[1]
+
+    def _verified_many(self, responses: list) -> list[bool]:
+        """``_verified`` for many responses; uncached ones are checked in one batch."""
+        cache = self._verify_cache
+        pending = [r for r in responses if id(r) not in cache]
+        for response, ok in zip(pending, self.tc._signer.verify_batch(pending)):
+            cache[id(response)] = (response, ok)
+        return [cache[id(r)][1] for r in responses]
 
     @pytest.hookimpl(hookwrapper=True)
     def pytest_runtest_call(self, item):
@@ -55,15 +75,17 @@ class TrustChainPlugin:
         marker = item.get_closest_marker("trustchain_verify")
 
         outcome = yield
+        if marker is None or outcome.excinfo is not None:
+            return
 
-        if marker and outcome.excinfo is None:
-            # Get test result if it's a SignedResponse
-            result = getattr(item, "_trustchain_result", None)
-            if isinstance(result, SignedResponse):
-                if not self.tc._signer.verify(result):
-                    if self.config.getoption("trustchain_strict"):
-                        pytest.fail("SignedResponse verification failed")
+        # Get test result if it's a SignedResponse
+        result = getattr(item, "_trustchain_result", None)
+        if isinstance(result, SignedResponse):
+            if not self._verified(result):
+                if self.config.getoption("trustchain_strict"):
+                    pytest.fail("SignedResponse verification failed")
 
+    @pytest.hookimpl(trylast=True)
     def pytest_sessionfinish(self, session):
         """Generate report at end of session."""
         report_path = self.config.getoption("trustchain_report")
@@ -102,14 +124,14 @@ class TrustChainPlugin:
             <div class="stat-label">Tests Run</div>
         </div>
         <div class="stat">
-            <div class="stat-value">{sum(1 for r in self.responses if self.tc._signer.verify(r))}</div>
+            <div class="stat-value">{sum(self._verified_many(self.responses))}</div>
             <div class="stat-label">Verified</div>
         </div>
     </div>
 </body>
 </html>"""
-        with open(path, "w") as f:
-            f.write(html)
+        with open(path, "wb") as f:
+            f.write(html.encode("utf-8"))
 
 
 def pytest_configure(config):
@@ -120,8 +142,18 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "trustchain_sign(tool_id): mark test to auto-sign the return value"
     )
-    config.pluginmanager.register(TrustChainPlugin(config), "trustchain")
+    # The hooks only matter for reports and strict mode; without either,
+    # skip registering them so unrelated suites pay no per-test cost.
+    if config.getoption("trustchain_report") or config.getoption("trustchain_strict"):
+        config.pluginmanager.register(TrustChainPlugin(config), "trustchain")
 
 
 # Re-export fixtures for pytest discovery (imported at top)
-__all__ = ["tc", "async_tc", "signed_chain", "SignedChainCollector", "TrustChainPlugin"]
+__all__ = [
+    "tc",
+    "tc_session",
+    "async_tc",
+    "signed_chain",
+    "SignedChainCollector",
+    "TrustChainPlugin",
+]
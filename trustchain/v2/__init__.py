@@ -4,18 +4,11 @@ TrustChain v2 - Cryptographically signed AI tool responses.
 Enterprise-ready: Redis, Prometheus, multi-tenancy, REST API, TSA.
 """
 
-from .async_core import AsyncTrustChain, AsyncTrustChainSession
-from .certificate import (
-    ToolCertificate,
-    ToolRegistry,
-    UntrustedToolError,
-    compute_code_hash,
-    trustchain_certified,
-)
+import importlib
+
 from .chain_store import ChainStore
 from .config import TrustChainConfig
 from .core import TrustChain
-from .logging import get_logger, setup_logging
 from .metrics import TrustChainMetrics, get_metrics
 from .nonce_storage import (
     AdapterNonceStorage,
@@ -24,14 +17,42 @@ from .nonce_storage import (
     RedisNonceStorage,
     adapt_nonce_storage,
 )
-from .pg_verifiable_log import PostgresVerifiableChainStore
-from .session import TrustChainSession, create_session
 from .signer import SignedResponse
-from .storage import FileStorage, MemoryStorage, Storage
-from .tenants import TenantInfo, TenantManager
-from .tsa import TSAClient, TSAError, TSAResponse, TSAVerifyResult, get_tsa_client
+from .storage import (
+    FileStorage,
+    MemoryStorage,
+    PackedStorage,
+    Storage,
+    open_file_storage,
+)
 from .verifiable_log import InclusionProof, VerifiableChainStore
-from .verifier import TrustChainVerifier, VerificationResult
+
+# PEP 562: modules that TrustChain itself does not need are imported on
+# first attribute access. psycopg (pulled in by the Postgres log) is only
+# imported when the Postgres backend is actually used.
+_LAZY_EXPORTS: dict[str, str] = {
+    "AsyncTrustChain": ".async_core",
+    "AsyncTrustChainSession": ".async_core",
+    "ToolCertificate": ".certificate",
+    "ToolRegistry": ".certificate",
+    "UntrustedToolError": ".certificate",
+    "compute_code_hash": ".certificate",
+    "trustchain_certified": ".certificate",
+    "get_logger": ".logging",
+    "setup_logging": ".logging",
+    "PostgresVerifiableChainStore": ".pg_verifiable_log",
+    "TrustChainSession": ".session",
+    "create_session": ".session",
+    "TenantInfo": ".tenants",
+    "TenantManager": ".tenants",
+    "TSAClient": ".tsa",
+    "TSAError": ".tsa",
+    "TSAResponse": ".tsa",
+    "TSAVerifyResult": ".tsa",
+    "get_tsa_client": ".tsa",
+    "TrustChainVerifier": ".verifier",
+    "VerificationResult": ".verifier",
+}
 
 # NOTE: X.509 CA / agent PKI (`trustchain.v2.x509_pki`) is intentionally NOT
 # re-exported here. The internal CA hierarchy is a TrustChain Platform
@@ -41,6 +62,19 @@ from .verifier import TrustChainVerifier, VerificationResult
 
 __version__ = "3.0.0"
 
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals().keys()) + list(_LAZY_EXPORTS.keys()))
+
+
 __all__ = [
     # Core
     "TrustChain",
@@ -56,6 +90,8 @@ __all__ = [
     # Chain persistence
     "ChainStore",
     "FileStorage",
+    "PackedStorage",
+    "open_file_storage",
     # Verifiable Append-Only Log (Certificate Transparency)
     "PostgresVerifiableChainStore",  # v3 default (ADR-SEC-002)
     "VerifiableChainStore",  # deprecated: chain.log + SQLite
@@ -18,12 +18,11 @@ Example:
 import asyncio
 import functools
 import time
-import uuid
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from .config import TrustChainConfig
 from .nonce_storage import NonceStorage, create_nonce_storage
-from .signer import SignedResponse, Signer
+from .signer import SignedResponse, Signer, _uuid4_str
 from .storage import MemoryStorage, Storage
 
 
@@ -90,10 +89,12 @@ class AsyncTrustChain:
                 # Wrap sync function to be async
                 @functools.wraps(func)
                 async def sync_to_async_wrapper(*args, **kwargs):
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(
-                        None, functools.partial(func, *args, **kwargs)
-                    )
+                    loop = asyncio.get_running_loop()
+                    if kwargs:
+                        call = functools.partial(func, *args, **kwargs)
+                        result = await loop.run_in_executor(None, call)
+                    else:
+                        result = await loop.run_in_executor(None, func, *args)
                     return await self._sign_result(tool_id, result)
 
                 return sync_to_async_wrapper
@@ -120,28 +121,26 @@ class AsyncTrustChain:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> SignedResponse:
         """Sign a result with optional parent chain link."""
-        async with self._lock:
-            nonce = None
-            if self.config.enable_nonce:
-                # uuid4 keeps the nonce unique even when time.time_ns() has
-                # coarse resolution (Windows) and consecutive signs share a tick.
-                nonce = f"{time.time_ns()}-{id(self)}-{uuid.uuid4().hex}"
-
-            response = self._signer.sign(
-                tool_id=tool_id,
-                data=result,
-                nonce=nonce,
-                parent_signature=parent_signature,
-                metadata=metadata,
-                certificate=self.config.certificate,
-            )
-
-            # Store for verification
-            await asyncio.to_thread(
-                self._storage.store, response.signature, response.to_dict()
-            )
-
-            return response
+        # No lock and no await: signing is pure and the in-memory storage is
+        # only touched from the event loop thread, so concurrent calls can't
+        # interleave here.
+        # Random nonces come from the signer's batched pool (one urandom()
+        # per 256 signs); they stay unique across processes sharing a store.
+        nonce = _uuid4_str() if self.config.enable_nonce else None
+
+        response = self._signer.sign(
+            tool_id=tool_id,
+            data=result,
+            nonce=nonce,
+            parent_signature=parent_signature,
+            metadata=metadata,
+            certificate=self.config.certificate,
+        )
+
+        # Store for verification
+        self._storage.store(response.signature, response.to_dict())
+
+        return response
 
     async def sign(
         self,
@@ -187,16 +186,24 @@ class AsyncTrustChain:
 
         # Check nonce for replay protection
         if self.config.enable_nonce and self._nonce_storage and response.nonce:
-            async with self._lock:
-                is_new = await asyncio.to_thread(
-                    self._nonce_storage.check_and_add,
-                    response.nonce,
-                    self.config.nonce_ttl,
+            nonce_storage = self._nonce_storage
+            if nonce_storage.is_sync_fast:
+                # In-process check: cheaper than a thread hop, and atomic on
+                # the event loop thread without the lock.
+                is_new = nonce_storage.check_and_add(
+                    response.nonce, self.config.nonce_ttl
                 )
-                if not is_new:
-                    from trustchain.utils.exceptions import NonceReplayError
+            else:
+                async with self._lock:
+                    is_new = await asyncio.to_thread(
+                        nonce_storage.check_and_add,
+                        response.nonce,
+                        self.config.nonce_ttl,
+                    )
+            if not is_new:
+                from trustchain.utils.exceptions import NonceReplayError
 
-                    raise NonceReplayError(f"Nonce already used: {response.nonce}")
+                raise NonceReplayError(f"Nonce already used: {response.nonce}")
 
         # Verify signature
         return self._signer.verify(response)
@@ -216,29 +223,35 @@ class AsyncTrustChain:
         if not responses:
             return True
 
-        for i, response in enumerate(responses):
-            # Verify signature
-            if not await self.verify(response):
+        # Chain links first: cheap, and a broken chain consumes no nonces
+        for prev, response in zip(responses, responses[1:]):
+            if response.parent_signature != prev.signature:
                 return False
 
-            # Verify chain link (skip first)
-            if i > 0:
-                expected_parent = responses[i - 1].signature
-                if response.parent_signature != expected_parent:
+        if self.config.enable_nonce:
+            # verify() also enforces freshness and replay protection
+            for response in responses:
+                if not await self.verify(response):
                     return False
+            return True
 
-        return True
+        # Without nonces verify() is the bare signature check: run the whole
+        # chain as one batch, off the event loop.
+        verified = await asyncio.to_thread(self._signer.verify_batch, responses)
+        return all(verified)
 
     def session(
         self,
         session_id: str,
         metadata: Optional[Dict[str, Any]] = None,
+        concurrent: bool = False,
     ) -> "AsyncTrustChainSession":
         """Create an async session for automatic chain building.
 
         Args:
             session_id: Unique identifier for this session
             metadata: Optional metadata for all responses
+            concurrent: Serialize sign() calls with a lock
 
         Returns:
             AsyncTrustChainSession async context manager
@@ -249,7 +262,7 @@ class AsyncTrustChain:
                 await s.sign("step2", {"result": "..."})
                 chain = s.get_chain()
         """
-        return AsyncTrustChainSession(self, session_id, metadata)
+        return AsyncTrustChainSession(self, session_id, metadata, concurrent)
 
     def export_public_key(self) -> str:
         """Export public key for external verification."""
@@ -264,6 +277,11 @@ class AsyncTrustChainSession:
     """Async session for building response chains.
 
     Automatically links responses with parent signatures.
+
+    AsyncTrustChain signing never yields to the event loop, so reading the
+    parent and appending are atomic even for concurrent ``sign()`` calls.
+    Pass ``concurrent=True`` to serialize them with a lock anyway, e.g.
+    when ``tc`` is a subclass whose ``sign()`` awaits I/O.
     """
 
     def __init__(
@@ -271,12 +289,13 @@ class AsyncTrustChainSession:
         tc: AsyncTrustChain,
         session_id: str,
         metadata: Optional[Dict[str, Any]] = None,
+        concurrent: bool = False,
     ):
         self._tc = tc
         self.session_id = session_id
         self.metadata = metadata or {}
         self._chain: List[SignedResponse] = []
-        self._lock = asyncio.Lock()
+        self._lock: Optional[asyncio.Lock] = asyncio.Lock() if concurrent else None
 
     async def __aenter__(self) -> "AsyncTrustChainSession":
         return self
@@ -294,21 +313,28 @@ class AsyncTrustChainSession:
 
         Automatically links to previous response.
         """
-        async with self._lock:
-            parent_sig = self._chain[-1].signature if self._chain else None
+        if self._lock is not None:
+            async with self._lock:
+                return await self._sign(tool_id, data, metadata)
+        return await self._sign(tool_id, data, metadata)
+
+    async def _sign(
+        self, tool_id: str, data: Any, metadata: Optional[Dict[str, Any]]
+    ) -> SignedResponse:
+        parent_sig = self._chain[-1].signature if self._chain else None
 
-            merged_metadata = {**self.metadata, **(metadata or {})}
-            merged_metadata["session_id"] = self.session_id
+        merged_metadata = {**self.metadata, **(metadata or {})}
+        merged_metadata["session_id"] = self.session_id
 
-            response = await self._tc.sign(
-                tool_id=tool_id,
-                data=data,
-                metadata=merged_metadata if merged_metadata else None,
-                parent_signature=parent_sig,
-            )
+        response = await self._tc.sign(
+            tool_id=tool_id,
+            data=data,
+            metadata=merged_metadata if merged_metadata else None,
+            parent_signature=parent_sig,
+        )
 
-            self._chain.append(response)
-            return response
+        self._chain.append(response)
+        return response
 
     def get_chain(self) -> List[SignedResponse]:
         """Get the current response chain."""
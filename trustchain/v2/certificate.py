@@ -34,14 +34,31 @@ import functools
 import hashlib
 import inspect
 import json
-from dataclasses import asdict, dataclass, field
+import math
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from .signer import Signer
 
 
+def _expiry_timestamp(expires_at: str) -> float:
+    """POSIX time of an ISO ``expires_at``; inf if empty or unparsable."""
+    if not expires_at:
+        return math.inf
+    try:
+        exp = datetime.fromisoformat(expires_at)
+    except ValueError:
+        return math.inf
+    if exp.tzinfo is None:
+        exp = exp.replace(tzinfo=timezone.utc)
+    return exp.timestamp()
+
+
 @dataclass
 class ToolCertificate:
     """Certificate for a trusted AI tool — the 'SSL cert' for tools."""
@@ -76,25 +93,46 @@ class ToolCertificate:
     )  # e.g. ["read", "write", "execute"]
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Same result as dataclasses.asdict() without its recursive deepcopy;
+        # permissions is the only mutable field.
+        return {
+            "tool_name": self.tool_name,
+            "tool_module": self.tool_module,
+            "version": self.version,
+            "code_hash": self.code_hash,
+            "code_hash_algorithm": self.code_hash_algorithm,
+            "issuer": self.issuer,
+            "issuer_key_id": self.issuer_key_id,
+            "signature": self.signature,
+            "trust_level": self.trust_level,
+            "issued_at": self.issued_at,
+            "expires_at": self.expires_at,
+            "revoked": self.revoked,
+            "revocation_reason": self.revocation_reason,
+            "owner": self.owner,
+            "organization": self.organization,
+            "description": self.description,
+            "permissions": list(self.permissions),
+        }
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "ToolCertificate":
         return cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
 
+    # expires_at parsed to a POSIX timestamp, re-parsed only when the string
+    # changes (plain class attributes, not dataclass fields).
+    _expiry_src = None
+    _expiry_ts = math.inf
+
     @property
     def is_valid(self) -> bool:
         """Check if certificate is currently valid (not revoked, not expired)."""
         if self.revoked:
             return False
-        if self.expires_at:
-            try:
-                exp = datetime.fromisoformat(self.expires_at)
-                if exp < datetime.now(timezone.utc):
-                    return False
-            except ValueError:
-                pass
-        return True
+        if self.expires_at != self._expiry_src:
+            self._expiry_ts = _expiry_timestamp(self.expires_at)
+            self._expiry_src = self.expires_at
+        return time.time() <= self._expiry_ts
 
     @property
     def fingerprint(self) -> str:
@@ -120,6 +158,33 @@ def compute_code_hash(func: Callable) -> str:
         return hashlib.sha256(fallback.encode("utf-8")).hexdigest()
 
 
+# Cap on ToolRegistry's in-memory violation log (oldest entries drop first).
+_MAX_VIOLATIONS = 10_000
+
+# func -> (func.__code__, code hash) for ToolRegistry.verify(). Weak keys
+# drop an entry together with its function; holding the code object and
+# comparing it by identity catches a reassigned ``__code__``.
+_code_hash_cache: "weakref.WeakKeyDictionary[Callable, tuple[Any, str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cached_code_hash(func: Callable) -> str:
+    """``compute_code_hash`` memoized per function and code object."""
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return compute_code_hash(func)
+    try:
+        cached = _code_hash_cache.get(func)
+    except TypeError:  # not weak-referenceable
+        return compute_code_hash(func)
+    if cached is not None and cached[0] is code:
+        return cached[1]
+    code_hash = compute_code_hash(func)
+    _code_hash_cache[func] = (code, code_hash)
+    return code_hash
+
+
 class ToolRegistry:
     """Certificate Authority + Registry for trusted tools.
 
@@ -147,7 +212,8 @@ class ToolRegistry:
         """
         self._certs: Dict[str, ToolCertificate] = {}
         self._tool_keys: Dict[str, str] = {}  # tool_id -> signing public key (b64)
-        self._violations: List[Dict[str, Any]] = []
+        # Bounded so a long-running agent hitting a bad tool can't grow it forever
+        self._violations: Deque[Dict[str, Any]] = deque(maxlen=_MAX_VIOLATIONS)
         self._signer = signer
         self._strict = strict
 
@@ -241,10 +307,14 @@ class ToolRegistry:
         Returns:
             True if tool is trusted, False otherwise
         """
-        tool_name = func.__qualname__
-        tool_module = func.__module__
-        registry_key = f"{tool_module}.{tool_name}"
+        return self.verify_by_key(f"{func.__module__}.{func.__qualname__}", func)
+
+    def verify_by_key(self, registry_key: str, func: Callable) -> bool:
+        """Same as :meth:`verify`, with the ``module.qualname`` key precomputed.
 
+        Used by :func:`trustchain_certified`, which builds the key once at
+        decoration time instead of on every call.
+        """
         # 1. Check certificate exists
         cert = self._certs.get(registry_key)
         if not cert:
@@ -262,7 +332,7 @@ class ToolRegistry:
             return False
 
         # 3. Verify code hash (the critical check)
-        current_hash = compute_code_hash(func)
+        current_hash = _cached_code_hash(func)
         if current_hash != cert.code_hash:
             self._record_violation(
                 registry_key,
@@ -335,8 +405,12 @@ class ToolRegistry:
 
     @property
     def violations(self) -> List[Dict[str, Any]]:
-        """Get all recorded violations."""
-        return self._violations.copy()
+        """Get recorded violations (the most recent ``_MAX_VIOLATIONS``)."""
+        return list(self._violations)
+
+    def last_violation(self) -> Optional[Dict[str, Any]]:
+        """Get the most recent violation without copying the log."""
+        return self._violations[-1] if self._violations else None
 
     # ── Internal ──
 
@@ -411,11 +485,12 @@ def trustchain_certified(
     """
 
     def decorator(func: Callable) -> Callable:
+        registry_key = f"{func.__module__}.{func.__qualname__}"
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if not registry.verify(func):
-                violations = registry.violations
-                last = violations[-1] if violations else {}
+            if not registry.verify_by_key(registry_key, func):
+                last = registry.last_violation() or {}
                 reason = last.get("detail", "No valid certificate")
 
                 if strict:
@@ -427,6 +502,7 @@ def trustchain_certified(
         # Mark as certified for introspection
         wrapper._trustchain_certified = True
         wrapper._trustchain_registry = registry
+        wrapper._trustchain_key = registry_key  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
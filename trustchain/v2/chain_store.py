@@ -32,11 +32,16 @@ Usage:
 """
 
 import hashlib
+import itertools
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .storage import Storage
 
@@ -91,6 +96,50 @@ def verify_record_signature(record: Dict[str, Any], verifier) -> Optional[bool]:
     return bool(verifier.verify(signed).valid)
 
 
+# Below this many records the cost of starting worker processes outweighs
+# the parallel Ed25519 speed-up.
+_PARALLEL_VERIFY_MIN_OPS = 1000
+
+# Storage key of a legacy-path op: op_0001, op_0002, …
+_OP_KEY = re.compile(r"op_(\d+)")
+
+
+def _verify_signature_chunk(
+    public_key: str, records: List[Dict[str, Any]]
+) -> List[Optional[bool]]:
+    """Re-verify a slice of records with one verifier (process-pool worker)."""
+    from .verifier import TrustChainVerifier
+
+    # Chain records are persistent and may be arbitrarily old; disable
+    # the freshness/age window for re-verification.
+    verifier = TrustChainVerifier(public_key, max_age_seconds=None)
+    return [verify_record_signature(r, verifier) for r in records]
+
+
+def _verify_signatures(
+    public_key: str, records: List[Dict[str, Any]], workers: Optional[int] = None
+) -> List[Optional[bool]]:
+    """``verify_record_signature`` for every record, in order.
+
+    With ``workers`` > 1, large chains are split into one chunk per worker
+    and verified in a process pool; otherwise (or on pool start-up failure)
+    they run serially in this process.
+    """
+    if not workers or workers < 2 or len(records) < _PARALLEL_VERIFY_MIN_OPS:
+        return _verify_signature_chunk(public_key, records)
+
+    size = -(-len(records) // workers)
+    chunks = [records[i : i + size] for i in range(0, len(records), size)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+            parts = pool.map(
+                _verify_signature_chunk, itertools.repeat(public_key), chunks
+            )
+            return [res for part in parts for res in part]
+    except (BrokenProcessPool, OSError):
+        return _verify_signature_chunk(public_key, records)
+
+
 def _signature_to_op_map(ops: List[dict]) -> dict[str, dict]:
     m: dict[str, dict] = {}
     for o in ops:
@@ -143,9 +192,13 @@ class ChainStore:
         self._storage = storage
         self._root = Path(root_dir).expanduser().resolve() if root_dir else None
         self._length = 0
+        self._last_seq = 0  # highest op_NNNN number in storage
         self._head: Optional[str] = None  # latest signature
         self._last_parent_sig: Optional[str] = None
         self._vlog = verifiable_log  # VerifiableChainStore (optional)
+        # batch(): HEAD / session refs are flushed once when the batch ends
+        self._batch_depth = 0
+        self._pending_refs: Dict[str, str] = {}
 
         # Initialize from persisted state
         self._load_state()
@@ -216,7 +269,8 @@ class ChainStore:
 
         # Legacy path: Storage backend
         self._length += 1
-        op_id = f"op_{self._length:04d}"
+        self._last_seq += 1
+        op_id = f"op_{self._last_seq:04d}"
 
         record = {
             "id": op_id,
@@ -243,6 +297,11 @@ class ChainStore:
         self._storage.store(op_id, record)
         self._head = signature
         self._last_parent_sig = signature
+        if self._batch_depth:
+            if session_id:
+                self._pending_refs[session_id] = signature
+            return record
+
         self._save_head()
 
         if session_id:
@@ -250,6 +309,26 @@ class ChainStore:
 
         return record
 
+    @contextmanager
+    def batch(self) -> Iterator["ChainStore"]:
+        """Group commits: write HEAD and session refs once, when the batch ends.
+
+        Each commit still writes its own object; only the pointer files are
+        deferred, so N commits cost N + 1 file writes instead of 2N. Nested
+        batches flush at the outermost exit (also on exceptions).
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            # The verifiable log persists its own HEAD on every append.
+            if not self._batch_depth and not self._vlog:
+                self._save_head()
+                pending, self._pending_refs = self._pending_refs, {}
+                for session_id, signature in pending.items():
+                    self._save_ref(session_id, signature)
+
     def head(self) -> Optional[str]:
         """Get current HEAD signature (like `git rev-parse HEAD`)."""
         return self._head
@@ -266,20 +345,23 @@ class ChainStore:
         if self._vlog:
             return self._vlog.log(limit=limit, offset=offset, reverse=False)  # type: ignore[no-any-return]
 
-        all_ops = self._storage.list_all()
-        all_ops.sort(key=lambda x: x.get("id", "") if isinstance(x, dict) else "")
-        return all_ops[offset : offset + limit]
+        return list(itertools.islice(self._iter_ops(), offset, offset + limit))
 
     def log_reverse(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Return chain history newest-first (like `git log` default)."""
         if self._vlog:
             return self._vlog.log(limit=limit, reverse=True)  # type: ignore[no-any-return]
 
-        all_ops = self._storage.list_all()
-        all_ops.sort(
-            key=lambda x: x.get("id", "") if isinstance(x, dict) else "", reverse=True
-        )
-        return all_ops[:limit]
+        return list(itertools.islice(self.iter_log_reverse(), limit))
+
+    def iter_log_reverse(self) -> Iterator[Dict[str, Any]]:
+        """Yield chain history newest-first, loading operations on demand.
+
+        Unlike :meth:`log_reverse`, nothing is read past what the caller
+        consumes — ``itertools.islice(chain.iter_log_reverse(), 20)`` costs
+        20 object reads regardless of chain length.
+        """
+        return self._iter_ops(reverse=True)
 
     def show(self, op_id: str) -> Optional[Dict[str, Any]]:
         """Show a single commit (like `git show <hash>`)."""
@@ -287,22 +369,35 @@ class ChainStore:
             return self._vlog.show(op_id)  # type: ignore[no-any-return]
         return self._storage.get(op_id)
 
-    def blame(self, tool: str, limit: int = 50) -> List[Dict[str, Any]]:
+    def blame(
+        self, tool: str, limit: int = 50, newest_first: bool = False
+    ) -> List[Dict[str, Any]]:
         """Find all operations by a specific tool (like `git blame`).
 
         Useful for forensic investigation: "show me every time
         the agent ran bash_tool".
+
+        File-backed chains with a tool index (see ``update_tool_index``)
+        fetch only ``limit`` objects instead of scanning the chain.
         """
         if self._vlog:
             return self._vlog.blame(tool, limit=limit)  # type: ignore[no-any-return]
 
-        all_ops = self._storage.list_all()
-        results = [
-            op for op in all_ops if isinstance(op, dict) and op.get("tool") == tool
-        ]
-        return results[:limit]
+        ids = self._tool_index_ids(tool)
+        ops: Iterator[Optional[Dict[str, Any]]]
+        if ids is None:
+            ops = self._iter_ops(reverse=newest_first)
+        else:
+            ops = (
+                self._storage.get(op_id)
+                for op_id in (reversed(ids) if newest_first else ids)
+            )
+        matches = (op for op in ops if isinstance(op, dict) and op.get("tool") == tool)
+        return list(itertools.islice(matches, limit))
 
-    def verify(self, public_key: Optional[str] = None) -> Dict[str, Any]:
+    def verify(
+        self, public_key: Optional[str] = None, workers: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Verify the integrity of the entire chain (like `git fsck`).
 
         Structural checks (always run):
@@ -316,6 +411,10 @@ class ChainStore:
             store has no key material, so signatures are NOT re-verified —
             the result then reflects link/structure integrity only.
 
+        ``workers`` opts file-backed chains into re-verifying signatures in
+        a process pool of that size (for large chains only). The default
+        never starts processes, so library hosts are not forked implicitly.
+
         With VerifiableChainStore/Postgres: O(1) Merkle root comparison plus
         optional per-record signature re-verification.
         """
@@ -341,70 +440,59 @@ class ChainStore:
             }
 
         # Optional cryptographic re-verification of every record's signature.
-        verifier = None
         sigs_verified = 0
         sigs_unverifiable = 0
         if public_key:
-            from .verifier import TrustChainVerifier
-
-            # Chain records are persistent and may be arbitrarily old; disable
-            # the freshness/age window for re-verification.
-            verifier = TrustChainVerifier(public_key, max_age_seconds=None)
-            for op in all_ops:
-                res = verify_record_signature(op, verifier)
+            for index, res in enumerate(
+                _verify_signatures(public_key, all_ops, workers)
+            ):
                 if res is True:
                     sigs_verified += 1
                 elif res is None:
                     sigs_unverifiable += 1
                 else:
+                    op = all_ops[index]
                     broken.append(
                         {
-                            "index": all_ops.index(op),
+                            "index": index,
                             "id": op.get("id"),
                             "error": "invalid_signature",
                             "signature": op.get("signature"),
                         }
                     )
 
-        for i in range(1, len(all_ops)):
-            this_parent = all_ops[i].get("parent_signature")
-            this_parents = all_ops[i].get("parent_signatures")
+        # Parents must reference an *earlier* op: grow the set as we walk.
+        seen_sigs: set = set()
+        for i, op in enumerate(all_ops):
+            this_parent = op.get("parent_signature")
+            this_parents = op.get("parent_signatures")
 
-            if this_parents is not None:
+            if i == 0:
+                pass
+            elif this_parents is not None:
                 # DAG Verification: ensure all declared parent signatures exist in the chain
                 for p in this_parents:
-                    found = False
-                    for j in range(0, i):
-                        if all_ops[j].get("signature") == p:
-                            found = True
-                            break
-                    if not found:
+                    if p not in seen_sigs:
                         broken.append(
                             {
                                 "index": i,
-                                "id": all_ops[i].get("id"),
+                                "id": op.get("id"),
                                 "expected_parent": p,
                                 "actual_parent": "Missing in DAG",
                             }
                         )
-            else:
+            elif this_parent is not None and this_parent not in seen_sigs:
                 # Tree/Branch Verification
-                if this_parent is not None:
-                    found = False
-                    for j in range(0, i):
-                        if all_ops[j].get("signature") == this_parent:
-                            found = True
-                            break
-                    if not found:
-                        broken.append(
-                            {
-                                "index": i,
-                                "id": all_ops[i].get("id"),
-                                "expected_parent": "Existing signature in DAG",
-                                "actual_parent": this_parent,
-                            }
-                        )
-                # If this_parent is None, it is a new root (orphan branch), which is allowed in DAGs.
+                broken.append(
+                    {
+                        "index": i,
+                        "id": op.get("id"),
+                        "expected_parent": "Existing signature in DAG",
+                        "actual_parent": this_parent,
+                    }
+                )
+            # If this_parent is None, it is a new root (orphan branch), which is allowed in DAGs.
+            seen_sigs.add(op.get("signature"))
 
         return {
             "valid": len(broken) == 0,
@@ -422,17 +510,22 @@ class ChainStore:
         if self._vlog:
             return self._vlog.status()  # type: ignore[no-any-return]
 
-        all_ops = self._storage.list_all()
-        tools_count: Dict[str, int] = {}
-        total_latency = 0.0
-
-        for op in all_ops:
-            if isinstance(op, dict):
+        index = self._tool_index()  # O(ops since the last update_tool_index)
+        if index is not None:
+            summary = index[0]
+            tools_count: Dict[str, int] = summary["tools"]
+            total_latency = float(summary["latency_ms"])
+            total = int(summary["ops"])
+        else:
+            tools_count = {}
+            total_latency = 0.0
+            total = 0
+            for op in self._iter_ops():
                 tool = op.get("tool", "unknown")
                 tools_count[tool] = tools_count.get(tool, 0) + 1
                 total_latency += op.get("latency_ms", 0)
+                total += 1
 
-        total = len(all_ops)
         return {
             "length": total,
             "head": self._head,
@@ -475,6 +568,36 @@ class ChainStore:
             Path(filepath).write_text(json_str, encoding="utf-8")
         return json_str
 
+    def export_json_stream(self, filepath: str) -> int:
+        """Write the same document as :meth:`export_json` one op at a time.
+
+        Peak memory is a single op plus the write buffer instead of the
+        whole chain, so large chains can be exported. Returns the number
+        of exported operations.
+        """
+        if self._vlog:
+            self._vlog.export_json(filepath)
+            return self._vlog.length  # type: ignore[no-any-return]
+
+        def dump(obj: Any, depth: int) -> str:
+            # json.dumps(indent=2) of a value nested ``depth`` levels deep
+            pad = "\n" + "  " * depth
+            return json.dumps(obj, indent=2, default=str).replace("\n", pad)
+
+        count = 0
+        with open(filepath, "w", encoding="utf-8", buffering=1 << 20) as out:
+            out.write(f'{{\n  "head": {dump(self._head, 1)},\n')
+            out.write(f'  "status": {dump(self.status(), 1)},\n')
+            out.write('  "chain": [')
+            for op in self._iter_ops():
+                out.write(",\n    " if count else "\n    ")
+                out.write(dump(op, 2))
+                count += 1
+            out.write("\n  ]" if count else "]")
+            exported_at = datetime.now(timezone.utc).isoformat()
+            out.write(f',\n  "exported_at": {dump(exported_at, 1)}\n}}')
+        return count
+
     # ── Verifiable Log-specific API ──
 
     def inclusion_proof(self, op_id: str) -> Any:
@@ -814,15 +937,175 @@ class ChainStore:
         # `len(list(objects_dir.glob("*.json")))` без read_text/json.loads,
         # и выполняется за миллисекунды даже на сотнях тысяч файлов.
         try:
-            self._length = self._storage.size()
+            keys = self._storage.keys()
+            if keys is None:
+                self._length = self._last_seq = self._storage.size()
+            else:
+                # op ids may have gaps (deleted files): number new ops and
+                # walk the chain up to the highest id, not the op count.
+                seqs = [int(m.group(1)) for m in map(_OP_KEY.fullmatch, keys) if m]
+                self._length = len(seqs)
+                self._last_seq = max(seqs, default=0)
         except Exception:
-            self._length = 0
+            self._length = self._last_seq = 0
         # «derive HEAD from last op» убран намеренно: он требовал list_all
         # (не-ленивый скан всего стоража), а на проде HEAD всегда пишется
         # через _save_head после каждой операции (см. chain_store.append).
         # Если HEAD-файла нет — цепь либо пуста, либо сломана, и full-scan
         # её не восстановит; правильный путь — explicit recovery-инструмент.
 
+    def _iter_ops(
+        self, reverse: bool = False, page_size: int = 256
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily walk operations by sequence number (oldest first by default).
+
+        op ids run ``op_0001`` … ``op_{last}``, so we read them one by one
+        via ``Storage.get`` instead of ``list_all()`` + sort. Missing ids
+        (evicted from MemoryStorage, deleted files) are skipped.
+        The verifiable backend is paged through its SQLite/PG index.
+        """
+        if self._vlog:
+            offset = 0
+            while True:
+                page = self._vlog.log(limit=page_size, offset=offset, reverse=reverse)
+                if not page:
+                    return
+                yield from page
+                offset += len(page)
+
+        last = self._last_seq
+        seq = range(last, 0, -1) if reverse else range(1, last + 1)
+        for n in seq:
+            op = self._storage.get(f"op_{n:04d}")
+            if isinstance(op, dict):
+                yield op
+
+    def update_tool_index(self) -> int:
+        """Persist the per-tool op index under ``refs/tools/``.
+
+        Like git's commit-graph, it is written by explicit maintenance
+        (``tc pack``), not on commit. ``refs/tools/<tool>.idx`` lists op ids per tool and
+        ``refs/tools/INDEXED`` holds the highest covered op number, running
+        totals and
+        the signatures of the first and last covered ops. blame/status read
+        it back and scan only ops committed since; they never write it.
+        An index that no longer matches the stored ops is rebuilt. Returns
+        the highest op number covered.
+        """
+        if self._vlog or not self._root:
+            return 0
+        tools_dir = self._root / "refs" / "tools"
+        summary = self._indexed_summary()
+        tools_dir.mkdir(parents=True, exist_ok=True)
+        if summary is None:
+            summary = self._empty_tool_summary()
+            for stale in tools_dir.glob("*.idx"):
+                stale.unlink(missing_ok=True)
+        for segment, ids in self._index_ops(summary).items():
+            with (tools_dir / f"{segment}.idx").open("a", encoding="utf-8") as f:
+                f.write("".join(f"{op_id}\n" for op_id in ids))
+        marker = tools_dir / "INDEXED"
+        tmp = marker.with_suffix(".tmp")
+        tmp.write_text(json.dumps(summary), encoding="utf-8")
+        os.replace(tmp, marker)
+        return int(summary["length"])
+
+    def _tool_index(self) -> Optional[Tuple[Dict[str, Any], Dict[str, List[str]]]]:
+        """Persisted tool index brought up to date in memory (None → scan).
+
+        Returns the totals for ops ``1..length`` and the op ids per tool
+        segment committed after the persisted index.
+        """
+        summary = self._indexed_summary() if self._root else None
+        if summary is None:
+            return None
+        return summary, self._index_ops(summary)
+
+    def _tool_index_ids(self, tool: str) -> Optional[List[str]]:
+        """op ids indexed for ``tool``, oldest first (None → scan instead)."""
+        try:
+            segment = _safe_ref_segment(tool)
+            index = self._tool_index()
+            if index is None or self._root is None:
+                return None
+            path = self._root / "refs" / "tools" / f"{segment}.idx"
+            try:
+                ids = path.read_text(encoding="utf-8").split()
+            except FileNotFoundError:
+                ids = []
+        except (OSError, ValueError):
+            return None
+        # Two concurrent index updates may both append the same ids.
+        return list(dict.fromkeys(ids + index[1].get(segment, [])))
+
+    @staticmethod
+    def _empty_tool_summary() -> Dict[str, Any]:
+        return {
+            "length": 0,
+            "ops": 0,
+            "tools": {},
+            "latency_ms": 0.0,
+            "first": None,
+            "last": None,
+        }
+
+    def _indexed_summary(self) -> Optional[Dict[str, Any]]:
+        """Load ``refs/tools/INDEXED`` if it still describes the stored ops.
+
+        The marker is trusted only if it covers no more ops than the chain
+        holds and the first and last covered ops still carry the recorded
+        signatures (so not after ``Storage.clear()`` and new commits).
+        """
+        assert self._root is not None
+        try:
+            marker = self._root / "refs" / "tools" / "INDEXED"
+            loaded = json.loads(marker.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not (
+            isinstance(loaded, dict) and set(self._empty_tool_summary()) <= set(loaded)
+        ):
+            return None
+        done = int(loaded["length"])
+        if not 0 < done <= self._last_seq:
+            return None
+        first = self._op_signature(1)
+        last = first if done == 1 else self._op_signature(done)
+        if loaded["first"] != first or loaded["last"] != last:
+            return None
+        return loaded
+
+    def _index_ops(self, summary: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Fold ops after ``summary["length"]`` into ``summary`` in place.
+
+        Returns the new op ids per tool ref segment, oldest first.
+        """
+        tools: Dict[str, int] = summary["tools"]
+        new_ids: Dict[str, List[str]] = {}
+        for n in range(int(summary["length"]) + 1, self._last_seq + 1):
+            op = self._storage.get(f"op_{n:04d}")
+            signature = op.get("signature") if isinstance(op, dict) else None
+            if n == 1:
+                summary["first"] = signature
+            summary["last"] = signature
+            if not isinstance(op, dict):
+                continue
+            tool = op.get("tool", "unknown")
+            tools[tool] = tools.get(tool, 0) + 1
+            summary["ops"] += 1
+            summary["latency_ms"] += op.get("latency_ms", 0)
+            try:
+                segment = _safe_ref_segment(str(op.get("tool", "")))
+            except ValueError:
+                continue
+            new_ids.setdefault(segment, []).append(str(op.get("id", f"op_{n:04d}")))
+        summary["length"] = max(int(summary["length"]), self._last_seq)
+        return new_ids
+
+    def _op_signature(self, n: int) -> Optional[str]:
+        op = self._storage.get(f"op_{n:04d}")
+        return op.get("signature") if isinstance(op, dict) else None
+
     def _save_head(self) -> None:
         """Persist HEAD to file."""
         if self._root and self._head:
@@ -14,9 +14,8 @@ from .chain_store import ChainStore
 from .config import TrustChainConfig
 from .metrics import get_metrics
 from .nonce_storage import NonceStorage, create_nonce_storage
-from .pg_verifiable_log import PostgresVerifiableChainStore
-from .signer import SignedResponse, Signer
-from .storage import FileStorage, MemoryStorage, Storage
+from .signer import SignedResponse, Signer, _uuid4_str
+from .storage import MemoryStorage, Storage, open_file_storage
 from .verifiable_log import VerifiableChainStore
 
 if TYPE_CHECKING:
@@ -128,7 +127,7 @@ class TrustChain:
         if self.config.storage_backend == "memory":
             return MemoryStorage(self.config.max_cached_responses)
         elif self.config.storage_backend == "file":
-            return FileStorage(self.config.chain_dir)
+            return open_file_storage(self.config.chain_dir)
         else:
             raise ValueError(f"Unknown storage backend: {self.config.storage_backend}")
 
@@ -148,6 +147,10 @@ class TrustChain:
 
         backend = self.config.chain_storage
         if backend == "postgres":
+            # Imported here: psycopg is the heaviest import in the package and
+            # only the postgres backend needs it.
+            from .pg_verifiable_log import PostgresVerifiableChainStore
+
             vlog = PostgresVerifiableChainStore(
                 dsn=self.config.chain_dsn,
                 schema=self.config.chain_schema,
@@ -178,7 +181,7 @@ class TrustChain:
                 DeprecationWarning,
                 stacklevel=2,
             )
-            chain_storage = FileStorage(self.config.chain_dir)
+            chain_storage = open_file_storage(self.config.chain_dir)
             return ChainStore(chain_storage, root_dir=self.config.chain_dir)
         if backend == "sqlite":
             raise ValueError(
@@ -774,9 +777,7 @@ class TrustChain:
         Note: Nonces are NOT added to _used_nonces here.
         They are tracked only during verify() to detect replay attacks.
         """
-        import uuid
-
-        return str(uuid.uuid4())
+        return _uuid4_str()
 
     def _check_nonce(self, nonce: str) -> bool:
         """Check if nonce is valid and not already used."""
@@ -14,6 +14,10 @@ from typing import Any, Optional
 class NonceStorage(ABC):
     """Abstract base class for nonce storage backends."""
 
+    # True if check_and_add() is a quick in-process operation that async
+    # callers may run directly on the event loop instead of in a thread.
+    is_sync_fast: bool = False
+
     @abstractmethod
     def check_and_add(self, nonce: str, ttl: int = 300) -> bool:
         """Check if nonce exists, add if not.
@@ -56,6 +60,8 @@ class MemoryNonceStorage(NonceStorage):
     - Doesn't work across multiple instances
     """
 
+    is_sync_fast = True
+
     def __init__(self, maxlen: int = 10000):
         """Initialize memory storage.
 
@@ -20,10 +20,19 @@ Example:
 import json
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from .signer import SignedResponse
 
+# Shared encoder for reports, same output as json.dumps(..., indent=2, default=str)
+# without building a new encoder on every call.
+_REPORT_ENCODER = json.JSONEncoder(indent=2, default=str)
+
+# html.escape() equivalent as a single str.translate() pass.
+_HTML_ESCAPE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
 
 class TrustChainSession:
     """Session for automatic chain building.
@@ -122,19 +131,34 @@ class TrustChainSession:
         Returns:
             JSON string
         """
-        data = {
+        json_str = _REPORT_ENCODER.encode(self._export_data())
+
+        if filepath:
+            with open(filepath, "wb") as f:
+                f.write(json_str.encode("utf-8"))
+
+        return json_str
+
+    def write_json(self, filepath: str) -> None:
+        """Stream the export_json() document to a file.
+
+        The JSON is encoded chunk by chunk, so the full string is never
+        held in memory. Use for long sessions.
+
+        Args:
+            filepath: File path to write to
+        """
+        with open(filepath, "wb", buffering=1 << 20) as f:
+            for chunk in _REPORT_ENCODER.iterencode(self._export_data()):
+                f.write(chunk.encode("utf-8"))
+
+    def _export_data(self) -> Dict[str, Any]:
+        return {
             "session_id": self.session_id,
             "metadata": self.metadata,
             "stats": self.get_stats(),
             "chain": [r.to_dict() for r in self._chain],
         }
-        json_str = json.dumps(data, indent=2, default=str)
-
-        if filepath:
-            with open(filepath, "w") as f:
-                f.write(json_str)
-
-        return json_str
 
     def export_html(self, filepath: str) -> str:
         """Export chain as interactive HTML report.
@@ -151,30 +175,31 @@ class TrustChainSession:
 
             return export_chain_graph(self._chain, filepath, session_id=self.session_id)  # type: ignore[no-any-return]
         except ImportError:
-            # Fallback to simple HTML
-            html = self._generate_simple_html()
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(html)
-            return html
-
-    def _generate_simple_html(self) -> str:
-        """Generate simple HTML report."""
-        steps_html = ""
-        for i, response in enumerate(self._chain):
-            verified = "✅" if self.trustchain.verify(response) else "❌"
-            steps_html += f"""
-            <div class="step">
-                <h3>Step {i + 1}: {response.tool_id} {verified}</h3>
-                <pre>{json.dumps(response.data, indent=2, default=str)}</pre>
-                <small>Signature: {response.signature[:32]}...</small>
-            </div>
-            """
-
-        return f"""
+            # Fallback to simple HTML, written to the file step by step
+            parts = []
+            with open(filepath, "wb", buffering=1 << 20) as f:
+                for part in self._iter_simple_html():
+                    f.write(part.encode("utf-8"))
+                    parts.append(part)
+            return "".join(parts)
+
+    def _iter_simple_html(self) -> Iterator[str]:
+        """Yield the simple HTML report as header, one fragment per step, footer."""
+        chain = self._chain
+        # Each signature is checked once and shared by the header and the
+        # rows. The check is signature-only: TrustChain.verify() would
+        # consume replay nonces and raise on the second pass.
+        verified = self.trustchain._signer.verify_batch(chain)
+        chain_valid = all(verified) and all(
+            cur.parent_signature == prev.signature
+            for prev, cur in zip(chain, chain[1:])
+        )
+        session_id = str(self.session_id).translate(_HTML_ESCAPE)
+        yield f"""
 <!DOCTYPE html>
 <html>
 <head>
-    <title>TrustChain Session: {self.session_id}</title>
+    <title>TrustChain Session: {session_id}</title>
     <style>
         body {{ font-family: system-ui; max-width: 800px; margin: 0 auto; padding: 20px; }}
         .step {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 8px; }}
@@ -184,11 +209,22 @@ class TrustChainSession:
 </head>
 <body>
     <h1>TrustChain Session Report</h1>
-    <p><strong>Session ID:</strong> {self.session_id}</p>
+    <p><strong>Session ID:</strong> {session_id}</p>
     <p><strong>Steps:</strong> {len(self._chain)}</p>
-    <p><strong>Chain Valid:</strong> {"✅ Yes" if self.verify_chain() else "❌ No"}</p>
+    <p><strong>Chain Valid:</strong> {"✅ Yes" if chain_valid else "❌ No"}</p>
     <hr>
-    {steps_html}
+    """
+        for i, (response, ok) in enumerate(zip(chain, verified)):
+            tool_id = response.tool_id.translate(_HTML_ESCAPE)
+            data = _REPORT_ENCODER.encode(response.data).translate(_HTML_ESCAPE)
+            yield f"""
+            <div class="step">
+                <h3>Step {i + 1}: {tool_id} {"✅" if ok else "❌"}</h3>
+                <pre>{data}</pre>
+                <small>Signature: {response.signature[:32]}...</small>
+            </div>
+            """
+        yield """
 </body>
 </html>
         """
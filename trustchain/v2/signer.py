@@ -1,7 +1,10 @@
 """Simple signer for TrustChain v2."""
 
 import base64
+import collections
+import functools
 import json
+import os
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -16,6 +19,31 @@ except ImportError:
     HAS_CRYPTOGRAPHY = False
 
 
+# Pre-formatted random UUID4 strings, refilled from one os.urandom() call.
+_UUID_POOL: "collections.deque[str]" = collections.deque()
+_UUID_POOL_REFILL = 256
+_UUID_VARIANT = "89ab" * 4  # RFC 4122 variant nibble for each 4-bit value
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must never hand out the parent's pending ids.
+    os.register_at_fork(after_in_child=_UUID_POOL.clear)
+
+
+def _uuid4_str() -> str:
+    """``str(uuid.uuid4())`` equivalent, served from a batched pool."""
+    try:
+        return _UUID_POOL.popleft()
+    except IndexError:
+        pass
+    h = os.urandom(16 * _UUID_POOL_REFILL).hex()
+    _UUID_POOL.extend(
+        f"{h[i : i + 8]}-{h[i + 8 : i + 12]}-4{h[i + 13 : i + 16]}-"
+        f"{_UUID_VARIANT[int(h[i + 16], 16)]}{h[i + 17 : i + 20]}-{h[i + 20 : i + 32]}"
+        for i in range(0, 32 * _UUID_POOL_REFILL, 32)
+    )
+    return _UUID_POOL.popleft()
+
+
 @dataclass(frozen=True)
 class SignedResponse:
     """A cryptographically signed response."""
@@ -23,7 +51,7 @@ class SignedResponse:
     tool_id: str
     data: Any
     signature: str
-    signature_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    signature_id: str = field(default_factory=_uuid4_str)
     timestamp: float = field(default_factory=time.time)
     nonce: Optional[str] = None
     parent_signature: Optional[str] = None  # Chain of Trust: link to previous step
@@ -158,12 +186,12 @@ def _canonical_bytes(
     )
 
 
-def _canonical_json_from_response(
+def _canonical_bytes_from_response(
     response: SignedResponse,
     *,
     include_signature_id: bool,
-) -> str:
-    """Serialize canonical payload for verify (legacy omits signature_id)."""
+) -> bytes:
+    """Exact signed bytes for verify (legacy omits signature_id)."""
     sid = response.signature_id if include_signature_id else None
     canonical_data = _build_canonical_data(
         tool_id=response.tool_id,
@@ -182,7 +210,18 @@ def _canonical_json_from_response(
         alg=response.alg,
         canon=response.canon,
     )
-    return _canonical_bytes(canonical_data, response.canon).decode("utf-8")
+    return _canonical_bytes(canonical_data, response.canon)
+
+
+def _canonical_json_from_response(
+    response: SignedResponse,
+    *,
+    include_signature_id: bool,
+) -> str:
+    """Serialize canonical payload for verify (legacy omits signature_id)."""
+    return _canonical_bytes_from_response(
+        response, include_signature_id=include_signature_id
+    ).decode("utf-8")
 
 
 def canonical_input_hash(request: Any) -> str:
@@ -198,6 +237,16 @@ def canonical_input_hash(request: Any) -> str:
     return "sha256:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+@functools.lru_cache(maxsize=64)
+def _load_public_key(public_key_b64: str) -> "ed25519.Ed25519PublicKey":
+    """Parse a base64 Ed25519 public key, cached per key string.
+
+    Key objects are immutable, so one parsed key is shared by every
+    verifier and ``verify_with_public_key`` call for the same key.
+    """
+    return ed25519.Ed25519PublicKey.from_public_bytes(base64.b64decode(public_key_b64))
+
+
 def verify_with_public_key(response: SignedResponse, public_key_b64: str) -> bool:
     """Verify a SignedResponse's Ed25519 signature against a SPECIFIC public key.
 
@@ -208,24 +257,34 @@ def verify_with_public_key(response: SignedResponse, public_key_b64: str) -> boo
     if not HAS_CRYPTOGRAPHY:
         return False
     try:
-        pub = ed25519.Ed25519PublicKey.from_public_bytes(
-            base64.b64decode(public_key_b64)
-        )
+        pub = _load_public_key(public_key_b64)
         signature_bytes = base64.b64decode(response.signature)
     except Exception:
         return False
     for include_sid in (True, False):
         try:
-            json_data = _canonical_json_from_response(
+            signed_bytes = _canonical_bytes_from_response(
                 response, include_signature_id=include_sid
             )
-            pub.verify(signature_bytes, json_data.encode("utf-8"))
+            pub.verify(signature_bytes, signed_bytes)
             return True
         except Exception:
             continue
     return False
 
 
+# Below this many responses, starting worker processes costs more than the
+# parallel Ed25519 verification saves.
+_PARALLEL_VERIFY_MIN = 1000
+
+
+def _verify_batch_chunk(
+    public_key_b64: str, responses: list[SignedResponse]
+) -> list[bool]:
+    """``verify_with_public_key`` over a slice (process-pool worker)."""
+    return [verify_with_public_key(r, public_key_b64) for r in responses]
+
+
 class Signer:
     """Simple signer for Ed25519 signatures."""
 
@@ -298,8 +357,8 @@ class Signer:
         descriptor (software vs hard-KMS) that a caller cannot forge.
         """
         timestamp = time.time()
-        resolved_nonce = nonce or str(uuid.uuid4())
-        signature_id = str(uuid.uuid4())
+        resolved_nonce = nonce or _uuid4_str()
+        signature_id = _uuid4_str()
         custody = self._custody_descriptor() if bind_custody else None
 
         # Create canonical representation.
@@ -359,15 +418,44 @@ class Signer:
             return False
         for include_sid in (True, False):
             try:
-                json_data = _canonical_json_from_response(
+                signed_bytes = _canonical_bytes_from_response(
                     response, include_signature_id=include_sid
                 )
-                self._public_key.verify(signature_bytes, json_data.encode("utf-8"))
+                self._public_key.verify(signature_bytes, signed_bytes)
                 return True
             except Exception:
                 continue
         return False
 
+    def verify_batch(
+        self, responses: list[SignedResponse], workers: Optional[int] = None
+    ) -> list[bool]:
+        """``verify`` for many responses, in order.
+
+        Serial by default. With ``workers`` > 1, large batches are split
+        into one chunk per worker and verified in a process pool (the same
+        scheme as ``ChainStore.verify``); a pool that fails to start falls
+        back to serial.
+        """
+        responses = list(responses)
+        if not workers or workers < 2 or len(responses) < _PARALLEL_VERIFY_MIN:
+            return [self.verify(r) for r in responses]
+
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        public_key = self.get_public_key()
+        size = -(-len(responses) // workers)
+        chunks = [responses[i : i + size] for i in range(0, len(responses), size)]
+        try:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                parts = pool.map(
+                    _verify_batch_chunk, [public_key] * len(chunks), chunks
+                )
+                return [ok for part in parts for ok in part]
+        except (BrokenProcessPool, OSError):
+            return [self.verify(r) for r in responses]
+
     def get_public_key(self) -> str:
         """Get the public key in base64 format."""
         public_bytes = self._public_key.public_bytes(
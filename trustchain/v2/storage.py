@@ -9,16 +9,20 @@ Directory layout:
     ├── objects/              # one JSON file per signed operation
     │   ├── op_0001.json
     │   └── ...
+    ├── objects.pack          # PackedStorage: packed records (optional)
+    ├── objects.idx           # PackedStorage: key → offset/length
     └── refs/
         └── sessions/         # per-session HEAD pointers
 """
 
 import json
+import mmap
+import os
 import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class Storage(ABC):
@@ -52,6 +56,10 @@ class Storage(ABC):
         """Get current number of stored items."""
         return 0
 
+    def keys(self) -> Optional[List[str]]:
+        """List stored keys without reading values (None if unsupported)."""
+        return None
+
 
 class MemoryStorage(Storage):
     """In-memory storage with LRU eviction and TTL support."""
@@ -128,6 +136,11 @@ class MemoryStorage(Storage):
         self._clean_expired()
         return len(self._data)
 
+    def keys(self) -> List[str]:
+        """List stored keys (oldest first)."""
+        self._clean_expired()
+        return list(self._data)
+
     def stats(self) -> Dict[str, Any]:
         """Get storage statistics."""
         self._clean_expired()
@@ -158,6 +171,7 @@ class FileStorage(Storage):
         self._objects_dir = self._root / "objects"
         self._objects_dir.mkdir(parents=True, exist_ok=True)
         self._metadata_path = self._root / "metadata.json"
+        self._pack_reader: Optional["PackedStorage"] = None
 
         # Ensure metadata exists
         if not self._metadata_path.exists():
@@ -184,7 +198,7 @@ class FileStorage(Storage):
         obj_path = self._objects_dir / f"{safe_key}.json"
 
         if not obj_path.exists():
-            return None
+            return self._get_packed(key)
 
         try:
             record = json.loads(obj_path.read_text(encoding="utf-8"))
@@ -225,7 +239,22 @@ class FileStorage(Storage):
 
     def size(self) -> int:
         """Count stored objects."""
-        return len(list(self._objects_dir.glob("*.json")))
+        # scandir: names only, no Path object per entry (740k+ files in prod)
+        with os.scandir(self._objects_dir) as entries:
+            return sum(
+                1
+                for e in entries
+                if e.name.endswith(".json") and not e.name.startswith(".")
+            )
+
+    def keys(self) -> List[str]:
+        """List stored keys (as sanitized filenames) without reading them."""
+        with os.scandir(self._objects_dir) as entries:
+            return [
+                e.name[:-5]
+                for e in entries
+                if e.name.endswith(".json") and not e.name.startswith(".")
+            ]
 
     def stats(self) -> Dict[str, Any]:
         """Get storage statistics."""
@@ -240,6 +269,14 @@ class FileStorage(Storage):
 
     # ── Internal helpers ──
 
+    def _get_packed(self, key: str) -> Optional[Any]:
+        """Look up a record that ``tc pack`` moved out of objects/."""
+        if self._pack_reader is None:
+            if not PackedStorage.has_pack(str(self._root)):
+                return None
+            self._pack_reader = PackedStorage(str(self._root))
+        return self._pack_reader.get(key)
+
     @staticmethod
     def _safe_key(key: str) -> str:
         """Sanitize key for use as filename."""
@@ -251,3 +288,222 @@ class FileStorage(Storage):
         self._metadata_path.write_text(
             json.dumps(data, indent=2, default=str), encoding="utf-8"
         )
+
+
+class PackedStorage(FileStorage):
+    """FileStorage that also reads from a memory-mapped pack (like git packfiles).
+
+    ``pack()`` moves loose ``objects/*.json`` records into two files:
+
+        {root_dir}/
+        ├── objects.pack      # compact JSON records, one per line
+        └── objects.idx       # "<key>\\t<offset>\\t<length>" per record
+
+    Reads check the pack index first and slice the record straight out of
+    the mmap, so scanning thousands of ops costs no open()/close() per op.
+    Writes still go to loose files (same as FileStorage); re-run ``pack()``
+    to fold them in. A record stored again after packing is served from its
+    loose file. Storages opened before another process packed the directory
+    find moved records by re-reading ``objects.idx`` on a miss.
+    """
+
+    PACK_FILE = "objects.pack"
+    INDEX_FILE = "objects.idx"
+
+    def __init__(self, root_dir: str = "~/.trustchain"):
+        super().__init__(root_dir)
+        self._pack_path = self._root / self.PACK_FILE
+        self._index_path = self._root / self.INDEX_FILE
+        self._index_stamp: Optional[Tuple[int, int]] = None
+        self._index: Dict[str, Tuple[int, int]] = self._read_index()
+        self._map: Optional[mmap.mmap] = None
+
+    @classmethod
+    def has_pack(cls, root_dir: str) -> bool:
+        """True if ``root_dir`` contains a pack index."""
+        return (Path(root_dir).expanduser() / cls.INDEX_FILE).is_file()
+
+    def store(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value as a loose file; it supersedes any packed copy."""
+        super().store(key, value, ttl)
+        if self._index.pop(self._safe_key(key), None) is not None:
+            self._write_index()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve a value from the pack, falling back to objects/."""
+        record = self._read_packed(self._safe_key(key))
+        if record is None:
+            return super().get(key)
+        return self._packed_value(record)
+
+    def delete(self, key: str) -> None:
+        """Delete a stored value (packed bytes stay until the next repack)."""
+        super().delete(key)
+        if self._index.pop(self._safe_key(key), None) is not None:
+            self._write_index()
+
+    def clear(self) -> None:
+        """Remove all stored objects, including the pack."""
+        super().clear()
+        self.close()
+        self._index = {}
+        self._pack_path.unlink(missing_ok=True)
+        self._index_path.unlink(missing_ok=True)
+
+    def list_all(self) -> List[Dict[str, Any]]:
+        """List all stored values (packed and loose), sorted by key."""
+        now = time.time()
+        records: Dict[str, Any] = {}
+        for safe_key in self._index:
+            record = self._read_packed(safe_key)
+            if record is not None:
+                records[safe_key] = record
+        for f in self._objects_dir.glob("*.json"):
+            if f.stem in records:  # packed copy wins, as in get()
+                continue
+            try:
+                records[f.stem] = json.loads(f.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                continue
+        return [
+            r["value"]
+            for _, r in sorted(records.items())
+            if "value" in r and not ("expires_at" in r and now > r["expires_at"])
+        ]
+
+    def size(self) -> int:
+        """Count stored objects (packed + loose, without double counting)."""
+        loose = sum(
+            1 for f in self._objects_dir.glob("*.json") if f.stem not in self._index
+        )
+        return len(self._index) + loose
+
+    def keys(self) -> List[str]:
+        """List stored keys (packed and loose, without double counting)."""
+        return list(dict.fromkeys([*self._index, *super().keys()]))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get storage statistics."""
+        stats = super().stats()
+        stats.update(backend="packed", size=self.size(), packed=len(self._index))
+        return stats
+
+    def pack(self) -> int:
+        """Append loose objects to the pack and delete them. Returns count."""
+        loose = sorted(self._objects_dir.glob("*.json"))
+        if not loose:
+            return 0
+
+        self.close()
+        added: List[Tuple[str, int, int]] = []
+        with self._pack_path.open("ab") as pack:
+            offset = pack.tell()
+            for f in loose:
+                try:
+                    record = json.loads(f.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, OSError):
+                    continue
+                blob = json.dumps(record, separators=(",", ":"), default=str)
+                data = blob.encode("utf-8")
+                pack.write(data + b"\n")
+                added.append((f.stem, offset, len(data)))
+                offset += len(data) + 1
+            pack.flush()
+            os.fsync(pack.fileno())
+
+        for safe_key, off, length in added:
+            self._index[safe_key] = (off, length)
+        self._write_index()
+        for f in loose:
+            if f.stem in self._index:
+                f.unlink(missing_ok=True)
+        return len(added)
+
+    def close(self) -> None:
+        """Release the pack mapping (reopened lazily on the next read)."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    # ── Internal helpers ──
+
+    def _get_packed(self, key: str) -> Optional[Any]:
+        # Neither in our index nor loose: another process may have packed
+        # it since, so reload the index (and remap) if objects.idx changed.
+        if self._index_stamp == self._stat_index():
+            return None
+        self.close()
+        self._index = self._read_index()
+        record = self._read_packed(self._safe_key(key))
+        return None if record is None else self._packed_value(record)
+
+    @staticmethod
+    def _packed_value(record: Dict[str, Any]) -> Optional[Any]:
+        if "expires_at" in record and time.time() > record["expires_at"]:
+            return None
+        return record.get("value")
+
+    def _stat_index(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self._index_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_packed(self, safe_key: str) -> Optional[Dict[str, Any]]:
+        entry = self._index.get(safe_key)
+        if entry is None:
+            return None
+        off, length = entry
+        view = self._pack_view()
+        if view is None or off + length > len(view):
+            return None
+        try:
+            record = json.loads(view[off : off + length])
+        except json.JSONDecodeError:
+            return None
+        return record if isinstance(record, dict) else None
+
+    def _pack_view(self) -> Optional[mmap.mmap]:
+        if self._map is None:
+            try:
+                with self._pack_path.open("rb") as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):  # missing or empty pack
+                return None
+        return self._map
+
+    def _read_index(self) -> Dict[str, Tuple[int, int]]:
+        index: Dict[str, Tuple[int, int]] = {}
+        self._index_stamp = self._stat_index()
+        try:
+            lines = self._index_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return index
+        for line in lines:
+            parts = line.split("\t")
+            if len(parts) == 3:
+                index[parts[0]] = (int(parts[1]), int(parts[2]))
+        return index
+
+    def _write_index(self) -> None:
+        tmp = self._index_path.with_suffix(".idx.tmp")
+        tmp.write_text(
+            "".join(f"{k}\t{off}\t{n}\n" for k, (off, n) in self._index.items()),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self._index_path)
+        self._index_stamp = self._stat_index()
+
+
+def open_file_storage(root_dir: str = "~/.trustchain") -> FileStorage:
+    """Open a file chain directory with the backend that can read all of it.
+
+    ``tc pack`` moves loose records into ``objects.pack``; a plain
+    FileStorage on such a directory would see only the loose remainder
+    (and number new ops from the wrong offset), so packed directories are
+    opened as PackedStorage.
+    """
+    if PackedStorage.has_pack(root_dir):
+        return PackedStorage(root_dir)
+    return FileStorage(root_dir)
@@ -148,6 +148,20 @@ class Rfc6962InclusionProof:
         )
 
 
+def inclusion_proof_from_dict(
+    data: dict,
+) -> InclusionProof | Rfc6962InclusionProof:
+    """Deserialize a proof produced by either scheme's ``to_dict``."""
+    if data.get("scheme") == MERKLE_SCHEME_RFC6962:
+        return Rfc6962InclusionProof.from_dict(data)
+    return InclusionProof.from_dict(data)
+
+
+def record_leaf_json(record: Dict[str, Any]) -> str:
+    """Canonical record bytes the Merkle leaf commits to (see ``append``)."""
+    return json.dumps(record, sort_keys=True, default=str)
+
+
 def content_op_id(
     tool: str, data: Any, signature: str, timestamp: str | None = None
 ) -> str:
@@ -292,7 +306,7 @@ class VerifiableChainStore:
                 record["certificate"] = certificate
 
             # 1. Append to chain.log (source of truth)
-            record_json = json.dumps(record, sort_keys=True, default=str)
+            record_json = record_leaf_json(record)
             self._append_to_log(record_json)
 
             # 2. Update Merkle tree (scheme-aware)
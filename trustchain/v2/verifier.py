@@ -17,7 +17,7 @@ try:
 except ImportError:
     HAS_CRYPTOGRAPHY = False
 
-from .signer import SignedResponse, _canonical_json_from_response
+from .signer import SignedResponse, _canonical_bytes_from_response, _load_public_key
 
 
 @dataclass
@@ -77,8 +77,7 @@ class TrustChainVerifier:
         self._max_future_skew_seconds = max_future_skew_seconds
 
         try:
-            public_bytes = base64.b64decode(public_key)
-            self._public_key = ed25519.Ed25519PublicKey.from_public_bytes(public_bytes)
+            self._public_key = _load_public_key(public_key)
         except Exception as e:
             raise ValueError(f"Invalid public key: {e}")
 
@@ -118,10 +117,10 @@ class TrustChainVerifier:
             last_error: Exception | None = None
             for include_sid in (True, False):
                 try:
-                    json_data = _canonical_json_from_response(
+                    signed_bytes = _canonical_bytes_from_response(
                         response, include_signature_id=include_sid
                     )
-                    self._public_key.verify(signature_bytes, json_data.encode("utf-8"))
+                    self._public_key.verify(signature_bytes, signed_bytes)
                     return VerificationResult(
                         valid=True,
                         tool_id=response.tool_id,
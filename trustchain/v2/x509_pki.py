@@ -39,12 +39,14 @@ Usage:
 """
 
 import base64
+import functools
 import json
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
@@ -93,6 +95,33 @@ def _is_leaf_certificate(cert: x509.Certificate) -> bool:
     return bool(not basic_constraints.ca and key_usage.digital_signature)
 
 
+def _parent_agent_serial(cert: x509.Certificate) -> Optional[int]:
+    """Return the B+ parent serial embedded in a sub-agent cert, if any."""
+    try:
+        parent_ext = cert.extensions.get_extension_for_oid(OID_PARENT_AGENT_SERIAL)
+    except x509.ExtensionNotFound:
+        return None  # Not a sub-agent, no parent to check
+    return int(parent_ext.value.value.decode("utf-8"))
+
+
+def build_trust_store(cas: Iterable["TrustChainCA"]) -> Dict[bytes, "TrustChainCA"]:
+    """Index CAs by DER-encoded subject name for issuer lookups.
+
+    Used with ``AgentCertificate.verify_with_trust_store``. CAs sharing a
+    subject name collide; the last one wins.
+    """
+    return {ca.certificate.subject.public_bytes(): ca for ca in cas}
+
+
+# Most recently issued agent certs whose parent serial a CA keeps in memory.
+_AGENT_PARENTS_MAX = 1024
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_pem_certificate(pem: str) -> x509.Certificate:
+    return x509.load_pem_x509_certificate(pem.encode("utf-8"))
+
+
 class TrustChainCA:
     """X.509 Certificate Authority for AI Agents.
 
@@ -115,6 +144,12 @@ class TrustChainCA:
         self._parent = parent
         self._revoked: Dict[int, Tuple[datetime, str]] = {}  # serial -> (time, reason)
         self._issued_serials: List[int] = []
+        # Agent certs issued by this instance: cert signature -> parent serial.
+        # Lets verify_cert skip the OID_PARENT_AGENT_SERIAL parse for its own
+        # certs; the signature (not the serial) identifies the exact cert.
+        # LRU-bounded: evicted certs fall back to parsing the extension.
+        self._agent_parents: OrderedDict[bytes, Optional[int]] = OrderedDict()
+        self._crl_pem_cache: Optional[Tuple[datetime, str]] = None  # (next_update, pem)
         self._next_serial = 1000
 
     # ── Factory methods ──
@@ -313,11 +348,61 @@ class TrustChainCA:
         Returns:
             AgentCertificate wrapping the X.509 cert
         """
-        if self._private_key is None:
-            raise ValueError(
-                "This CA certificate is held in verify-only mode (external private key); "
-                "cannot issue child certificates from the platform."
-            )
+        self._require_issuing_key()
+        return self._issue_agent_cert(
+            agent_id,
+            now=datetime.now(timezone.utc),
+            authority_key_id=x509.AuthorityKeyIdentifier.from_issuer_public_key(
+                self._certificate.public_key()
+            ),
+            model_hash=model_hash,
+            prompt_hash=prompt_hash,
+            tool_versions=tool_versions,
+            capabilities=capabilities,
+            validity_hours=validity_hours,
+            organization=organization,
+            parent_serial=parent_serial,
+            public_key_b64=public_key_b64,
+        )
+
+    def issue_agent_cert_batch(
+        self, specs: List[Dict[str, Any]]
+    ) -> List["AgentCertificate"]:
+        """Issue several agent certificates in one pass.
+
+        Each spec is a dict of ``issue_agent_cert`` keyword arguments
+        (``agent_id`` is required). The issuance timestamp and the
+        AuthorityKeyIdentifier are computed once and shared by the whole
+        batch, so all certs get the same ``not_before``.
+
+        Returns:
+            AgentCertificates in the same order as ``specs``.
+        """
+        self._require_issuing_key()
+        now = datetime.now(timezone.utc)
+        authority_key_id = x509.AuthorityKeyIdentifier.from_issuer_public_key(
+            self._certificate.public_key()
+        )
+        return [
+            self._issue_agent_cert(now=now, authority_key_id=authority_key_id, **spec)
+            for spec in specs
+        ]
+
+    def _issue_agent_cert(
+        self,
+        agent_id: str,
+        *,
+        now: datetime,
+        authority_key_id: x509.AuthorityKeyIdentifier,
+        model_hash: str = "",
+        prompt_hash: str = "",
+        tool_versions: Optional[Dict[str, str]] = None,
+        capabilities: Optional[List[str]] = None,
+        validity_hours: int = 1,
+        organization: str = "TrustChain",
+        parent_serial: Optional[int] = None,
+        public_key_b64: Optional[str] = None,
+    ) -> "AgentCertificate":
         agent_key: Optional[Ed25519PrivateKey]
         if public_key_b64:
             public_key_bytes = base64.b64decode(public_key_b64)
@@ -335,7 +420,6 @@ class TrustChainCA:
             ]
         )
 
-        now = datetime.now(timezone.utc)
         serial = self._next_serial_number()
         validity = timedelta(hours=validity_hours)
 
@@ -369,12 +453,7 @@ class TrustChainCA:
                 x509.SubjectKeyIdentifier.from_public_key(agent_public),
                 critical=False,
             )
-            .add_extension(
-                x509.AuthorityKeyIdentifier.from_issuer_public_key(
-                    self._certificate.public_key()
-                ),
-                critical=False,
-            )
+            .add_extension(authority_key_id, critical=False)
         )
 
         # Add custom AI OIDs as extensions
@@ -420,6 +499,9 @@ class TrustChainCA:
             )
 
         cert = builder.sign(self._private_key, algorithm=None)
+        self._agent_parents[cert.signature] = parent_serial
+        if len(self._agent_parents) > _AGENT_PARENTS_MAX:
+            self._agent_parents.popitem(last=False)  # least recently used
 
         return AgentCertificate(
             certificate=cert,
@@ -440,6 +522,7 @@ class TrustChainCA:
             datetime.now(timezone.utc),
             reason,
         )
+        self._crl_pem_cache = None
 
     def is_revoked(self, serial_number: int) -> bool:
         """Check if a serial number is in the revocation list."""
@@ -472,13 +555,24 @@ class TrustChainCA:
 
     @property
     def crl_pem(self) -> str:
-        """PEM-encoded CRL for distribution."""
+        """PEM-encoded CRL for distribution.
+
+        The signed CRL is reused until the revocation list changes or the
+        cached CRL reaches its ``next_update``.
+        """
+        cached = self._crl_pem_cache
+        if cached is not None and datetime.now(timezone.utc) < cached[0]:
+            return cached[1]
         crl = self.get_crl()
-        return crl.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+        pem = crl.public_bytes(serialization.Encoding.PEM).decode("utf-8")
+        self._crl_pem_cache = (crl.next_update_utc, pem)
+        return pem
 
     # ── Verification ──
 
-    def verify_cert(self, cert: x509.Certificate) -> "CertVerifyResult":
+    def verify_cert(
+        self, cert: x509.Certificate, *, now: Optional[datetime] = None
+    ) -> "CertVerifyResult":
         """Verify a certificate was issued by this CA.
 
         Checks:
@@ -487,6 +581,11 @@ class TrustChainCA:
         3. Certificate is not revoked (by serial number)
         4. B+ cascading: if cert has parent_cert_serial OID,
            verify that the parent is NOT revoked either
+
+        Args:
+            cert: Certificate to verify.
+            now: Validity reference time (UTC). Defaults to the current
+                time; bulk callers pass one snapshot for every cert.
         """
         errors = []
 
@@ -504,7 +603,8 @@ class TrustChainCA:
             errors.append("INVALID_SIGNATURE")
 
         # 2. Expiration check
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         if now < cert.not_valid_before_utc:
             errors.append("NOT_YET_VALID")
         if now > cert.not_valid_after_utc:
@@ -515,13 +615,14 @@ class TrustChainCA:
             errors.append("REVOKED")
 
         # 4. B+ cascading revocation: check parent agent
-        try:
-            parent_ext = cert.extensions.get_extension_for_oid(OID_PARENT_AGENT_SERIAL)
-            parent_serial = int(parent_ext.value.value.decode("utf-8"))
-            if self.is_revoked(parent_serial):
-                errors.append("PARENT_REVOKED")
-        except x509.ExtensionNotFound:
-            pass  # Not a sub-agent, no parent to check
+        signature = cert.signature
+        if signature in self._agent_parents:
+            self._agent_parents.move_to_end(signature)
+            parent_serial = self._agent_parents[signature]
+        else:
+            parent_serial = _parent_agent_serial(cert)
+        if parent_serial is not None and self.is_revoked(parent_serial):
+            errors.append("PARENT_REVOKED")
 
         return CertVerifyResult(
             valid=len(errors) == 0,
@@ -542,7 +643,7 @@ class TrustChainCA:
     def certificate(self) -> x509.Certificate:
         return self._certificate
 
-    @property
+    @functools.cached_property
     def certificate_pem(self) -> str:
         return self._certificate.public_bytes(serialization.Encoding.PEM).decode(
             "utf-8"
@@ -630,6 +731,13 @@ class TrustChainCA:
 
     # ── Internal ──
 
+    def _require_issuing_key(self) -> None:
+        if self._private_key is None:
+            raise ValueError(
+                "This CA certificate is held in verify-only mode (external private key); "
+                "cannot issue child certificates from the platform."
+            )
+
     def _next_serial_number(self) -> int:
         self._next_serial += 1
         self._issued_serials.append(self._next_serial)
@@ -683,13 +791,13 @@ class AgentCertificate:
 
     # ── Identity ──
 
-    @property
+    @functools.cached_property
     def agent_id(self) -> str:
         """Agent identifier (CN from subject)."""
         attrs = self._certificate.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
         return attrs[0].value if attrs else ""
 
-    @property
+    @functools.cached_property
     def organization(self) -> str:
         attrs = self._certificate.subject.get_attributes_for_oid(
             NameOID.ORGANIZATION_NAME
@@ -700,20 +808,23 @@ class AgentCertificate:
     def serial_number(self) -> int:
         return self._certificate.serial_number
 
-    @property
+    @functools.cached_property
     def fingerprint(self) -> str:
-        """SHA-256 fingerprint of the certificate (for display)."""
+        """SHA-256 fingerprint of the certificate (for display).
+
+        Certificates are immutable, so the digest is computed once per wrapper.
+        """
         digest = self._certificate.fingerprint(hashes.SHA256())
         return digest.hex()[:24]
 
     # ── AI-specific OIDs ──
 
-    @property
+    @functools.cached_property
     def model_hash(self) -> str:
         """SHA-256 hash of the AI model (from custom OID)."""
         return self._get_custom_oid_str(OID_MODEL_HASH)
 
-    @property
+    @functools.cached_property
     def prompt_hash(self) -> str:
         """SHA-256 hash of the system prompt (from custom OID)."""
         return self._get_custom_oid_str(OID_PROMPT_HASH)
@@ -734,7 +845,7 @@ class AgentCertificate:
             return json.loads(raw.decode("utf-8"))
         return []
 
-    @property
+    @functools.cached_property
     def parent_serial(self) -> Optional[int]:
         """Serial number of parent agent (None if top-level).
 
@@ -788,26 +899,34 @@ class AgentCertificate:
 
     # ── Verification ──
 
-    def verify_against(self, ca: TrustChainCA) -> CertVerifyResult:
+    def verify_against(
+        self, ca: TrustChainCA, *, now: Optional[datetime] = None
+    ) -> CertVerifyResult:
         """Verify this certificate against a specific CA."""
-        return ca.verify_cert(self._certificate)
+        return ca.verify_cert(self._certificate, now=now)
 
-    def verify_chain(self, chain: List[TrustChainCA]) -> bool:
+    def verify_chain(
+        self, chain: List[TrustChainCA], *, now: Optional[datetime] = None
+    ) -> bool:
         """Verify full certificate chain: self → intermediate → root.
 
         Args:
             chain: List of CAs from issuer to root (in order).
+            now: Validity reference time (UTC) applied to every link.
+                Defaults to the current time, read once per call.
 
         Returns:
             True if entire chain is valid.
         """
         if not chain:
             return False
+        if now is None:
+            now = datetime.now(timezone.utc)
 
         # Verify leaf against first CA
         if not _is_leaf_certificate(self._certificate):
             return False
-        result = chain[0].verify_cert(self._certificate)
+        result = chain[0].verify_cert(self._certificate, now=now)
         if not result.valid:
             return False
 
@@ -815,7 +934,7 @@ class AgentCertificate:
         for i in range(len(chain) - 1):
             if not _is_ca_certificate(chain[i].certificate):
                 return False
-            result = chain[i + 1].verify_cert(chain[i].certificate)
+            result = chain[i + 1].verify_cert(chain[i].certificate, now=now)
             if not result.valid:
                 return False
 
@@ -833,6 +952,30 @@ class AgentCertificate:
 
         return True
 
+    def verify_with_trust_store(
+        self,
+        trust_store: Dict[bytes, TrustChainCA],
+        *,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """Verify the chain by resolving issuers from a trust store.
+
+        ``trust_store`` maps subject DER to CA (see ``build_trust_store``) and
+        can be shared across many agent verifications; each link is a dict
+        hop on ``issuer`` instead of requiring a caller-ordered chain.
+        """
+        chain: List[TrustChainCA] = []
+        cert = self._certificate
+        while len(chain) <= len(trust_store):
+            ca = trust_store.get(cert.issuer.public_bytes())
+            if ca is None:
+                return False
+            chain.append(ca)
+            cert = ca.certificate
+            if cert.issuer == cert.subject:
+                return self.verify_chain(chain, now=now)
+        return False  # issuer cycle without a self-signed root
+
     # ── Signing (agent signs operations) ──
 
     def sign_data(self, data: bytes) -> bytes:
@@ -849,19 +992,50 @@ class AgentCertificate:
         except Exception:
             return False
 
+    def sign_many(self, data_iter: Iterable[bytes]) -> List[bytes]:
+        """Sign a batch of messages with the agent's private key.
+
+        Ed25519 has no batch primitive in ``cryptography``; this just keeps
+        the key lookup out of the per-message loop.
+        """
+        if not self._private_key:
+            raise ValueError("No private key — cannot sign")
+        sign = self._private_key.sign
+        return [sign(data) for data in data_iter]
+
+    def verify_many(self, pairs: Iterable[Tuple[bytes, bytes]]) -> List[bool]:
+        """Verify ``(data, signature)`` pairs against this agent's public key."""
+        verify = self._certificate.public_key().verify
+        results = []
+        for data, signature in pairs:
+            try:
+                verify(signature, data)
+                results.append(True)
+            except Exception:
+                results.append(False)
+        return results
+
     # ── Serialization ──
 
     def to_pem(self) -> str:
         """Export certificate as PEM string."""
+        return self._pem
+
+    @functools.cached_property
+    def _pem(self) -> str:
         return self._certificate.public_bytes(serialization.Encoding.PEM).decode(
             "utf-8"
         )
 
     @classmethod
     def from_pem(cls, pem: str) -> "AgentCertificate":
-        """Import certificate from PEM string."""
-        cert = x509.load_pem_x509_certificate(pem.encode("utf-8"))
-        return cls(certificate=cert)
+        """Import certificate from PEM string.
+
+        Parsed certificates are immutable and cached by PEM text, so agents
+        that present the same cert repeatedly skip the ASN.1 parse. Each call
+        still returns a fresh wrapper without a private key.
+        """
+        return cls(certificate=_load_pem_certificate(pem))
 
     def to_dict(self) -> Dict[str, Any]:
         """Summary dict for display/logging."""
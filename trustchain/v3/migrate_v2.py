@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any
 
 from trustchain.v2.chain_store import ChainStore
-from trustchain.v2.storage import FileStorage
+from trustchain.v2.storage import open_file_storage
 from trustchain.v3.objects import Blob, Commit, Ref, _canon_json, _sha256_hex
 
 
@@ -45,7 +45,7 @@ def migrate_v2_linear_to_v3(
     Raises ``ValueError`` if chain uses verifiable backend.
     """
     chain_root = chain_root.expanduser().resolve()
-    storage = FileStorage(str(chain_root))
+    storage = open_file_storage(str(chain_root))
     chain = ChainStore(storage, root_dir=str(chain_root))
     if getattr(chain, "_vlog", None):
         raise ValueError("migrate-v3 supports file ChainStore only (no verifiable log)")